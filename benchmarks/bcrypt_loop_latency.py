@@ -0,0 +1,96 @@
+"""로그인 폭주 중 이벤트 루프 지연 마이크로벤치마크.
+
+bcrypt 검증을 이벤트 루프에서 바로 실행할 때와 utils.auth의 스레드 풀(BcryptRunner)로
+넘길 때, 다른 요청을 대신하는 1ms 주기 작업이 얼마나 늦게 깨어나는지 비교한다.
+
+사용법:
+    python benchmarks/bcrypt_loop_latency.py [--logins 40] [--rounds 10]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 저장소 루트를 import 경로에 추가하고, 설정 로딩에 필요한 값은 없으면 더미로 채움
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+for key, value in {"DATABASE_URL": "sqlite+aiosqlite://", "SECRET_KEY": "bench", "GEMINI_API_KEY": "bench"}.items():
+    os.environ.setdefault(key, value)
+
+import bcrypt  # noqa: E402
+
+from config import settings  # noqa: E402
+from utils.auth import BcryptRunner, _checkpw  # noqa: E402
+
+TICK = 0.001  # 다른 요청을 대신하는 주기 작업 간격 (초)
+
+
+async def ticker(lags: list, stop: asyncio.Event):
+    """TICK마다 깨어나며 예정보다 늦은 시간(ms)을 기록"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK
+        await asyncio.sleep(TICK)
+        lags.append((loop.time() - expected) * 1000)
+
+
+async def inline_login(password: str, hashed: str):
+    # 변경 전: async 핸들러 안에서 동기 bcrypt 호출
+    _checkpw(password, hashed)
+
+
+async def run_burst(login, logins: int) -> dict:
+    lags = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0.05)  # 기준선 확보
+
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await tick_task
+    lags.sort()
+    return {
+        "elapsed_ms": elapsed * 1000,
+        "p50_lag_ms": statistics.median(lags),
+        "p99_lag_ms": lags[int(len(lags) * 0.99) - 1] if len(lags) > 1 else lags[0],
+        "max_lag_ms": lags[-1],
+    }
+
+
+async def main_async(logins: int, rounds: int):
+    password = "Test1234!"
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+    runner = BcryptRunner(settings.BCRYPT_MAX_WORKERS, queue_timeout=60)
+
+    results = {
+        "이벤트 루프에서 실행": await run_burst(lambda: inline_login(password, hashed), logins),
+        f"스레드 풀 ({settings.BCRYPT_MAX_WORKERS}개)": await run_burst(
+            lambda: runner.run(_checkpw, password, hashed), logins
+        ),
+    }
+    runner.shutdown()
+
+    print(f"로그인 {logins}건 동시 처리 (bcrypt rounds={rounds}), 1ms 주기 작업의 지연")
+    print(f"{'방식':<18} | {'전체(ms)':>9} | {'p50(ms)':>8} | {'p99(ms)':>8} | {'최대(ms)':>9}")
+    for name, r in results.items():
+        print(
+            f"{name:<18} | {r['elapsed_ms']:>9.1f} | {r['p50_lag_ms']:>8.2f} | "
+            f"{r['p99_lag_ms']:>8.2f} | {r['max_lag_ms']:>9.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bcrypt 이벤트 루프 지연 벤치마크")
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.logins, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""목록 응답 직렬화 마이크로벤치마크.
+
+FastAPI 기본 경로(행마다 검증된 모델 생성 -> jsonable_encoder -> json.dumps)와
+빠른 경로(검증 없는 모델 생성 -> TypeAdapter.dump_json)를 1천/1만 행 목록으로 비교한다.
+
+사용법:
+    python benchmarks/serialization_bench.py [--repeat 5]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# 저장소 루트를 import 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from schemas.post_schema import PostCardResponse, post_list_adapter  # noqa: E402
+
+
+def make_rows(n: int):
+    """카드 컬럼 조회 결과(Row) 대신 같은 속성을 가진 가짜 행"""
+    base = datetime(2025, 1, 1)
+    return [
+        SimpleNamespace(
+            id=i,
+            user_id=i % 50 + 1,
+            title=f"씨앗 {i}",
+            excerpt="잡담의 화원에 심은 이야기 " * 7,
+            img=None,
+            view_count=i * 3,
+            comment_count=i % 7,
+            like_count=i % 11,
+            user_name="정원사",
+            created_at=base + timedelta(minutes=i),
+            updated_at=base + timedelta(minutes=i, seconds=30),
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def default_path(rows) -> bytes:
+    # 변경 전: 생성자 검증 + FastAPI 기본 직렬화 (JSONResponse.render와 같은 옵션)
+    items = [
+        PostCardResponse(
+            id=r.id, user_id=r.user_id, title=r.title, excerpt=r.excerpt, img=r.img,
+            view_count=r.view_count, comment_count=r.comment_count, like_count=r.like_count,
+            user_name=r.user_name, created_at=r.created_at, updated_at=r.updated_at,
+        )
+        for r in rows
+    ]
+    return json.dumps(
+        jsonable_encoder(items), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def fast_path(rows) -> bytes:
+    items = [PostCardResponse.model_validate(r) for r in rows]
+    return post_list_adapter.dump_json(items)
+
+
+def measure(fn, rows, repeat: int) -> float:
+    """repeat번 실행 중 최솟값 (ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'행 수':>8} | {'기본 경로(ms)':>14} | {'빠른 경로(ms)':>14} | {'배속':>6}")
+    for n in (1_000, 10_000):
+        rows = make_rows(n)
+        # 두 경로가 같은 JSON을 만드는지 먼저 확인
+        assert json.loads(default_path(rows)) == json.loads(fast_path(rows))
+        default_ms = measure(default_path, rows, args.repeat)
+        fast_ms = measure(fast_path, rows, args.repeat)
+        print(f"{n:>8} | {default_ms:>14.1f} | {fast_ms:>14.1f} | {default_ms / fast_ms:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
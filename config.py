@@ -22,6 +22,63 @@ class Settings(BaseSettings):
         'image/webp'
     }
     
+    # 페이지네이션 설정
+    POSTS_PAGE_SIZE: int = 20
+    MAX_PAGE_SIZE: int = 100
+    MAX_BATCH_IDS: int = 50  # GET /posts/batch 한 번에 조회할 수 있는 최대 id 수
+    USERS_PAGE_SIZE: int = 20
+
+    # 조회수 write-behind 버퍼 설정
+    VIEW_COUNT_FLUSH_INTERVAL: float = 5.0  # 초
+    VIEW_COUNT_MAX_PENDING: int = 1000  # 이만큼 쌓이면 주기와 무관하게 즉시 flush
+
+    # 게시글 응답 캐시 설정
+    POST_CACHE_TTL: float = 30.0  # 초
+    POST_CACHE_MAXSIZE: int = 1024  # 상세 응답 최대 개수
+    POST_LIST_CACHE_MAXSIZE: int = 256  # 목록 응답 최대 개수
+
+    # 게시글/댓글 작성자 정보(id, name, img) 캐시 설정 (회원정보 수정/탈퇴 시 무효화)
+    AUTHOR_CACHE_TTL: float = 60.0  # 초 (다른 워커의 수정은 이 시간 뒤에 반영)
+    AUTHOR_CACHE_MAXSIZE: int = 10000
+
+    # 사용자 목록 첫 페이지 캐시 설정 (가입/수정/탈퇴 시 무효화, 다른 워커의 변경은 TTL 후 반영)
+    USER_LIST_CACHE_TTL: float = 10.0  # 초
+    USER_LIST_CACHE_MAXSIZE: int = 128
+
+    # 조건부 GET 응답의 Cache-Control
+    ANON_CACHE_CONTROL: str = "public, max-age=0, must-revalidate"
+    AUTH_CACHE_CONTROL: str = "private, no-cache"
+
+    # 로그인 토큰 설정
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14  # 갱신할 때마다 새 토큰으로 교체(rotation)
+
+    # bcrypt 해싱/검증 스레드 풀 설정 (이벤트 루프를 막지 않도록 별도 스레드에서 실행)
+    BCRYPT_MAX_WORKERS: int = 4  # 동시에 실행할 bcrypt 작업 수
+    BCRYPT_QUEUE_TIMEOUT: float = 2.0  # 대기열에서 이 시간(초)을 넘기면 503
+
+    # 인증 캐시 설정 (토큰 -> user_id, user_id -> 활성 여부)
+    # 다른 워커 프로세스의 탈퇴는 최대 AUTH_CACHE_TTL초 늦게 반영됨
+    AUTH_CACHE_TTL: float = 60.0  # 초
+    AUTH_CACHE_MAXSIZE: int = 10000
+
+    # 이메일/닉네임 중복 확인용 블룸 필터 설정
+    AVAILABILITY_BLOOM_CAPACITY: int = 100_000  # 예상 사용자 수 (넘으면 오탐률이 올라감)
+    AVAILABILITY_BLOOM_ERROR_RATE: float = 0.01
+    AVAILABILITY_REBUILD_INTERVAL: float = 300.0  # 다른 워커의 가입/변경을 반영하는 재구축 주기 (초)
+
+    # 인기 게시글(hot) 점수 설정
+    HOT_VIEW_WEIGHT: float = 0.1
+    HOT_LIKE_WEIGHT: float = 2.0
+    HOT_COMMENT_WEIGHT: float = 3.0
+    HOT_GRAVITY: float = 1.5  # 클수록 오래된 게시글의 점수가 빨리 떨어짐
+    HOT_WINDOW_HOURS: int = 24 * 7  # 이보다 오래된 게시글은 hot 피드에서 제외 (점수 0)
+    HOT_DECAY_INTERVAL: float = 600.0  # 감쇠 작업 주기 (초)
+
+    # 관리자 API(/admin)를 사용할 수 있는 사용자 id (환경변수는 JSON 배열, 예: [1, 2])
+    ADMIN_USER_IDS: set = set()
+    EXPORT_BATCH_SIZE: int = 500  # 내보내기 시 서버 측 커서로 한 번에 가져올 행 수
+
     DATABASE_URL: str
     SECRET_KEY: str
     DEBUG: bool = False
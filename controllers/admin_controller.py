@@ -0,0 +1,55 @@
+# controllers/admin_controller.py
+"""관리자 전용 비즈니스 로직."""
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from models import comment_model, post_model
+
+
+# 게시글/댓글 NDJSON 내보내기
+async def export_ndjson(
+    db: AsyncSession,
+    after_post_id: int = 0,
+    after_comment_id: int = 0,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """게시글, 댓글 순으로 한 줄에 한 행씩 NDJSON을 생성.
+
+    서버 측 커서로 EXPORT_BATCH_SIZE개씩 읽어 바로 내보내므로 전체 크기와 무관하게 메모리 사용량이 일정하다.
+    중단되면 마지막으로 받은 게시글/댓글 id를 after_post_id/after_comment_id로 넘겨 이어받을 수 있다.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31: gzip 포맷
+
+    # 서버 측 커서는 연결 하나에서 동시에 하나만 열 수 있으므로 (MySQL unbuffered 결과)
+    # 게시글 스트림을 끝까지 읽은 뒤에 댓글 스트림을 연다
+    streams = (
+        ("post", lambda: post_model.stream_posts(db, after_post_id, settings.EXPORT_BATCH_SIZE)),
+        ("comment", lambda: comment_model.stream_comments(db, after_comment_id, settings.EXPORT_BATCH_SIZE)),
+    )
+    for record_type, open_stream in streams:
+        result = await open_stream()
+        async for rows in result.partitions():
+            chunk = "".join(_ndjson_line(record_type, row._mapping) for row in rows).encode("utf-8")
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+
+    if compressor:
+        yield compressor.flush()
+
+
+def _ndjson_line(record_type: str, values) -> str:
+    record = {"type": record_type, **values}
+    return json.dumps(record, ensure_ascii=False, default=_json_default) + "\n"
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__}은(는) JSON으로 변환할 수 없습니다")
@@ -1,15 +1,18 @@
 # controllers/comment_controller.py
 """댓글 관련 비즈니스 로직."""
+from typing import Optional
+
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 
 from models import comment_model
 from models.comment_model import Comment
 from models.post_model import Post
-from schemas.comment_schema import CommentCreate, CommentResponse, CommentUpdate
+from schemas.comment_schema import CommentCreate, CommentListResponse, CommentResponse, CommentUpdate
+from utils.author_loader import get_author_loader
 from utils.comment_validators import validate_comment_owner
+from utils.pagination import decode_cursor, split_page
+from utils.post_cache import invalidate_post
 
 
 # 특정 게시글의 댓글 목록 
@@ -17,7 +20,24 @@ async def get_comments_by_post(post: Post, db: AsyncSession, skip: int = 0, limi
     comments = await comment_model.get_comments_by_post_id(
         db, post.id, skip, limit, excluded_deleted=True
     )
-    return [CommentResponse.model_validate(c) for c in comments]
+    authors = await get_author_loader(db).load_many(c.user_id for c in comments)
+    return [CommentResponse.model_validate(c, authors.get(c.user_id)) for c in comments]
+
+
+
+# 특정 게시글의 댓글 목록 (커서 페이지네이션)
+# 전체 개수는 COUNT(*) 대신 게시글의 comment_count 카운터를 첫 페이지에만 담음
+async def get_comments_page(post: Post, db: AsyncSession, cursor: Optional[str], limit: int):
+    keyset = decode_cursor(cursor) if cursor else None
+    comments = await comment_model.get_comments_page(db, post.id, limit, keyset)
+    comments, next_cursor = split_page(comments, limit)
+
+    authors = await get_author_loader(db).load_many(c.user_id for c in comments)
+    return CommentListResponse(
+        items=[CommentResponse.model_validate(c, authors.get(c.user_id)) for c in comments],
+        next_cursor=next_cursor,
+        total=post.comment_count if not cursor else None,
+    )
 
 
 # 댓글 작성
@@ -26,14 +46,9 @@ async def create_comment(data: CommentCreate, post: Post, db: AsyncSession, user
     new_cmt = await comment_model.add_comment(db, comment_data, post.id, user_id)
 
     await db.commit()
-    # refresh 후 relationship이 lazy 상태로 돌아가므로 다시 eager load
-    result = await db.execute(
-        select(Comment)
-        .where(Comment.id == new_cmt.id)
-        .options(selectinload(Comment.user))
-    )
-    new_cmt = result.scalar_one()
-    return CommentResponse.model_validate(new_cmt)
+    invalidate_post(post.id)  # comment_count 변경
+    # expire_on_commit=False이고 서버 기본값은 INSERT 시 받아왔으므로 재조회 없이 응답 생성
+    return CommentResponse.model_validate(new_cmt, await get_author_loader(db).load(user_id))
 
 
 # 댓글 수정
@@ -54,14 +69,7 @@ async def update_comment(comment: Comment, data: CommentUpdate, db: AsyncSession
         )
     try:
         await db.commit()
-        # refresh 후 relationship이 lazy 상태로 돌아가므로 다시 eager load
-        result = await db.execute(
-            select(Comment)
-            .where(Comment.id == updated_comment.id)
-            .options(selectinload(Comment.user))
-        )
-        updated_comment = result.scalar_one()
-        return CommentResponse.model_validate(updated_comment)
+        return CommentResponse.model_validate(updated_comment, await get_author_loader(db).load(user_id))
     except HTTPException:
         await db.rollback()
         raise
@@ -81,6 +89,7 @@ async def delete_comment(post: Post, comment: Comment, db: AsyncSession, user_id
     try:
         await comment_model.delete_comment(db, comment.id)
         await db.commit()
+        invalidate_post(post.id)  # comment_count 변경
         return {"message": "댓글이 성공적으로 삭제되었습니다"}
         
     except HTTPException:
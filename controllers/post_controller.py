@@ -1,35 +1,202 @@
 """게시글 관련 비즈니스 로직."""
+from typing import List, Optional
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 
-from models import post_model, post_like
+from models import comment_model, post_model, post_like, search_model
 from models.post_model import Post
-from models.post_like import get_like
-from schemas.post_schema import PostCreate, PostResponse, PostUpdate
-from utils.post_validators import validate_post_owner
+from config import settings
+from schemas.comment_schema import CommentListResponse, CommentResponse
+from schemas.post_schema import (
+    LikeCountResponse, LikeListResponse, LikerResponse, LikeResponse, LikeStateResponse, PostBatchItem, PostBatchResponse, PostCreate, PostListResponse,
+    PostCardResponse, PostPageResponse, PostResponse, PostUpdate,
+)
+from utils.author_loader import get_author_loader
+from utils.pagination import decode_cursor, encode_cursor, split_page
+from utils.post_cache import invalidate_post, post_detail_cache, post_list_cache
+from utils.post_validators import ensure_post_available, validate_post_owner
+from utils.view_counter import view_counter
 
 
 # 게시글 목록 조회
 async def get_posts(db: AsyncSession):
+    cached = post_list_cache.get(("all",))
+    if cached is not None:
+        return cached
+
     posts = await post_model.get_posts(db)
-    return [PostResponse.model_validate(p) for p in posts]
+    response = [PostCardResponse.model_validate(p) for p in posts]
+    post_list_cache.set(("all",), response)
+    return response
+
+
+# 게시글 목록 조회 (커서 페이지네이션)
+async def get_posts_page(db: AsyncSession, cursor: Optional[str], limit: int):
+    cache_key = ("page", cursor, limit)
+    cached = post_list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    keyset = decode_cursor(cursor) if cursor else None
+    posts = await post_model.get_posts_page(db, limit, keyset)
+    posts, next_cursor = split_page(posts, limit)
+
+    response = PostListResponse(
+        items=[PostCardResponse.model_validate(p) for p in posts],
+        next_cursor=next_cursor,
+    )
+    post_list_cache.set(cache_key, response)
+    return response
+
+
+# 인기 게시글 목록 조회 (hot_score 내림차순 커서 페이지네이션)
+# 점수는 요청 사이에도 갱신되므로 페이지 경계에서 순서가 조금 바뀔 수 있음
+async def get_hot_posts_page(db: AsyncSession, cursor: Optional[str], limit: int):
+    cache_key = ("hot", cursor, limit)
+    cached = post_list_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
+    keyset = decode_cursor(cursor, key_type=float) if cursor else None
+    posts = await post_model.get_hot_posts_page(db, limit, keyset)
+    posts, next_cursor = split_page(posts, limit, "hot_score")
+
+    response = PostListResponse(
+        items=[PostCardResponse.model_validate(p) for p in posts],
+        next_cursor=next_cursor,
+    )
+    post_list_cache.set(cache_key, response)
+    return response
+
+
+# 게시글 검색 (BM25 점수순 커서 페이지네이션)
+async def search_posts(db: AsyncSession, q: str, cursor: Optional[str], limit: int):
+    keyset = decode_cursor(cursor, key_type=float) if cursor else None
+    ranked, has_more = await search_model.search_post_ids(db, q, limit, keyset)
+
+    posts = await post_model.get_post_cards_by_ids(db, [post_id for post_id, _ in ranked]) if ranked else []
+    posts_by_id = {p.id: p for p in posts}
+
+    next_cursor = None
+    if has_more:
+        last_id, last_score = ranked[-1]
+        next_cursor = encode_cursor(last_score, last_id)
+
+    return PostListResponse(
+        items=[PostCardResponse.model_validate(posts_by_id[post_id]) for post_id, _ in ranked if post_id in posts_by_id],
+        next_cursor=next_cursor,
+    )
 
-async def get_post(post: Post, db: AsyncSession, increment_view: bool = True):
+
+async def get_post(post_id: int, db: AsyncSession, increment_view: bool = True):
+    cached = post_detail_cache.get(post_id)
+    if cached is None:
+        token = view_counter.read_token()
+        post = ensure_post_available(await post_model.get_post_by_id(db, post_id))
+        cached = PostResponse.model_validate(post, await get_author_loader(db).load(post.user_id))
+        if view_counter.is_consistent(token):
+            post_detail_cache.set(post_id, cached)
+
+    # 조회수는 버퍼에만 기록하고 주기적으로 DB에 반영 (요청 경로는 읽기 전용)
     if increment_view:
-        post.view_count += 1
-        await db.commit()
-        # refresh 후 relationship이 lazy 상태로 돌아가므로 다시 eager load
-        result = await db.execute(
-            select(Post)
-            .where(Post.id == post.id)
-            .options(selectinload(Post.comments), selectinload(Post.user))
+        view_counter.record(post_id)
+    return cached.model_copy(
+        update={"view_count": cached.view_count + view_counter.pending(post_id)}
+    )
+
+
+# 로그인 사용자의 좋아요 여부 표시 (페이지 전체를 IN 쿼리 한 번으로 확인)
+# 캐시된 응답은 모든 사용자가 공유하므로 복사본에만 표시
+async def mark_liked_by_me(db: AsyncSession, user_id: int, posts: List[PostCardResponse]) -> List[PostCardResponse]:
+    liked = await post_like.get_liked_post_ids(db, user_id, [p.id for p in posts])
+    return [p.model_copy(update={"liked_by_me": p.id in liked}) for p in posts]
+
+
+# 게시글 상세 화면 (게시글 + 첫 댓글 페이지 + 좋아요 상태를 한 세션에서 조회)
+async def get_post_page(post_id: int, db: AsyncSession, user_id: Optional[int], comment_limit: int):
+    # 없거나 삭제된 게시글(404/410)이면 댓글을 조회하지 않도록 먼저 확인
+    # 세션의 identity map은 약한 참조이므로 변수로 붙잡아 두어야 아래 get_post가 다시 조회하지 않음
+    loaded_post = None
+    if post_detail_cache.get(post_id) is None:
+        loaded_post = ensure_post_available(await post_model.get_post_by_id(db, post_id))
+    comments = await comment_model.get_comments_page(db, post_id, comment_limit)
+    comments, next_cursor = split_page(comments, comment_limit)
+
+    # 댓글 작성자를 미리 등록해 두면 게시글 작성자와 함께 쿼리 한 번으로 조회됨
+    loader = get_author_loader(db)
+    loader.prime(c.user_id for c in comments)
+    post = await get_post(post_id, db)
+
+    liked_by_me = await post_like.is_liked(db, post_id, user_id) if user_id is not None else False
+    authors = await loader.load_many(c.user_id for c in comments)
+
+    return PostPageResponse(
+        post=post.model_copy(update={"liked_by_me": liked_by_me}) if user_id is not None else post,
+        comments=CommentListResponse(
+            items=[CommentResponse.model_validate(c, authors.get(c.user_id)) for c in comments],
+            next_cursor=next_cursor,
+            total=post.comment_count,
+        ),
+        like_count=post.like_count,
+        liked_by_me=liked_by_me,
+    )
+
+
+# 게시글 일괄 조회 (조회수 증가 없음)
+async def get_posts_batch(db: AsyncSession, ids: str, user_id: Optional[int] = None):
+    try:
+        post_ids = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        post_ids = None
+    if not post_ids or any(i < 1 for i in post_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 게시물 ID 목록입니다"
+        )
+    if len(post_ids) > settings.MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.MAX_BATCH_IDS}개까지 조회할 수 있습니다"
         )
-        post = result.scalar_one()
-    return PostResponse.model_validate(post)
+
+    # 상세 캐시에 있는 게시글은 그대로 쓰고, 나머지만 IN 쿼리 한 번으로 조회
+    found = {}
+    missing = []
+    for post_id in post_ids:
+        cached = post_detail_cache.get(post_id)
+        if cached is not None:
+            found[post_id] = cached
+        else:
+            missing.append(post_id)
+
+    deleted = set()
+    if missing:
+        token = view_counter.read_token()
+        posts = await post_model.get_posts_by_ids(db, missing)
+        authors = await get_author_loader(db).load_many(p.user_id for p in posts if not p.is_deleted)
+        for post in posts:
+            if post.is_deleted:
+                deleted.add(post.id)
+                continue
+            found[post.id] = PostResponse.model_validate(post, authors.get(post.user_id))
+            if view_counter.is_consistent(token):
+                post_detail_cache.set(post.id, found[post.id])
+
+    liked = await post_like.get_liked_post_ids(db, user_id, list(found)) if user_id is not None else None
+
+    items = []
+    for post_id in post_ids:
+        if post_id in found:
+            cached = found[post_id]
+            update = {"view_count": cached.view_count + view_counter.pending(post_id)}
+            if liked is not None:
+                update["liked_by_me"] = post_id in liked
+            post = cached.model_copy(update=update)
+            items.append(PostBatchItem(id=post_id, status="ok", post=post))
+        else:
+            items.append(PostBatchItem(id=post_id, status="deleted" if post_id in deleted else "not_found"))
+    return PostBatchResponse(items=items)
 
 
 # 게시물 작성
@@ -38,14 +205,9 @@ async def create_post(data: PostCreate, db: AsyncSession, user_id: int):
     new_post = await post_model.create_post(db, post_data, user_id)
     
     await db.commit()
-    # refresh 후 relationship이 lazy 상태로 돌아가므로 다시 eager load
-    result = await db.execute(
-        select(Post)
-        .where(Post.id == new_post.id)
-        .options(selectinload(Post.comments), selectinload(Post.user))
-    )
-    new_post = result.scalar_one()
-    return PostResponse.model_validate(new_post)
+    invalidate_post(new_post.id)
+    # expire_on_commit=False이고 서버 기본값은 INSERT 시 받아왔으므로 재조회 없이 응답 생성
+    return PostResponse.model_validate(new_post, await get_author_loader(db).load(user_id))
 
 
 # 게시물 수정
@@ -68,14 +230,8 @@ async def update_post(post: Post, data: PostUpdate, db: AsyncSession, user_id: i
 
     try:
         await db.commit()
-        # refresh 후 relationship이 lazy 상태로 돌아가므로 다시 eager load
-        result = await db.execute(
-            select(Post)
-            .where(Post.id == updated_post.id)
-            .options(selectinload(Post.comments), selectinload(Post.user))
-        )
-        updated_post = result.scalar_one()
-        return PostResponse.model_validate(updated_post)
+        invalidate_post(updated_post.id)
+        return PostResponse.model_validate(updated_post, await get_author_loader(db).load(updated_post.user_id))
     except HTTPException:
         await db.rollback()
         raise
@@ -93,6 +249,7 @@ async def delete_post(post: Post, db: AsyncSession, user_id: int):
     try:
         await post_model.delete_post(db, post.id)
         await db.commit()
+        invalidate_post(post.id)
         return {"message": "게시물이 성공적으로 삭제되었습니다"}
         
     except HTTPException:
@@ -107,39 +264,63 @@ async def delete_post(post: Post, db: AsyncSession, user_id: int):
 
 
 ## 좋아요 관련
+# 조회 후 쓰기 대신 INSERT/DELETE 한 번의 영향 행 수로 결과를 판단
 async def like_post(post: Post, user_id: int, db: AsyncSession):
-    like = await get_like(db, post.id, user_id)
-    if like:
+    new_like = await post_like.create_like(db, post.id, user_id)
+    if new_like is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 좋아요를 눌렀습니다"
         )
-        
-    new_like = await post_like.create_like(db, post.id, user_id)
+
     await db.commit()
-    await db.refresh(new_like)
-    return new_like
+    invalidate_post(post.id)
+    return LikeResponse(**new_like)
 
 
 async def unlike_post(post: Post, user_id: int, db: AsyncSession):
-    like = await get_like(db, post.id, user_id)
-    if not like:
+    deleted = await post_like.delete_like(db, post.id, user_id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이 게시물에 좋아요를 누르지 않았습니다"
         )
-        
-    deleted_like = await post_like.delete_like(db, post.id, user_id)
-    if not deleted_like:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="좋아요 취소에 실패했습니다"
-        )
-        
+
     await db.commit()
+    invalidate_post(post.id)
     return {"message": "좋아요가 성공적으로 취소되었습니다"}
 
 
+# 좋아요 상태 지정 (멱등: 같은 요청을 반복해도 결과가 같음)
+async def set_like(post: Post, liked: bool, user_id: int, db: AsyncSession):
+    if liked:
+        changed = await post_like.create_like(db, post.id, user_id) is not None
+    else:
+        changed = await post_like.delete_like(db, post.id, user_id)
+
+    if changed:
+        await db.commit()
+        invalidate_post(post.id)
+    return LikeStateResponse(post_id=post.id, liked=liked, changed=changed)
+
+
 async def get_post_likes(post: Post, db: AsyncSession):
     likes = await post_like.get_post_likes(db, post.id)
-    return likes
\ No newline at end of file
+    return likes
+
+
+# 좋아요 수만 조회 (비정규화 카운터 사용, 좋아요 행을 읽지 않음)
+def get_post_like_count(post) -> LikeCountResponse:
+    return LikeCountResponse(post_id=post.id, like_count=post.like_count)
+
+
+# 좋아요 목록 조회 (커서 페이지네이션)
+async def get_post_likes_page(post, db: AsyncSession, cursor: Optional[str], limit: int, with_users: bool):
+    keyset = decode_cursor(cursor) if cursor else None
+    rows = await post_like.get_post_likes_page(db, post.id, limit, keyset, with_users)
+    rows, next_cursor = split_page(rows, limit)
+
+    return LikeListResponse(
+        items=[LikerResponse(**row._mapping) for row in rows],
+        next_cursor=next_cursor,
+    )
\ No newline at end of file
@@ -1,35 +1,62 @@
 """사용자 관련 비즈니스 로직."""
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import user_model
+from config import settings
+from models import session_model, user_model
 from typing import Optional
 from schemas.user_schema import (
     PasswordUpdate,
     UserAuthResponse,
     UserCreateRequest,
+    UserListResponse,
     UserLogin,
     UserResponse,
+    UserSummaryResponse,
 )
-from utils.auth import create_access_token, hash_password, verify_password
+from utils.auth import (
+    create_access_token,
+    create_refresh_token,
+    hash_password,
+    hash_refresh_token,
+    verify_password,
+)
+from utils.auth_cache import invalidate_user
+from utils.author_loader import invalidate_author
+from utils.availability import availability_filter
 from utils.img_validators import delete_profile_image
+from utils.pagination import decode_cursor, split_page
+from utils.user_cache import invalidate_user_list, user_list_cache
 
 
 logger = logging.getLogger(__name__)
 
+# 리프레시 토큰 쿠키는 갱신/로그아웃 API에만 전송되도록 경로를 제한
+REFRESH_COOKIE_PATH = "/users"
 
-# 사용자 목록 조회
-async def get_users(db: AsyncSession):
-    users = await user_model.get_users(db)
-    if not users:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다"
-        )
-    return [UserResponse.model_validate(u) for u in users]
+
+# 사용자 목록 조회 (이름순 커서 페이지네이션, 첫 페이지만 캐시)
+async def get_users(db: AsyncSession, cursor: Optional[str], limit: int, name_prefix: Optional[str] = None):
+    cache_key = (name_prefix, limit)
+    if cursor is None:
+        cached = user_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    keyset = decode_cursor(cursor, key_type=str) if cursor else None
+    users = await user_model.get_users_page(db, limit, keyset, name_prefix)
+    users, next_cursor = split_page(users, limit, "name")
+
+    response = UserListResponse(
+        items=[UserSummaryResponse(id=u.id, name=u.name, profile_image=u.img) for u in users],
+        next_cursor=next_cursor,
+    )
+    if cursor is None:
+        user_list_cache.set(cache_key, response)
+    return response
 
 
 # 특정 사용자 조회
@@ -48,16 +75,20 @@ async def get_user(user_id: int, db: AsyncSession):
         )
 
 
-# 이메일 중복 확인
+# 이메일 중복 확인 (블룸 필터가 '없음'이면 DB 조회 없이 응답)
 async def check_email_exists(email: str, db: AsyncSession):
-    existing_user = await user_model.get_user_by_email(db, email)
-    return {"exists": existing_user is not None}
+    if not availability_filter.might_have_email(email):
+        return {"exists": False}
+    existing_id = await user_model.get_user_id_by_email(db, email)
+    return {"exists": existing_id is not None}
 
 
-# 이름 중복 확인
+# 이름 중복 확인 (블룸 필터가 '없음'이면 DB 조회 없이 응답)
 async def check_name_exists(name: str, db: AsyncSession):
-    existing_user = await user_model.get_user_by_name(db, name)
-    return {"exists": existing_user is not None}
+    if not availability_filter.might_have_name(name):
+        return {"exists": False}
+    existing_id = await user_model.get_user_id_by_name(db, name)
+    return {"exists": existing_id is not None}
 
 # 사용자 생성 - 회원가입
 async def create_user(user_data: UserCreateRequest, db: AsyncSession, img_path: Optional[str] = None):
@@ -73,7 +104,7 @@ async def create_user(user_data: UserCreateRequest, db: AsyncSession, img_path:
                 )
     
         # 비밀번호 암호화
-        hashed_pwd = hash_password(user_data.password, salt_rounds)
+        hashed_pwd = await hash_password(user_data.password, salt_rounds)
     
         # DB에 저장 (아직 commit 안 함)
         new_user = await user_model.create_user(db, user_data, hashed_pwd, img_path)
@@ -81,6 +112,8 @@ async def create_user(user_data: UserCreateRequest, db: AsyncSession, img_path:
         # 모든 작업이 성공하면 commit
         await db.commit()
         await db.refresh(new_user)
+        availability_filter.add(email=new_user.email, name=new_user.name)
+        invalidate_user_list()
         
         return UserAuthResponse(
             id=new_user.id,
@@ -115,7 +148,7 @@ async def login(user_input: UserLogin, response: Response, db: AsyncSession):
             )
     
         # 3. 비밀번호 검증
-        if not verify_password(user_input.password, user.password):
+        if not await verify_password(user_input.password, user.password):
             # logger.warning(f"로그인 실패: 잘못된 비밀번호 - {user_input.email}")
             # 보안: 같은 메시지 사용
             raise HTTPException(
@@ -124,22 +157,9 @@ async def login(user_input: UserLogin, response: Response, db: AsyncSession):
                 headers={"WWW-Authenticate": "Bearer"}
             )
     
-        # 4. JWT 토큰 생성
-        access_token = create_access_token(
-            data={"sub": str(user.id),
-                  "email" : user.email,
-                  "name" : user.name
-                 }, 
-            expires_delta=timedelta(minutes=15)
-        )
-        response.set_cookie(
-            key="access_token",
-            value=access_token,
-            httponly=True,       # JavaScript 접근 차단
-            secure=False,        # 개발 환경: False, 프로덕션: True (HTTPS)
-            samesite="lax",      # CSRF 방어
-            max_age=900          # 15분 (초 단위)
-        )
+        # 4. 액세스 토큰 + 리프레시 토큰(세션) 발급
+        await _start_session(db, response, user.id, user.email, user.name)
+        await db.commit()
         # # 5. 로그인 성공 로그
         #     logger.info(f"로그인 성공: {user.email}")
     
@@ -162,6 +182,86 @@ async def login(user_input: UserLogin, response: Response, db: AsyncSession):
             detail="로그인 처리 중 오류가 발생했습니다"
         )
 
+# 액세스 토큰 갱신 (리프레시 토큰 rotation)
+async def refresh_tokens(refresh_token: Optional[str], response: Response, db: AsyncSession):
+    expired_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="로그인이 만료되었습니다. 다시 로그인해주세요",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    if not refresh_token:
+        raise expired_exception
+
+    now = _utcnow()
+    # 세션 조회는 unique 인덱스 1회, bcrypt 검증 없음
+    session = await session_model.get_session_with_user(db, hash_refresh_token(refresh_token))
+    if session is None or session.is_deleted or session.expires_at <= now:
+        raise expired_exception
+
+    if session.revoked_at is not None:
+        # 이미 교체된 토큰이 다시 쓰였으면 탈취로 보고 해당 사용자의 모든 세션을 폐기
+        logger.warning("폐기된 리프레시 토큰 재사용 감지: user_id=%s", session.user_id)
+        await session_model.revoke_user_sessions(db, session.user_id, now)
+        await db.commit()
+        raise expired_exception
+
+    if not await session_model.revoke_session(db, session.id, now):
+        # 같은 토큰으로 동시에 갱신한 다른 요청이 먼저 교체함
+        await db.rollback()
+        raise expired_exception
+
+    await _start_session(db, response, session.user_id, session.email, session.name)
+    await db.commit()
+    return {"message": "로그인이 연장되었습니다"}
+
+
+# 로그아웃 (리프레시 토큰 폐기 + 쿠키 삭제)
+async def logout(refresh_token: Optional[str], response: Response, db: AsyncSession):
+    if refresh_token:
+        await session_model.revoke_session_by_hash(db, hash_refresh_token(refresh_token), _utcnow())
+        await db.commit()
+    response.delete_cookie("access_token")
+    response.delete_cookie("refresh_token", path=REFRESH_COOKIE_PATH)
+    return {"message": "로그아웃 되었습니다"}
+
+
+async def _start_session(db: AsyncSession, response: Response, user_id: int, email: str, name: str):
+    """액세스 토큰과 새 리프레시 토큰을 발급해 쿠키로 설정 (commit은 호출한 쪽에서)"""
+    access_token = create_access_token(
+        data={"sub": str(user_id),
+              "email" : email,
+              "name" : name
+             },
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    response.set_cookie(
+        key="access_token",
+        value=access_token,
+        httponly=True,       # JavaScript 접근 차단
+        secure=False,        # 개발 환경: False, 프로덕션: True (HTTPS)
+        samesite="lax",      # CSRF 방어
+        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    )
+
+    refresh_token = create_refresh_token()
+    expires_at = _utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    await session_model.create_session(db, user_id, hash_refresh_token(refresh_token), expires_at)
+    response.set_cookie(
+        key="refresh_token",
+        value=refresh_token,
+        httponly=True,
+        secure=False,
+        samesite="lax",
+        max_age=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+        path=REFRESH_COOKIE_PATH
+    )
+
+
+def _utcnow() -> datetime:
+    # 세션 만료/폐기 시각은 naive UTC로 저장
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 # 회원정보 수정
 async def update_my_info(name: Optional[str], img_path: Optional[str], user_id: int, db: AsyncSession):
     # 사용자 존재 확인
@@ -175,9 +275,10 @@ async def update_my_info(name: Optional[str], img_path: Optional[str], user_id:
     updates = {}
     old_img_path = user.img  # 기존 이미지 경로 저장
     
+    old_name = user.name
     if name:
-        existing_user = await user_model.get_user_by_name(db, name.strip())
-        if existing_user and existing_user.id != user_id:
+        existing_id = await user_model.get_user_id_by_name(db, name)
+        if existing_id is not None and existing_id != user_id:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="중복되는 닉네임입니다"
@@ -197,6 +298,11 @@ async def update_my_info(name: Optional[str], img_path: Optional[str], user_id:
     try:
         await db.commit()
         await db.refresh(updated_user)
+        if updated_user.name != old_name:
+            availability_filter.remove(name=old_name)
+            availability_filter.add(name=updated_user.name)
+        invalidate_user_list()
+        invalidate_author(user_id)
         
         # 새 이미지가 저장되었으면 기존 이미지 삭제
         if img_path and old_img_path:
@@ -229,14 +335,14 @@ async def change_pwd(data: PasswordUpdate, user_id: int, db: AsyncSession):
         )
 
     # 비밀번호 검증
-    if not verify_password(data.current_pwd, user.password):
+    if not await verify_password(data.current_pwd, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="현재 비밀번호가 일치하지 않습니다"
         )
 
     # 비밀번호 암호화
-    hashed_password = hash_password(data.password)
+    hashed_password = await hash_password(data.password)
     updates = {
         "password": hashed_password,
         "updated_at": datetime.now()
@@ -275,9 +381,17 @@ async def delete_user(user_id: int, db: AsyncSession):
             detail="이미 삭제된 계정입니다"
         )
     
+    # 탈퇴 시 이메일/닉네임이 바뀌므로 기존 값을 중복 확인 필터에서 빼기 위해 보관
+    old_email, old_name = user.email, user.name
     try:
         await user_model.delete_user(db, user_id)
+        await session_model.revoke_user_sessions(db, user_id, _utcnow())
         await db.commit()
+        invalidate_user(user_id)
+        invalidate_author(user_id)
+        availability_filter.remove(email=old_email, name=old_name)
+        availability_filter.add(email=user.email, name=user.name)
+        invalidate_user_list()
         return {"message": "계정이 성공적으로 삭제되었습니다"}
         
     except HTTPException:
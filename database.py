@@ -1,5 +1,7 @@
 from typing import AsyncGenerator
 
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 from config import settings
@@ -28,4 +30,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+# 키셋(커서) 페이지네이션에 쓰이는 시각 컬럼 타입.
+# SQLite는 server_default(CURRENT_TIMESTAMP)로 저장된 값과 바인딩된 datetime의 문자열 형식이
+# 달라(마이크로초 유무) 동등 비교가 어긋나므로, SQLite에서만 마이크로초를 잘라 형식을 맞춘다.
+KeysetDateTime = DateTime().with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
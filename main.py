@@ -3,18 +3,49 @@ FastAPI 애플리케이션 엔트리포인트.
 라우터를 등록하여 사용자, 게시글, 댓글 관련 API를 제공합니다.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
+from config import settings
+from database import AsyncSessionLocal
 from routers.user_router import router as user_router
 from routers.post_router import router as post_router
 from routers.comment_router import router as comment_router
 from routers.ai_post_router import router as ai_router
+from routers.metrics_router import router as metrics_router
+from routers.admin_router import router as admin_router
+from utils.auth import bcrypt_runner
+from utils.availability import run_availability_rebuild
+from utils.hot_feed import run_hot_score_decay
+from utils.view_counter import view_counter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작 시 백그라운드 작업을 띄우고, 종료 시 남은 작업을 정리."""
+    view_counter.start(AsyncSessionLocal)
+    hot_decay = asyncio.create_task(run_hot_score_decay(AsyncSessionLocal, settings.HOT_DECAY_INTERVAL))
+    # 중복 확인 필터는 적재가 끝날 때까지 DB로 확인하므로 시작을 막지 않음
+    availability_rebuild = asyncio.create_task(
+        run_availability_rebuild(AsyncSessionLocal, settings.AVAILABILITY_REBUILD_INTERVAL)
+    )
+    yield
+    hot_decay.cancel()
+    availability_rebuild.cancel()
+    # 취소가 끝날 때까지 기다려야 진행 중인 갱신이 엔진/세션 정리와 겹치지 않음
+    await asyncio.gather(hot_decay, availability_rebuild, return_exceptions=True)
+    # 종료 전 버퍼에 남은 조회수 반영
+    await view_counter.stop()
+    bcrypt_runner.shutdown()
+
 
-app = FastAPI(title="잡담의 화원 API", version="0.1.0")
+app = FastAPI(title="잡담의 화원 API", version="0.1.0", lifespan=lifespan)
 
 # 정적 파일 서빙 (이미지 접근용)
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
@@ -56,4 +87,6 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
 app.include_router(user_router, tags=["users"])
 app.include_router(post_router, tags=["posts"])
 app.include_router(comment_router, tags=["comments"])
-app.include_router(ai_router, tags=["ai"])
\ No newline at end of file
+app.include_router(ai_router, tags=["ai"])
+app.include_router(metrics_router, tags=["metrics"])
+app.include_router(admin_router, tags=["admin"])
\ No newline at end of file
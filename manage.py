@@ -0,0 +1,98 @@
+"""운영용 일회성 관리 커맨드.
+
+사용법:
+    python manage.py recount-post-counters
+    python manage.py rebuild-search-index
+    python manage.py refresh-hot-scores
+    python manage.py backfill-post-excerpts
+    python manage.py purge-sessions
+    python manage.py backfill-user-names
+    python manage.py backfill-ai-gardener
+"""
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from config import settings
+from database import AsyncSessionLocal
+# 관계(relationship) 해석을 위해 모든 모델을 등록
+from models import comment_model, post_like, post_model, search_model, session_model, user_model  # noqa: F401
+
+
+async def recount_post_counters():
+    """게시글의 comment_count / like_count 백필 및 복구 (바뀐 카운터로 hot_score도 재계산)"""
+    async with AsyncSessionLocal() as db:
+        updated = await post_model.recount_counters(db)
+        await post_model.decay_hot_scores(db, settings.HOT_WINDOW_HOURS)
+        await db.commit()
+    print(f"게시글 카운터 재계산 완료: {updated}건")
+
+
+async def rebuild_search_index():
+    """검색 색인 전체 재구축"""
+    async with AsyncSessionLocal() as db:
+        indexed = await search_model.rebuild_index(db)
+        await db.commit()
+    print(f"검색 색인 재구축 완료: 문서 {indexed}건")
+
+
+async def refresh_hot_scores():
+    """hot_score 백필 및 감쇠 패스 1회 실행"""
+    async with AsyncSessionLocal() as db:
+        refreshed = await post_model.decay_hot_scores(db, settings.HOT_WINDOW_HOURS)
+        await db.commit()
+    print(f"hot_score 재계산 완료: {refreshed}건")
+
+
+async def backfill_post_excerpts():
+    """목록 카드용 excerpt 백필"""
+    async with AsyncSessionLocal() as db:
+        updated = await post_model.backfill_excerpts(db)
+        await db.commit()
+    print(f"게시글 미리보기 백필 완료: {updated}건")
+
+
+async def purge_sessions():
+    """만료/폐기된 로그인 세션 정리"""
+    async with AsyncSessionLocal() as db:
+        deleted = await session_model.purge_sessions(db, datetime.now(timezone.utc).replace(tzinfo=None))
+        await db.commit()
+    print(f"로그인 세션 정리 완료: {deleted}건")
+
+
+async def backfill_user_names():
+    """닉네임 중복 비교용 name_normalized 백필"""
+    async with AsyncSessionLocal() as db:
+        updated = await user_model.backfill_name_normalized(db)
+        await db.commit()
+    print(f"닉네임 정규화 백필 완료: {updated}건")
+
+
+async def backfill_ai_gardener():
+    """게시글별 AI 정원사 호출 횟수 백필"""
+    async with AsyncSessionLocal() as db:
+        updated = await post_model.backfill_ai_gardener_counts(db)
+        await db.commit()
+    print(f"AI 정원사 호출 횟수 백필 완료: {updated}건")
+
+
+COMMANDS = {
+    "recount-post-counters": recount_post_counters,
+    "rebuild-search-index": rebuild_search_index,
+    "refresh-hot-scores": refresh_hot_scores,
+    "backfill-post-excerpts": backfill_post_excerpts,
+    "purge-sessions": purge_sessions,
+    "backfill-user-names": backfill_user_names,
+    "backfill-ai-gardener": backfill_ai_gardener,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="잡담의 화원 관리 커맨드")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    asyncio.run(COMMANDS[args.command]())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,18 @@
 # model/comment_model.py
 """댓글 ORM 모델 및 데이터 접근 함수."""
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
-from sqlalchemy import Column, Integer, Boolean, DateTime, Text, func, select
+from sqlalchemy import Column, Index, Integer, Boolean, DateTime, Text, and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import relationship, selectinload
+from sqlalchemy.orm import relationship
 
-from database import Base
+from database import Base, KeysetDateTime
+from models import post_model, search_model
+from models.user_model import User
+
+
+AI_GARDENER_PREFIX = "🤖"  # 프론트엔드가 AI 정원사 의견을 댓글로 남길 때 붙이는 접두어 (호출 횟수 백필용)
 
 
 class Comment(Base):
@@ -18,12 +24,19 @@ class Comment(Base):
     content = Column(Text, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
     deleted_at = Column(DateTime, nullable=True)  
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(KeysetDateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # User 관계 추가 (user_name 조회용)
     user = relationship("User", foreign_keys=[user_id], primaryjoin="Comment.user_id == User.id")
 
+    # 게시글별 댓글 목록용 복합 인덱스 (post_id = ? AND is_deleted = False ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index("ix_comments_post_feed", "post_id", "is_deleted", "created_at", "id"),
+    )
+    # 서버 기본값을 RETURNING으로 받아와 commit 후 재조회 없이 응답을 만들 수 있도록 함
+    __mapper_args__ = {"eager_defaults": True}
+
 
 # 댓글 작성
 async def add_comment(db: AsyncSession, data: dict, post_id: int, user_id: int):
@@ -34,44 +47,44 @@ async def add_comment(db: AsyncSession, data: dict, post_id: int, user_id: int):
     )
     db.add(new_comment)
     await db.flush()
+    await post_model.increment_counters(db, post_id, comment_count=1)
+    await search_model.index_comment(db, new_comment, is_new=True)
     return new_comment
 
 
 # 특정 댓글 조회
 async def get_comment_by_id(db: AsyncSession, comment_id: int) -> Optional[Comment]:
     result = await db.execute(
-        select(Comment)
-        .where(Comment.id == comment_id)
-        .options(selectinload(Comment.user))
+        select(Comment).where(Comment.id == comment_id)
     )
     return result.scalars().first()
 
 
 # 댓글 업데이트
 async def update_comment(db: AsyncSession, updates: dict, comment_id: int):
-    result = await db.execute(
-        select(Comment).where(Comment.id == comment_id)
-    )
-    comment = result.scalars().first()
+    # get_valid_comment로 이미 로드된 댓글이면 추가 쿼리 없이 identity map에서 반환
+    comment = await db.get(Comment, comment_id)
     if not comment:
         return None
         
     for key, value in updates.items():
         setattr(comment, key, value)
+    if "content" in updates:
+        await search_model.index_comment(db, comment)
     return comment
 
 
 # 댓글 삭제
 async def delete_comment(db: AsyncSession, comment_id: int):
-    result = await db.execute(
-        select(Comment).where(Comment.id == comment_id)
-    )
-    comment = result.scalars().first()
+    comment = await db.get(Comment, comment_id)
     if not comment:
         return None
-        
+
+    if not comment.is_deleted:
+        await post_model.increment_counters(db, comment.post_id, comment_count=-1)
     comment.is_deleted = True    
     comment.deleted_at = func.now()
+    await search_model.remove_document(db, search_model.DOC_COMMENT, comment_id)
     return True
 
 
@@ -95,21 +108,47 @@ async def get_comments_by_post_id(
     # 페이징
     query = query.offset(skip).limit(limit)
     
-    # user relationship eager load
-    query = query.options(selectinload(Comment.user))
-    
     result = await db.execute(query)
     return result.scalars().all()
 
 
-# AI 정원사 댓글 개수 조회
-async def count_ai_comments(db: AsyncSession, post_id: int) -> int:
-    """해당 게시물의 AI 정원사 댓글 개수를 센다 (🤖로 시작하는 댓글)"""
-    result = await db.execute(
-        select(func.count(Comment.id)).where(
-            Comment.post_id == post_id,
-            Comment.is_deleted == False,
-            Comment.content.like('🤖%')
+# 특정 게시글의 댓글 목록 (커서 페이지네이션)
+async def get_comments_page(
+    db: AsyncSession,
+    post_id: int,
+    limit: int,
+    cursor: Optional[Tuple[datetime, int]] = None,
+):
+    """(created_at, id) 키셋 기준 최신순 한 페이지 조회 (limit + 1개까지)"""
+    query = select(Comment).where(Comment.post_id == post_id, Comment.is_deleted == False)
+
+    if cursor:
+        created_at, comment_id = cursor
+        query = query.where(
+            or_(
+                Comment.created_at < created_at,
+                and_(Comment.created_at == created_at, Comment.id < comment_id),
+            )
+        )
+
+    query = (
+        query.order_by(Comment.created_at.desc(), Comment.id.desc())
+        .limit(limit + 1)
+    )
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+# 댓글 전체 스트림 (내보내기용)
+async def stream_comments(db: AsyncSession, after_id: int = 0, batch_size: int = 500):
+    """id 순으로 댓글 전체를 서버 측 커서로 batch_size개씩 읽는 스트림 (삭제된 댓글 포함)"""
+    return await db.stream(
+        select(
+            Comment.id, Comment.post_id, Comment.user_id, Comment.content,
+            Comment.is_deleted, Comment.deleted_at, Comment.created_at, Comment.updated_at,
         )
+        .where(Comment.id > after_id)
+        .order_by(Comment.id)
+        .execution_options(yield_per=batch_size)
     )
-    return result.scalar() or 0
+
@@ -1,12 +1,17 @@
 # models/post_like.py
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Set, Tuple
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint, select
+from sqlalchemy import (
+    Column, Integer, ForeignKey, DateTime, Index, UniqueConstraint, and_, delete, insert, or_, select,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship
 
 from database import Base
+from models import post_model
+from models.user_model import User
 
 
 class PostLike(Base):
@@ -20,6 +25,10 @@ class PostLike(Base):
     # 중복 방지: 한 사용자가 같은 게시물에 중복으로 좋아요 불가
     __table_args__ = (
         UniqueConstraint('post_id', 'user_id', name='unique_post_user_like'),
+        # 좋아요 목록 커서 페이지네이션용 (post_id = ? AND (created_at, id) < cursor)
+        Index('ix_post_like_post_created', 'post_id', 'created_at', 'id'),
+        # 피드 카드의 내 좋아요 여부 일괄 조회용 (user_id = ? AND post_id IN (...))
+        Index('ix_post_like_user_post', 'user_id', 'post_id'),
     )
     
     post = relationship("Post", back_populates="likes")
@@ -37,22 +46,74 @@ async def get_like(db: AsyncSession, post_id: int, user_id: int) -> Optional[Pos
     return result.scalars().first()
 
 
-async def create_like(db: AsyncSession, post_id: int, user_id: int) -> PostLike:
-    """좋아요 생성"""
-    new_like = PostLike(post_id=post_id, user_id=user_id)
-    db.add(new_like)
-    await db.flush()
-    return new_like
+async def is_liked(db: AsyncSession, post_id: int, user_id: int) -> bool:
+    """좋아요 여부만 확인 (행 전체를 읽지 않음)"""
+    result = await db.execute(
+        select(PostLike.id)
+        .where(PostLike.post_id == post_id, PostLike.user_id == user_id)
+        .limit(1)
+    )
+    return result.scalar() is not None
+
+
+async def get_liked_post_ids(
+    db: AsyncSession, user_id: int, post_ids: List[int], batch_size: int = 500
+) -> Set[int]:
+    """post_ids 중 사용자가 좋아요한 게시글 id.
+
+    페이지 없는 전체 목록처럼 id가 많아도 바인드 변수 한도(SQLite 등)를 넘지 않도록
+    batch_size개씩 나눠 IN 쿼리를 보낸다 (한 페이지면 쿼리 한 번).
+    """
+    liked = set()
+    for start in range(0, len(post_ids), batch_size):
+        result = await db.execute(
+            select(PostLike.post_id).where(
+                PostLike.user_id == user_id, PostLike.post_id.in_(post_ids[start:start + batch_size])
+            )
+        )
+        liked.update(result.scalars().all())
+    return liked
+
+
+async def create_like(db: AsyncSession, post_id: int, user_id: int) -> Optional[dict]:
+    """좋아요 생성. 이미 눌렀으면 None
+
+    조회 없이 충돌을 무시하는 INSERT 한 번으로 처리하므로, 동시에 두 번 눌러도
+    unique 제약 위반(500) 없이 한 요청만 반영된다.
+    """
+    values = {"post_id": post_id, "user_id": user_id, "created_at": datetime.now()}
+    result = await db.execute(_insert_ignore(db, values))
+    if result.rowcount != 1:
+        return None
+
+    await post_model.increment_counters(db, post_id, like_count=1)
+    return {"id": result.inserted_primary_key[0], **values}
 
 
 async def delete_like(db: AsyncSession, post_id: int, user_id: int) -> bool:
-    """좋아요 삭제"""
-    like = await get_like(db, post_id, user_id)
-    if like:
-        await db.delete(like)  # AsyncSession.delete()는 비동기 메서드
-        await db.flush()
-        return True
-    return False
+    """좋아요 삭제 (DELETE 한 번, 삭제된 행이 없으면 False)"""
+    result = await db.execute(
+        delete(PostLike).where(PostLike.post_id == post_id, PostLike.user_id == user_id)
+    )
+    if result.rowcount != 1:
+        return False
+
+    await post_model.increment_counters(db, post_id, like_count=-1)
+    return True
+
+
+def _insert_ignore(db: AsyncSession, values: dict):
+    """(post_id, user_id)가 이미 있으면 아무 것도 하지 않는 INSERT (DB 방언별)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(PostLike).values(**values).on_conflict_do_nothing()
+    if dialect == "postgresql":
+        return postgresql.insert(PostLike).values(**values).on_conflict_do_nothing()
+    if dialect == "mysql":
+        # ON DUPLICATE KEY UPDATE는 CLIENT_FOUND_ROWS 설정에 따라 영향 행 수가 달라지므로 IGNORE 사용
+        # (게시물/사용자 존재는 의존성에서 이미 확인하므로 FK 오류가 경고로 바뀌는 부작용은 없음)
+        return mysql.insert(PostLike).values(**values).prefix_with("IGNORE")
+    return insert(PostLike).values(**values)
 
 
 async def get_post_likes(db: AsyncSession, post_id: int):
@@ -60,4 +121,35 @@ async def get_post_likes(db: AsyncSession, post_id: int):
     result = await db.execute(
         select(PostLike).where(PostLike.post_id == post_id)
     )
-    return result.scalars().all()
\ No newline at end of file
+    return result.scalars().all()
+
+async def get_post_likes_page(
+    db: AsyncSession,
+    post_id: int,
+    limit: int,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    with_users: bool = False,
+):
+    """(created_at, id) 키셋 기준 최신순 좋아요 한 페이지 조회 (limit + 1개까지).
+
+    with_users=True면 좋아요한 사용자의 이름/프로필 이미지를 같은 쿼리에서 JOIN으로 가져온다.
+    """
+    columns = [PostLike.id, PostLike.user_id, PostLike.created_at]
+    if with_users:
+        columns += [User.name.label("user_name"), User.img.label("user_img")]
+    query = select(*columns).where(PostLike.post_id == post_id)
+    if with_users:
+        query = query.join(User, User.id == PostLike.user_id)
+
+    if cursor:
+        created_at, like_id = cursor
+        query = query.where(
+            or_(
+                PostLike.created_at < created_at,
+                and_(PostLike.created_at == created_at, PostLike.id < like_id),
+            )
+        )
+
+    query = query.order_by(PostLike.created_at.desc(), PostLike.id.desc()).limit(limit + 1)
+    result = await db.execute(query)
+    return result.all()
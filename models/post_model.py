@@ -1,12 +1,19 @@
 # model/post_model.py
 """게시글 ORM 모델 및 데이터 접근 함수."""
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, func, select
+from sqlalchemy import (
+    Boolean, Column, DateTime, Double, Index, Integer, String, Text, and_, bindparam, func, or_, select, update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import relationship, selectinload
+from sqlalchemy.orm import relationship
 
-from database import Base
+from database import Base, KeysetDateTime
+from models import search_model
+from models.user_model import User
+from utils.hot_score import compute_hot_score, engagement
+from utils.text_utils import make_excerpt
 
 
 class Post(Base):
@@ -16,63 +23,177 @@ class Post(Base):
     user_id = Column(Integer, nullable=False, index=True)
     title = Column(String(26), nullable=False)
     content = Column(Text, nullable=False)
+    # 목록 카드용 미리보기 (작성/수정 시 content에서 생성, 목록은 content 대신 이 컬럼만 읽음)
+    excerpt = Column(String(200), nullable=True)
     img = Column(String(500), nullable=True)
     view_count = Column(Integer, default=0, nullable=False)
+    # 목록 조회 시 Comments/PostLike를 읽지 않도록 비정규화한 카운터
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False)
+    like_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # 조회수/좋아요/댓글과 경과 시간으로 계산한 인기 점수 (이벤트 발생 시 갱신 + 주기적 감쇠)
+    hot_score = Column(Double, default=0.0, server_default="0", nullable=False)
+    # AI 정원사 호출 횟수 (Gemini 호출 전에 조건부 UPDATE로 예약, 실패 시 반환)
+    ai_gardener_count = Column(Integer, default=0, server_default="0", nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
     deleted_at = Column(DateTime, nullable=True)  
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(KeysetDateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # 피드 커서 페이지네이션용 복합 인덱스 (is_deleted = False AND (created_at, id) < cursor)
+    __table_args__ = (
+        Index("ix_posts_feed", "is_deleted", "created_at", "id"),
+        # hot 피드 상위 N개를 인덱스 순서대로 읽기 위한 인덱스
+        Index("ix_posts_hot", "is_deleted", "hot_score", "id"),
+    )
+    # INSERT/UPDATE 시 서버 기본값(created_at, updated_at)을 RETURNING으로 함께 받아와
+    # commit 후 응답을 만들 때 재조회가 필요 없도록 함
+    __mapper_args__ = {"eager_defaults": True}
+
     # 좋아요 관계 추가
     likes = relationship("PostLike", back_populates="post", cascade="all, delete-orphan")
     
     # User 관계 추가 (user_name 조회용)
     user = relationship("User", foreign_keys=[user_id], primaryjoin="Post.user_id == User.id")
-    
-    # 댓글 관계 추가 (comment_count 조회용)
-    comments = relationship("Comment", foreign_keys="Comment.post_id", primaryjoin="Post.id == Comment.post_id")
+
+
+def _card_query():
+    """목록 카드에 필요한 컬럼만 조회 (본문 content 제외, 작성자 이름은 JOIN)"""
+    return (
+        select(
+            Post.id, Post.user_id, Post.title, Post.excerpt, Post.img,
+            Post.view_count, Post.comment_count, Post.like_count, Post.hot_score,
+            Post.created_at, Post.updated_at, User.name.label("user_name"),
+        )
+        .outerjoin(User, User.id == Post.user_id)
+    )
 
 
 async def get_posts(db: AsyncSession):
     result = await db.execute(
-        select(Post)
-        .where(Post.is_deleted != True)
-        .options(selectinload(Post.comments), selectinload(Post.user))
+        _card_query().where(Post.is_deleted != True)
+    )
+    return result.all()
+
+
+async def get_posts_page(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[Tuple[datetime, int]] = None,
+):
+    """(created_at, id) 키셋 기준 최신순 한 페이지 조회 (카드 컬럼만).
+
+    다음 페이지 존재 여부를 알 수 있도록 limit + 1개까지 가져온다.
+    """
+    query = _card_query().where(Post.is_deleted == False)
+
+    if cursor:
+        created_at, post_id = cursor
+        query = query.where(
+            or_(
+                Post.created_at < created_at,
+                and_(Post.created_at == created_at, Post.id < post_id),
+            )
+        )
+
+    query = query.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit + 1)
+    result = await db.execute(query)
+    return result.all()
+
+
+async def get_hot_posts_page(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[Tuple[float, int]] = None,
+):
+    """(hot_score, id) 키셋 기준 인기순 한 페이지 조회 (카드 컬럼만, limit + 1개까지)"""
+    query = _card_query().where(Post.is_deleted == False)
+
+    if cursor:
+        hot_score, post_id = cursor
+        query = query.where(
+            or_(
+                Post.hot_score < hot_score,
+                and_(Post.hot_score == hot_score, Post.id < post_id),
+            )
+        )
+
+    query = query.order_by(Post.hot_score.desc(), Post.id.desc()).limit(limit + 1)
+    result = await db.execute(query)
+    return result.all()
+
+
+async def get_post_cards_by_ids(db: AsyncSession, post_ids: List[int]):
+    """id 목록에 해당하는 삭제되지 않은 게시글의 카드 컬럼 조회"""
+    result = await db.execute(
+        _card_query().where(Post.id.in_(post_ids), Post.is_deleted == False)
+    )
+    return result.all()
+
+
+async def stream_posts(db: AsyncSession, after_id: int = 0, batch_size: int = 500):
+    """id 순으로 게시글 전체를 서버 측 커서로 batch_size개씩 읽는 스트림 (삭제된 게시글 포함, 내보내기용)"""
+    return await db.stream(
+        select(
+            Post.id, Post.user_id, Post.title, Post.content, Post.img,
+            Post.view_count, Post.comment_count, Post.like_count,
+            Post.is_deleted, Post.deleted_at, Post.created_at, Post.updated_at,
+        )
+        .where(Post.id > after_id)
+        .order_by(Post.id)
+        .execution_options(yield_per=batch_size)
     )
-    return result.scalars().all()
 
 
 async def get_post_by_id(db: AsyncSession, post_id: int) -> Optional[Post]:
+    # 같은 세션에서 이미 읽은 게시글이면 추가 쿼리 없이 identity map에서 반환
+    return await db.get(Post, post_id)
+
+
+async def get_posts_by_ids(db: AsyncSession, post_ids: List[int]):
+    """id 목록에 해당하는 게시글을 쿼리 한 번으로 조회 (삭제 여부는 호출한 쪽에서 판단)"""
+    result = await db.execute(
+        select(Post).where(Post.id.in_(post_ids))
+    )
+    return result.scalars().all()
+
+
+async def get_post_ref(db: AsyncSession, post_id: int):
+    """존재/삭제 여부와 작성자 확인용으로 (id, user_id, is_deleted, like_count, comment_count) 컬럼만 조회.
+
+    게시글을 응답으로 그리지 않는 라우트(좋아요, 댓글 등)에서 사용한다.
+    """
     result = await db.execute(
-        select(Post)
+        select(Post.id, Post.user_id, Post.is_deleted, Post.like_count, Post.comment_count)
         .where(Post.id == post_id)
-        .options(selectinload(Post.comments), selectinload(Post.user))
     )
-    return result.scalars().first()
+    return result.first()
 
 
 async def create_post(db: AsyncSession, data: dict, user_id: int):
     new_post = Post(
         user_id=user_id,
+        hot_score=compute_hot_score(0, 0, 0, age_hours=0),
+        excerpt=make_excerpt(data["content"]),
         **data
     )
     db.add(new_post)  # add()는 동기 메서드
     await db.flush()
+    await search_model.index_post(db, new_post, is_new=True)
     return new_post
 
 
 async def update_post(db: AsyncSession, updates: dict, post_id: int):
-    result = await db.execute(
-        select(Post)
-        .where(Post.id == post_id)
-        .options(selectinload(Post.comments), selectinload(Post.user))
-    )
-    post = result.scalars().first()
+    # get_valid_post로 이미 로드된 게시글이면 추가 쿼리 없이 identity map에서 반환
+    post = await db.get(Post, post_id)
     if not post:
         return None
         
     for key, value in updates.items():
         setattr(post, key, value)
+    if "content" in updates:
+        post.excerpt = make_excerpt(post.content)
+    if "title" in updates or "content" in updates:
+        await search_model.index_post(db, post)
     return post
 
 
@@ -86,4 +207,204 @@ async def delete_post(db: AsyncSession, post_id: int):
         
     post.is_deleted = True    
     post.deleted_at = func.now()
-    return True
\ No newline at end of file
+    await search_model.remove_post_documents(db, post_id)
+    return True
+
+
+async def add_view_counts(db: AsyncSession, deltas: Dict[int, int]):
+    """{post_id: 증가분}을 `view_count = view_count + n` UPDATE 한 번(executemany)으로 반영"""
+    table = Post.__table__
+    stmt = (
+        table.update()
+        .where(table.c.id == bindparam("b_id"))
+        # 조회수 반영은 게시글 수정이 아니므로 updated_at(onupdate)을 그대로 유지
+        .ordered_values(
+            (table.c.hot_score, _rescaled_hot_score(table.c, view_count=bindparam("b_delta"))),
+            (table.c.view_count, table.c.view_count + bindparam("b_delta")),
+            (table.c.updated_at, table.c.updated_at),
+        )
+    )
+    await db.execute(stmt, [{"b_id": post_id, "b_delta": n} for post_id, n in deltas.items()])
+
+
+async def increment_counters(db: AsyncSession, post_id: int, **deltas: int):
+    """비정규화 카운터를 원자적으로 증감 (comment_count=1, like_count=-1 형태로 전달).
+
+    호출한 쪽의 트랜잭션 안에서 실행되므로 댓글/좋아요 변경과 함께 commit/rollback 된다.
+    """
+    values = [(Post.hot_score, _rescaled_hot_score(Post, **deltas))]
+    values += [(getattr(Post, name), getattr(Post, name) + delta) for name, delta in deltas.items()]
+    # 카운터 변경은 게시글 수정이 아니므로 updated_at(onupdate)을 그대로 유지
+    values.append((Post.updated_at, Post.updated_at))
+    await db.execute(
+        update(Post).where(Post.id == post_id).ordered_values(*values)
+    )
+
+
+def _rescaled_hot_score(columns, **deltas):
+    """카운터 증감을 반영한 hot_score 식 (카운터 UPDATE의 SET 절에서 함께 계산).
+
+    점수는 참여도 × 마지막 감쇠 패스 시점의 시간 감쇠이므로 참여도가 늘어난 비율만큼만 곱한다.
+    경과 시간을 다시 읽지 않으므로 SELECT가 필요 없고, 기간이 지나 0이 된 게시글은 0으로 남는다.
+    MySQL은 SET을 앞에서부터 적용하므로 카운터보다 먼저 두어야 증감 전 카운터로 계산된다.
+    """
+    current = engagement(columns.view_count, columns.like_count, columns.comment_count)
+    return columns.hot_score * (current + engagement(**deltas) - 1) / current
+
+
+async def reserve_ai_gardener(db: AsyncSession, post_id: int, limit: int) -> bool:
+    """AI 정원사 호출 1회 예약. 한도에 닿았거나 게시글이 없으면 False.
+
+    확인과 증가가 UPDATE 한 문장이므로 동시 요청이 함께 한도를 넘을 수 없다.
+    """
+    result = await db.execute(
+        update(Post)
+        .where(Post.id == post_id, Post.is_deleted == False, Post.ai_gardener_count < limit)
+        .values(ai_gardener_count=Post.ai_gardener_count + 1, updated_at=Post.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+async def release_ai_gardener(db: AsyncSession, post_id: int):
+    """AI 호출이 실패했을 때 예약한 1회를 반환"""
+    await db.execute(
+        update(Post)
+        .where(Post.id == post_id, Post.ai_gardener_count > 0)
+        .values(ai_gardener_count=Post.ai_gardener_count - 1, updated_at=Post.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def decay_hot_scores(db: AsyncSession, window_hours: int, batch_size: int = 500) -> int:
+    """감쇠 패스: 최근 게시글의 hot_score를 다시 계산하고, 기간이 지난 게시글은 0으로 내림"""
+    now = (await db.execute(select(func.now()))).scalar_one()
+    cutoff = now - timedelta(hours=window_hours)
+
+    await db.execute(
+        update(Post)
+        .where(Post.created_at < cutoff, Post.hot_score > 0)
+        .values(hot_score=0, updated_at=Post.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+    refreshed = 0
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(
+                Post.id, Post.view_count, Post.like_count, Post.comment_count, Post.created_at,
+                func.now().label("now"),
+            )
+            .where(Post.is_deleted == False, Post.created_at >= cutoff, Post.id > last_id)
+            .order_by(Post.id)
+            .limit(batch_size)
+        )
+        rows = result.all()
+        if not rows:
+            break
+        await _save_hot_scores(db, rows)
+        refreshed += len(rows)
+        last_id = rows[-1].id
+    return refreshed
+
+
+async def _save_hot_scores(db: AsyncSession, rows):
+    if not rows:
+        return
+    table = Post.__table__
+    stmt = (
+        table.update()
+        .where(table.c.id == bindparam("b_id"))
+        .values(hot_score=bindparam("b_score"), updated_at=table.c.updated_at)
+    )
+    await db.execute(stmt, [
+        {
+            "b_id": row.id,
+            "b_score": compute_hot_score(
+                row.view_count, row.like_count, row.comment_count,
+                age_hours=(row.now - row.created_at).total_seconds() / 3600,
+            ),
+        }
+        for row in rows
+    ])
+
+
+async def backfill_excerpts(db: AsyncSession, batch_size: int = 500) -> int:
+    """excerpt가 비어 있는 게시글을 id 순으로 나눠 채움 (백필용)"""
+    updated = 0
+    last_id = 0
+    table = Post.__table__
+    stmt = (
+        table.update()
+        .where(table.c.id == bindparam("b_id"))
+        .values(excerpt=bindparam("b_excerpt"), updated_at=table.c.updated_at)
+    )
+    while True:
+        rows = (
+            await db.execute(
+                select(Post.id, Post.content)
+                .where(Post.excerpt.is_(None), Post.id > last_id)
+                .order_by(Post.id)
+                .limit(batch_size)
+            )
+        ).all()
+        if not rows:
+            break
+        await db.execute(stmt, [{"b_id": row.id, "b_excerpt": make_excerpt(row.content)} for row in rows])
+        updated += len(rows)
+        last_id = rows[-1].id
+    return updated
+
+
+async def recount_counters(db: AsyncSession):
+    """comment_count / like_count를 원본 테이블 기준으로 다시 계산 (백필/복구용).
+
+    hot_score는 카운터로 계산하므로 이후 decay_hot_scores로 다시 계산해야 한다.
+    """
+    # 순환 import 방지를 위해 함수 내부에서 import
+    from models.comment_model import Comment
+    from models.post_like import PostLike
+
+    comment_count = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id, Comment.is_deleted == False)
+        .scalar_subquery()
+    )
+    like_count = (
+        select(func.count(PostLike.id))
+        .where(PostLike.post_id == Post.id)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(Post)
+        # 카운터 복구는 게시글 수정이 아니므로 updated_at(onupdate)을 그대로 유지
+        .values(comment_count=comment_count, like_count=like_count, updated_at=Post.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def backfill_ai_gardener_counts(db: AsyncSession) -> int:
+    """ai_gardener_count를 도입 전 호출 횟수(🤖로 시작하는 남은 댓글 수)로 채움 (백필용)
+
+    이후 한도는 ai_gardener_count로만 판단하므로 접두어 스캔은 이 백필에서 한 번만 한다.
+    """
+    # 순환 import 방지를 위해 함수 내부에서 import
+    from models.comment_model import AI_GARDENER_PREFIX, Comment
+
+    ai_count = (
+        select(func.count(Comment.id))
+        .where(
+            Comment.post_id == Post.id,
+            Comment.content.like(f"{AI_GARDENER_PREFIX}%"),
+            Comment.is_deleted == False,
+        )
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(Post)
+        .values(ai_gardener_count=ai_count, updated_at=Post.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
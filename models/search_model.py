@@ -0,0 +1,247 @@
+# model/search_model.py
+"""게시글/댓글 검색용 바이그램 역색인 ORM 모델 및 데이터 접근 함수.
+
+게시글(제목+본문)과 댓글을 각각 하나의 문서로 색인하고,
+검색 결과는 게시글 단위로 BM25 점수를 합산해 정렬한다.
+"""
+import math
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Column, Index, Integer, String, and_, case, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import Base
+from utils.text_utils import tokenize_bigrams
+
+
+# MySQL 기본 collation(대소문자/악센트 무시)에서는 서로 다른 바이그램이 같은 키로 취급되므로 binary로 비교
+Term = String(8).with_variant(mysql.VARCHAR(8, collation="utf8mb4_bin"), "mysql")
+
+DOC_POST = "post"
+DOC_COMMENT = "comment"
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+COMMENT_WEIGHT = 0.5  # 댓글에서 일치한 점수는 절반만 게시글 점수에 반영
+
+
+class SearchDocument(Base):
+    __tablename__ = "SearchDocuments"
+
+    doc_type = Column(String(10), primary_key=True)  # post / comment
+    doc_id = Column(Integer, primary_key=True)
+    post_id = Column(Integer, nullable=False, index=True)
+    length = Column(Integer, nullable=False)  # 토큰 수 (BM25 길이 정규화용)
+
+
+class SearchPosting(Base):
+    __tablename__ = "SearchPostings"
+
+    term = Column(Term, primary_key=True)
+    doc_type = Column(String(10), primary_key=True)
+    doc_id = Column(Integer, primary_key=True)
+    tf = Column(Integer, nullable=False)
+
+    # 문서 재색인/삭제 시 해당 문서의 posting을 찾기 위한 인덱스
+    __table_args__ = (
+        Index("ix_search_postings_doc", "doc_type", "doc_id"),
+    )
+
+
+async def index_document(
+    db: AsyncSession,
+    doc_type: str,
+    doc_id: int,
+    post_id: int,
+    text: str,
+    is_new: bool = False,
+):
+    """문서를 (재)색인. 새로 만든 문서면 is_new=True로 기존 posting 삭제를 건너뜀"""
+    grams = tokenize_bigrams(text)
+    length = sum(grams.values())
+
+    if is_new:
+        await db.execute(
+            insert(SearchDocument).values(doc_type=doc_type, doc_id=doc_id, post_id=post_id, length=length)
+        )
+    else:
+        await db.execute(
+            delete(SearchPosting).where(SearchPosting.doc_type == doc_type, SearchPosting.doc_id == doc_id)
+        )
+        result = await db.execute(
+            update(SearchDocument)
+            .where(SearchDocument.doc_type == doc_type, SearchDocument.doc_id == doc_id)
+            .values(length=length)
+        )
+        if result.rowcount == 0:
+            await db.execute(
+                insert(SearchDocument).values(doc_type=doc_type, doc_id=doc_id, post_id=post_id, length=length)
+            )
+
+    if grams:
+        await db.execute(
+            insert(SearchPosting),
+            [{"term": term, "doc_type": doc_type, "doc_id": doc_id, "tf": tf} for term, tf in grams.items()],
+        )
+
+
+async def index_post(db: AsyncSession, post, is_new: bool = False):
+    """게시글 제목과 본문을 하나의 문서로 색인"""
+    await index_document(db, DOC_POST, post.id, post.id, f"{post.title}\n{post.content}", is_new)
+
+
+async def index_comment(db: AsyncSession, comment, is_new: bool = False):
+    await index_document(db, DOC_COMMENT, comment.id, comment.post_id, comment.content, is_new)
+
+
+async def remove_document(db: AsyncSession, doc_type: str, doc_id: int):
+    await db.execute(
+        delete(SearchPosting).where(SearchPosting.doc_type == doc_type, SearchPosting.doc_id == doc_id)
+    )
+    await db.execute(
+        delete(SearchDocument).where(SearchDocument.doc_type == doc_type, SearchDocument.doc_id == doc_id)
+    )
+
+
+async def remove_post_documents(db: AsyncSession, post_id: int):
+    """게시글 삭제 시 게시글과 그 댓글 문서를 모두 색인에서 제거"""
+    documents = select(SearchDocument.doc_type, SearchDocument.doc_id).where(SearchDocument.post_id == post_id)
+    await db.execute(
+        delete(SearchPosting).where(tuple_(SearchPosting.doc_type, SearchPosting.doc_id).in_(documents))
+    )
+    await db.execute(
+        delete(SearchDocument).where(SearchDocument.post_id == post_id)
+    )
+
+
+async def clear_index(db: AsyncSession):
+    await db.execute(delete(SearchPosting))
+    await db.execute(delete(SearchDocument))
+
+
+async def rebuild_index(db: AsyncSession, batch_size: int = 500) -> int:
+    """색인을 비우고 삭제되지 않은 게시글/댓글 전체를 id 순으로 나눠 다시 색인 (백필/복구용)"""
+    # 순환 import 방지를 위해 함수 내부에서 import
+    from models.comment_model import Comment
+    from models.post_model import Post
+
+    await clear_index(db)
+    indexed = 0
+
+    last_id = 0
+    while True:
+        posts = (
+            await db.execute(
+                select(Post.id, Post.title, Post.content)
+                .where(Post.is_deleted == False, Post.id > last_id)
+                .order_by(Post.id)
+                .limit(batch_size)
+            )
+        ).all()
+        if not posts:
+            break
+        for post in posts:
+            await index_post(db, post, is_new=True)
+        indexed += len(posts)
+        last_id = posts[-1].id
+
+    last_id = 0
+    while True:
+        comments = (
+            await db.execute(
+                select(Comment.id, Comment.post_id, Comment.content)
+                .join(Post, Post.id == Comment.post_id)
+                .where(Comment.is_deleted == False, Post.is_deleted == False, Comment.id > last_id)
+                .order_by(Comment.id)
+                .limit(batch_size)
+            )
+        ).all()
+        if not comments:
+            break
+        for comment in comments:
+            await index_comment(db, comment, is_new=True)
+        indexed += len(comments)
+        last_id = comments[-1].id
+
+    return indexed
+
+
+async def search_post_ids(
+    db: AsyncSession,
+    query: str,
+    limit: int,
+    cursor: Optional[Tuple[float, int]] = None,
+) -> Tuple[List[Tuple[int, float]], bool]:
+    """검색어와 일치하는 게시글을 BM25 점수순으로 한 페이지 조회.
+
+    점수 합산(GROUP BY post_id), 정렬, 커서 조건, LIMIT을 모두 DB에서 처리하므로
+    페이지마다 (post_id, score) limit + 1개만 가져온다.
+    (post_id, score) 목록과 다음 페이지 존재 여부를 반환한다.
+    """
+    query_terms = tokenize_bigrams(query)
+    if not query_terms:
+        return [], False
+
+    total_docs, avg_length = (
+        await db.execute(select(func.count(), func.avg(SearchDocument.length)))
+    ).one()
+    if not total_docs:
+        return [], False
+
+    # 한 글자 검색어는 그 글자로 시작하거나 끝나는 바이그램까지 일치로 본다 (예: "꽃" -> "꽃밭", "들꽃")
+    # 단어의 마지막 글자는 끝나는 바이그램에만 나타나므로 접미 일치가 없으면 놓친다
+    conditions = [SearchPosting.term.in_([t for t in query_terms if len(t) > 1])]
+    for term in (t for t in query_terms if len(t) == 1):
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        conditions.append(SearchPosting.term.like(f"{escaped}%", escape="\\"))
+        conditions.append(SearchPosting.term.like(f"%{escaped}", escape="\\"))
+    matches = or_(*conditions)
+
+    # term별 문서 빈도(df)로 idf를 구하고, 검색어 내 빈도와 곱한 term 가중치를 CASE로 넘긴다
+    doc_freq = (
+        await db.execute(
+            select(SearchPosting.term, func.count()).where(matches).group_by(SearchPosting.term)
+        )
+    ).all()
+    if not doc_freq:
+        return [], False
+
+    weights = {}
+    for term, df in doc_freq:
+        idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+        # 한 글자 검색어로 일치한 바이그램은 앞/뒤 글자 중 검색어에 있는 쪽의 빈도를 쓴다
+        query_tf = query_terms.get(term) or sum(query_terms.get(char, 0) for char in set(term))
+        weights[term] = query_tf * idf
+
+    avg_length = float(avg_length) or 1.0
+    term_weight = case(weights, value=SearchPosting.term, else_=0.0)
+    norm = SearchPosting.tf + BM25_K1 * (1 - BM25_B + BM25_B * SearchDocument.length / avg_length)
+    doc_weight = case((SearchDocument.doc_type == DOC_COMMENT, COMMENT_WEIGHT), else_=1.0)
+    # 커서 비교가 흔들리지 않도록 점수는 반올림해 둔다
+    score = func.round(func.sum(term_weight * SearchPosting.tf * (BM25_K1 + 1) / norm * doc_weight), 6)
+
+    stmt = (
+        select(SearchDocument.post_id, score.label("score"))
+        .select_from(SearchPosting)
+        .join(
+            SearchDocument,
+            and_(
+                SearchDocument.doc_type == SearchPosting.doc_type,
+                SearchDocument.doc_id == SearchPosting.doc_id,
+            ),
+        )
+        .where(matches)
+        .group_by(SearchDocument.post_id)
+    )
+    if cursor:
+        cursor_score, cursor_id = cursor
+        stmt = stmt.having(
+            or_(score < cursor_score, and_(score == cursor_score, SearchDocument.post_id < cursor_id))
+        )
+    stmt = stmt.order_by(score.desc(), SearchDocument.post_id.desc()).limit(limit + 1)
+
+    rows = (await db.execute(stmt)).all()
+    page = [(row.post_id, float(row.score)) for row in rows[:limit]]
+    return page, len(rows) > limit
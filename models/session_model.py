@@ -0,0 +1,76 @@
+# model/session_model.py
+"""로그인 세션(리프레시 토큰) ORM 모델 및 데이터 접근 함수."""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import Base
+from models.user_model import User
+
+
+class UserSession(Base):
+    __tablename__ = "user_sessions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=False, index=True)
+    # 리프레시 토큰 원문은 저장하지 않고 sha256 해시만 저장
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+async def create_session(db: AsyncSession, user_id: int, token_hash: str, expires_at: datetime) -> UserSession:
+    session = UserSession(user_id=user_id, token_hash=token_hash, expires_at=expires_at)
+    db.add(session)
+    await db.flush()
+    return session
+
+
+async def get_session_with_user(db: AsyncSession, token_hash: str):
+    """토큰 해시로 세션과 토큰 발급에 필요한 사용자 정보를 한 번에 조회 (unique 인덱스 조회 1회)"""
+    result = await db.execute(
+        select(
+            UserSession.id, UserSession.user_id, UserSession.expires_at, UserSession.revoked_at,
+            User.email, User.name, User.is_deleted,
+        )
+        .join(User, User.id == UserSession.user_id)
+        .where(UserSession.token_hash == token_hash)
+    )
+    return result.first()
+
+
+async def revoke_session(db: AsyncSession, session_id: int, now: datetime) -> bool:
+    """아직 폐기되지 않은 세션만 폐기 (동시에 같은 토큰으로 갱신하면 한 요청만 성공)"""
+    result = await db.execute(
+        update(UserSession)
+        .where(UserSession.id == session_id, UserSession.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+    return result.rowcount == 1
+
+
+async def revoke_session_by_hash(db: AsyncSession, token_hash: str, now: datetime):
+    await db.execute(
+        update(UserSession)
+        .where(UserSession.token_hash == token_hash, UserSession.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+
+
+async def revoke_user_sessions(db: AsyncSession, user_id: int, now: datetime):
+    """사용자의 모든 세션 폐기 (탈퇴, 토큰 재사용 감지 시)"""
+    await db.execute(
+        update(UserSession)
+        .where(UserSession.user_id == user_id, UserSession.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+
+
+async def purge_sessions(db: AsyncSession, now: datetime) -> int:
+    """만료되었거나 폐기된 세션 삭제 (정리용)"""
+    result = await db.execute(
+        delete(UserSession).where(or_(UserSession.expires_at < now, UserSession.revoked_at.is_not(None)))
+    )
+    return result.rowcount
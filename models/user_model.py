@@ -1,20 +1,22 @@
 # model/user_model.py
 """사용자 ORM 모델 및 데이터 접근 함수."""
-from typing import Any, Optional
+from typing import Any, AsyncIterator, List, Optional, Tuple
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, func, select
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, and_, bindparam, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship
 
 from database import Base
+from utils.text_utils import normalize_name
 
 
 class User(Base):
     __tablename__ = "users"
     
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, index=True)
+    name_normalized = Column(String(50), nullable=True, index=True)  # 닉네임 중복 비교용 (normalize_name)
     email = Column(String, unique=True, nullable=False, index=True)
     password = Column(String, nullable=False)
     img = Column(String, nullable=True)
@@ -27,12 +29,35 @@ class User(Base):
     likes = relationship("PostLike", back_populates="user", cascade="all, delete-orphan")
 
 
-# 모든 사용자 조회
-async def get_users(db: AsyncSession):
-    result = await db.execute(
-        select(User).where(User.is_deleted != True)
-    )
-    return result.scalars().all()
+# 사용자 목록 조회
+async def get_users_page(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[Tuple[str, int]] = None,
+    name_prefix: Optional[str] = None,
+):
+    """(name, id) 키셋 기준 이름순 한 페이지 조회 (공개 컬럼 id, name, img만).
+
+    이름 접두어 검색과 정렬 모두 name 인덱스를 탄다.
+    다음 페이지 존재 여부를 알 수 있도록 limit + 1개까지 가져온다.
+    """
+    query = select(User.id, User.name, User.img).where(User.is_deleted == False)
+
+    if name_prefix:
+        query = query.where(User.name.startswith(name_prefix, autoescape=True))
+
+    if cursor:
+        name, user_id = cursor
+        query = query.where(
+            or_(
+                User.name > name,
+                and_(User.name == name, User.id > user_id),
+            )
+        )
+
+    query = query.order_by(User.name, User.id).limit(limit + 1)
+    result = await db.execute(query)
+    return result.all()
 
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
@@ -56,11 +81,62 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     return result.scalars().first()
 
 
+async def get_authors(db: AsyncSession, user_ids: List[int]):
+    """게시글/댓글 작성자 표시에 필요한 (id, name, img)만 한 번에 조회"""
+    result = await db.execute(
+        select(User.id, User.name, User.img).where(User.id.in_(user_ids))
+    )
+    return result.all()
+
+
+async def get_user_id_by_email(db: AsyncSession, email: str) -> Optional[int]:
+    """이메일 존재 여부 확인용 (email 인덱스만 사용, 행 전체를 읽지 않음)"""
+    result = await db.execute(
+        select(User.id).where(User.email == email).limit(1)
+    )
+    return result.scalar()
+
+
+async def get_user_id_by_name(db: AsyncSession, name: str) -> Optional[int]:
+    """정규화한 닉네임이 같은 사용자 id (대소문자/전각 차이는 같은 닉네임으로 봄)"""
+    result = await db.execute(
+        select(User.id)
+        .where(
+            or_(
+                User.name_normalized == normalize_name(name),
+                # 백필 전 행은 원래 이름으로 비교
+                and_(User.name_normalized.is_(None), User.name == name.strip()),
+            )
+        )
+        .limit(1)
+    )
+    return result.scalar()
+
+
+async def stream_user_keys(db: AsyncSession, batch_size: int = 1000) -> AsyncIterator[List[Tuple[str, str]]]:
+    """모든 사용자(탈퇴 포함)의 (email, name)을 id 순으로 batch_size개씩 조회"""
+    last_id = 0
+    while True:
+        rows = (
+            await db.execute(
+                select(User.id, User.email, User.name)
+                .where(User.id > last_id)
+                .order_by(User.id)
+                .limit(batch_size)
+            )
+        ).all()
+        if not rows:
+            return
+        yield [(row.email, row.name) for row in rows]
+        last_id = rows[-1].id
+
+
 async def create_user(db: AsyncSession, user_data: Any, hashed_pwd: str, img_path: Optional[str] = None) -> User:
     """신규 사용자 생성."""
     new_user = User( 
         email=user_data.email,
         name=user_data.name,
+        name_normalized=normalize_name(user_data.name),
         password=hashed_pwd,
         img=img_path
     )
@@ -79,6 +155,8 @@ async def update_user(db: AsyncSession, user_id: int, updates: dict):
         
     for key, value in updates.items():
         setattr(user, key, value)
+    if "name" in updates:
+        user.name_normalized = normalize_name(updates["name"])
     return user
 
 
@@ -93,8 +171,35 @@ async def delete_user(db: AsyncSession, user_id: int):
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     user.email = f"deleted_{user.id}_{timestamp}@deleted.com"
     user.name = f"탈퇴한사용자_{user.id}"
+    user.name_normalized = normalize_name(user.name)
     user.is_deleted = True
     user.deleted_at = func.now()  # DB 서버 시간 사용  
     
     return True
-    
\ No newline at end of file
+
+
+async def backfill_name_normalized(db: AsyncSession, batch_size: int = 500) -> int:
+    """name_normalized가 비어 있는 사용자를 id 순으로 나눠 채움 (백필용)"""
+    updated = 0
+    last_id = 0
+    table = User.__table__
+    stmt = (
+        table.update()
+        .where(table.c.id == bindparam("b_id"))
+        .values(name_normalized=bindparam("b_name"), updated_at=table.c.updated_at)
+    )
+    while True:
+        rows = (
+            await db.execute(
+                select(User.id, User.name)
+                .where(User.name_normalized.is_(None), User.id > last_id)
+                .order_by(User.id)
+                .limit(batch_size)
+            )
+        ).all()
+        if not rows:
+            break
+        await db.execute(stmt, [{"b_id": row.id, "b_name": normalize_name(row.name)} for row in rows])
+        updated += len(rows)
+        last_id = rows[-1].id
+    return updated
@@ -0,0 +1,32 @@
+# router/admin_router.py
+"""관리자 전용 라우터 정의."""
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from controllers import admin_controller
+from database import get_db
+from utils.user_validators import get_admin_user
+
+
+router = APIRouter(prefix="/admin")
+
+
+## 게시글/댓글 전체 내보내기 (관리자 전용, NDJSON 스트리밍)
+# 각 줄은 {"type": "post" | "comment", ...컬럼} 형태이며 게시글 전체 다음에 댓글 전체가 온다
+@router.get("/export")
+async def export_garden(
+    after_post_id: int = Query(0, ge=0, description="이 id 이후의 게시글부터 (이어받기용)"),
+    after_comment_id: int = Query(0, ge=0, description="이 id 이후의 댓글부터 (이어받기용)"),
+    gzip: bool = Query(False, description="gzip으로 압축해서 전송"),
+    user_id: int = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    headers = {"Content-Disposition": 'attachment; filename="garden-export.ndjson"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        admin_controller.export_ndjson(db, after_post_id, after_comment_id, compress=gzip),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
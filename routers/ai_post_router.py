@@ -4,8 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 from controllers import genai_controller
 from schemas.genai_schema import GardenerCommentRequest, SummarizeRequest
-from models.comment_model import count_ai_comments
+from models import post_model
 from utils.auth import get_current_user_id
+from utils.post_validators import ensure_post_available
 
 router = APIRouter(prefix="/ai-posts", tags=["ai-posts"])
 MAX_AI_GARDENER_COUNT = 3
@@ -28,19 +29,28 @@ async def get_gardener_comment(
     if not request.post_title or not request.post_content:
         raise HTTPException(400, "제목과 내용이 필요합니다")
     
-    # 🔒 AI 정원사 호출 횟수 제한 체크
-    current_ai_count = await count_ai_comments(db, request.post_id)
-    if current_ai_count >= MAX_AI_GARDENER_COUNT:
+    # 🔒 AI 정원사 호출 횟수 예약 (조건부 UPDATE 한 번이라 동시 호출도 한도를 넘지 못함)
+    if not await post_model.reserve_ai_gardener(db, request.post_id, MAX_AI_GARDENER_COUNT):
+        # 게시물이 없거나 삭제된 경우와 한도 초과를 구분
+        ensure_post_available(await post_model.get_post_ref(db, request.post_id))
         raise HTTPException(
             status_code=429,  # Too Many Requests
             detail=f"이 씨앗에는 AI 정원사를 {MAX_AI_GARDENER_COUNT}번까지만 부를 수 있어요! 🌱"
         )
-    
-    return await genai_controller.generate_gardener_comment(
-        post_title=request.post_title,
-        post_content=request.post_content,
-        existing_comments=request.existing_comments
-    )
+    # AI 호출 동안 행 잠금을 잡고 있지 않도록 예약을 먼저 commit
+    await db.commit()
+
+    try:
+        return await genai_controller.generate_gardener_comment(
+            post_title=request.post_title,
+            post_content=request.post_content,
+            existing_comments=request.existing_comments
+        )
+    except BaseException:
+        # AI 호출에 실패하거나 요청이 취소(CancelledError)되면 예약한 횟수를 돌려줌
+        await post_model.release_ai_gardener(db, request.post_id)
+        await db.commit()
+        raise
 
 
 # ============================================
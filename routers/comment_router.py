@@ -1,30 +1,47 @@
 # router/comment_router.py
 """댓글 관련 라우터 정의."""
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from controllers import comment_controller
 from database import get_db
 from models.comment_model import Comment
-from models.post_model import Post
-from schemas.comment_schema import CommentCreate, CommentUpdate
+from schemas.comment_schema import CommentCreate, CommentUpdate, comment_list_adapter, comment_page_adapter
 from utils.user_validators import get_active_user
 from utils.comment_validators import get_valid_comment
-from utils.post_validators import get_valid_post
+from utils.http_cache import conditional_response, make_etag
+from utils.post_validators import get_valid_post_ref
 
 router = APIRouter(prefix="/posts/{post_id}/comments")
 
 
 # 특정 게시물의 댓글 조회 (인증 불필요)
+# page 없이 cursor가 주어지면 커서 페이지네이션 모드로 응답 (첫 페이지는 cursor=빈 값)
+# ({"items": [...], "next_cursor": ..., "total": 첫 페이지에서만})
+# cursor가 없으면 limit만 있어도 기존처럼 page/limit 목록
 @router.get("")
 async def get_post_comments(
-    post: Post = Depends(get_valid_post),
+    request: Request,
+    response: Response,
+    post: Row = Depends(get_valid_post_ref),
     db: AsyncSession = Depends(get_db),
-    page: int = Query(1, ge=1, description="페이지 번호"),
-    limit: int = Query(10, ge=1, le=100, description="페이지당 개수"),
+    page: Optional[int] = Query(None, ge=1, description="페이지 번호"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 페이지는 빈 값)"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="페이지당 개수"),
 ):
+    if page is None and cursor is not None:
+        result = await comment_controller.get_comments_page(post, db, cursor, limit or 10)
+        etag = make_etag(post.id, cursor, limit, result.next_cursor, result.total, *(c.etag_key() for c in result.items))
+        return conditional_response(request, response, result, etag, adapter=comment_page_adapter)
+
+    page, limit = page or 1, limit or 10
     skip = (page - 1) * limit
-    return await comment_controller.get_comments_by_post(post, db, skip, limit)
+    comments = await comment_controller.get_comments_by_post(post, db, skip, limit)
+    etag = make_etag(post.id, page, limit, *(c.etag_key() for c in comments))
+    return conditional_response(request, response, comments, etag, adapter=comment_list_adapter)
 
 
 # 댓글 작성 (인증 필요)
@@ -32,7 +49,7 @@ async def get_post_comments(
 async def create_comment(
     data: CommentCreate,
     user_id: int = Depends(get_active_user),
-    post: Post = Depends(get_valid_post),
+    post: Row = Depends(get_valid_post_ref),
     db: AsyncSession = Depends(get_db)
 ):
     return await comment_controller.create_comment(data, post, db, user_id)
@@ -44,7 +61,7 @@ async def update_comment(
     data: CommentUpdate,
     user_id: int = Depends(get_active_user),
     comment: Comment = Depends(get_valid_comment),
-    post: Post = Depends(get_valid_post),
+    post: Row = Depends(get_valid_post_ref),
     db: AsyncSession = Depends(get_db)
 ):
     return await comment_controller.update_comment(comment, data, db, user_id)
@@ -54,7 +71,7 @@ async def update_comment(
 @router.delete("/{comment_id}")
 async def delete_comment(
     user_id: int = Depends(get_active_user),
-    post: Post = Depends(get_valid_post),
+    post: Row = Depends(get_valid_post_ref),
     comment: Comment = Depends(get_valid_comment),
     db: AsyncSession = Depends(get_db)
 ):
@@ -0,0 +1,14 @@
+# router/metrics_router.py
+"""운영 지표 라우터 정의."""
+from fastapi import APIRouter
+
+from utils.cache import cache_stats
+
+
+router = APIRouter(prefix="/metrics")
+
+
+# 프로세스 내 캐시 통계 (hit/miss/eviction)
+@router.get("/cache")
+async def get_cache_stats():
+    return cache_stats()
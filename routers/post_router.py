@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, status, File, UploadFile, Form
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status, File, UploadFile, Form
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
+from config import settings
 from database import get_db
 from models.post_model import Post
-from schemas.post_schema import PostCreate, PostUpdate
-from utils.post_validators import get_valid_post
+from schemas.post_schema import LikeUpdate, PostCreate, PostUpdate, post_list_adapter, post_page_adapter
+from utils.post_validators import get_valid_post, get_valid_post_ref
+from utils.auth import get_optional_user_id
 from utils.user_validators import get_active_user
 from utils.img_validators import validate_uploaded_image, save_image
+from utils.http_cache import conditional_response, make_etag
+from utils.json_response import json_response
 from controllers import post_controller
 
 
@@ -15,19 +20,87 @@ router = APIRouter(prefix="/posts")
 
 
 ## 전체 게시글 목록 조회
+# cursor 또는 limit이 주어지면 커서 페이지네이션 모드로 응답 ({"items": [...], "next_cursor": ...})
+# sort=hot이면 인기순(항상 페이지네이션 모드)
+# 로그인 상태면 각 게시물에 liked_by_me를 채워서 반환 (비로그인은 캐시된 응답 그대로)
 @router.get("")
-async def get_posts(db: AsyncSession = Depends(get_db)):
-    return await post_controller.get_posts(db)
+async def get_posts(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE, description="페이지당 개수"),
+    sort: str = Query("latest", pattern="^(latest|hot)$", description="정렬 (latest: 최신순, hot: 인기순)"),
+    user_id: Optional[int] = Depends(get_optional_user_id),
+):
+    if sort == "hot":
+        posts = await post_controller.get_hot_posts_page(db, cursor, limit or settings.POSTS_PAGE_SIZE)
+        items, next_cursor = posts.items, posts.next_cursor
+    elif cursor is None and limit is None:
+        posts = await post_controller.get_posts(db)
+        items, next_cursor = posts, None
+    else:
+        posts = await post_controller.get_posts_page(db, cursor, limit or settings.POSTS_PAGE_SIZE)
+        items, next_cursor = posts.items, posts.next_cursor
+
+    if user_id is not None:
+        items = await post_controller.mark_liked_by_me(db, user_id, items)
+        posts = items if isinstance(posts, list) else posts.model_copy(update={"items": items})
+
+    # 조회수는 ETag에 넣지 않으므로 약한 ETag
+    etag = make_etag(next_cursor, *(p.etag_key() for p in items), weak=True)
+    adapter = post_list_adapter if isinstance(posts, list) else post_page_adapter
+    return conditional_response(request, response, posts, etag, adapter=adapter)
+
+
+## 게시글 검색 (제목/본문/댓글, 인증 불필요)
+# /{post_id}보다 먼저 등록해야 "search"가 게시물 ID로 해석되지 않음
+@router.get("/search")
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(settings.POSTS_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="페이지당 개수"),
+    db: AsyncSession = Depends(get_db),
+):
+    result = await post_controller.search_posts(db, q, cursor, limit)
+    return json_response(post_page_adapter, result)
+
+
+## 여러 게시글 일괄 조회 (인증 선택, 조회수 증가 없음)
+# 요청한 id 순서대로 id별 상태(ok / not_found / deleted)를 반환, 로그인 상태면 liked_by_me 포함
+@router.get("/batch")
+async def get_posts_batch(
+    ids: str = Query(..., description="쉼표로 구분한 게시물 ID 목록 (예: 1,2,3)"),
+    user_id: Optional[int] = Depends(get_optional_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    return await post_controller.get_posts_batch(db, ids, user_id)
 
 
 # 특정 게시물 조회 (인증 불필요)
 @router.get("/{post_id}")
 async def get_post(
-    post: Post = Depends(get_valid_post),
+    request: Request,
+    response: Response,
+    post_id: int = Path(..., ge=1, description="게시물 ID"),
     db: AsyncSession = Depends(get_db),
     increment_view: bool = True
 ):
-    return await post_controller.get_post(post, db, increment_view)
+    # 캐시를 먼저 확인해야 하므로 get_valid_post 대신 컨트롤러에서 직접 조회
+    post = await post_controller.get_post(post_id, db, increment_view)
+    return conditional_response(request, response, post, make_etag(post.etag_key(), weak=True))
+
+
+## 게시글 상세 화면 (인증 선택)
+# 게시글, 첫 댓글 페이지, 좋아요 수와 내 좋아요 여부를 한 번에 반환 (조회수 증가)
+@router.get("/{post_id}/page")
+async def get_post_page(
+    post_id: int = Path(..., ge=1, description="게시물 ID"),
+    comment_limit: int = Query(10, ge=1, le=100, description="첫 페이지 댓글 개수"),
+    user_id: Optional[int] = Depends(get_optional_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    return await post_controller.get_post_page(post_id, db, user_id, comment_limit)
 
 
 # 게시글 생성 (인증 필요)
@@ -79,7 +152,7 @@ async def update_post(
 @router.delete("/{post_id}")
 async def delete_post(
     user_id: int = Depends(get_active_user),
-    post: Post = Depends(get_valid_post),
+    post: Row = Depends(get_valid_post_ref),
     db: AsyncSession = Depends(get_db)
 ):
     return await post_controller.delete_post(post, db, user_id)
@@ -89,7 +162,7 @@ async def delete_post(
 @router.post("/{post_id}/like", status_code=status.HTTP_201_CREATED)
 async def like_post(
     user_id: int = Depends(get_active_user),
-    post: Post = Depends(get_valid_post),
+    post: Row = Depends(get_valid_post_ref),
     db: AsyncSession = Depends(get_db)
 ):
     return await post_controller.like_post(post, user_id, db)
@@ -99,16 +172,50 @@ async def like_post(
 @router.delete("/{post_id}/like", status_code=status.HTTP_204_NO_CONTENT)
 async def unlike_post(
     user_id: int = Depends(get_active_user),
-    post: Post = Depends(get_valid_post),
+    post: Row = Depends(get_valid_post_ref),
     db: AsyncSession = Depends(get_db)
 ):
     return await post_controller.unlike_post(post, user_id, db)
 
 
+# 좋아요 상태 지정 (인증 필요, 멱등)
+# {"liked": true/false}로 원하는 상태를 지정하므로 중복 클릭/재시도에도 안전
+@router.put("/{post_id}/like")
+async def set_like(
+    data: LikeUpdate,
+    user_id: int = Depends(get_active_user),
+    post: Row = Depends(get_valid_post_ref),
+    db: AsyncSession = Depends(get_db)
+):
+    return await post_controller.set_like(post, data.liked, user_id, db)
+
+
 # 좋아요 목록 조회 (인증 불필요)
+# - count_only=true: 좋아요 수만 반환
+# - cursor/limit/with_users 중 하나라도 주어지면 커서 페이지네이션 모드 ({"items": [...], "next_cursor": ...})
+# - 아무 것도 없으면 기존처럼 전체 목록
 @router.get("/{post_id}/likes", status_code=status.HTTP_200_OK)
 async def get_post_likes(
-    post: Post = Depends(get_valid_post),
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    post: Row = Depends(get_valid_post_ref),
+    db: AsyncSession = Depends(get_db),
+    count_only: bool = Query(False, description="좋아요 수만 반환"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE, description="페이지당 개수"),
+    with_users: bool = Query(False, description="좋아요한 사용자 이름/프로필 이미지 포함"),
 ):
-    return await post_controller.get_post_likes(post, db)
+    if count_only:
+        result = post_controller.get_post_like_count(post)
+        return conditional_response(request, response, result, make_etag(post.id, result.like_count))
+
+    if cursor is None and limit is None and not with_users:
+        likes = await post_controller.get_post_likes(post, db)
+        etag = make_etag(post.id, *(like.id for like in likes))
+        return conditional_response(request, response, likes, etag)
+
+    page = await post_controller.get_post_likes_page(
+        post, db, cursor, limit or settings.POSTS_PAGE_SIZE, with_users
+    )
+    etag = make_etag(post.id, page.next_cursor, *(like.etag_key() for like in page.items))
+    return conditional_response(request, response, page, etag)
@@ -1,9 +1,10 @@
 # router/user_router.py
 """사용자 관련 라우터 정의."""
 from typing import Optional
-from fastapi import APIRouter, Depends, status, Response, Form, File, UploadFile, HTTPException
+from fastapi import APIRouter, Cookie, Depends, status, Response, Form, File, UploadFile, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import settings
 from controllers import user_controller
 from database import get_db
 from schemas.user_schema import PasswordUpdate, UserCreateRequest, UserLogin
@@ -14,10 +15,15 @@ from utils.img_validators import validate_uploaded_image, save_profile_image
 router = APIRouter(prefix="/users")
 
 
-## 전체 사용자 목록 조회
+## 사용자 목록 조회 (이름순, {"items": [...], "next_cursor": ...})
 @router.get("")
-async def get_users(db: AsyncSession = Depends(get_db)):
-    return await user_controller.get_users(db)
+async def get_users(
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(settings.USERS_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="페이지당 개수"),
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=10, description="이름 접두어 검색"),
+    db: AsyncSession = Depends(get_db),
+):
+    return await user_controller.get_users(db, cursor, limit, name_prefix)
 
 
 # 사용자 생성(201 Created) - 회원가입
@@ -64,10 +70,24 @@ async def login(user_input: UserLogin, response: Response, db: AsyncSession = De
     return await user_controller.login(user_input, response, db)
 
 
-# 로그아웃
+# 액세스 토큰 갱신 (리프레시 토큰 쿠키 필요, 호출할 때마다 리프레시 토큰도 교체)
+@router.post("/refresh")
+async def refresh(
+    response: Response,
+    refresh_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_db)
+):
+    return await user_controller.refresh_tokens(refresh_token, response, db)
+
+
+# 로그아웃 (리프레시 토큰 쿠키만으로 동작, 액세스 토큰이 만료된 뒤에도 세션을 폐기할 수 있어야 함)
 @router.post("/logout")
-async def logout(user_id: int = Depends(get_active_user)):
-    return {"message": "로그아웃 되었습니다"}
+async def logout(
+    response: Response,
+    refresh_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_db)
+):
+    return await user_controller.logout(refresh_token, response, db)
 
 
 # 회원정보 불러오기 
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from typing import List, Optional
 from datetime import datetime
 
 class CommentBase(BaseModel):
@@ -41,14 +41,31 @@ class CommentResponse(BaseModel):
     updated_at: datetime
     
     @classmethod
-    def model_validate(cls, comment):
-        return cls(
+    def model_validate(cls, comment, author=None):
+        # DB에서 읽은 값은 이미 타입이 맞으므로 검증 없이 생성
+        # author는 utils.author_loader가 조회한 작성자 (id, name, img)
+        return cls.model_construct(
             id=comment.id,
             post_id=comment.post_id,
             user_id=comment.user_id,
             content=comment.content,
-            user_name=comment.user.name if comment.user else None,
-            user_profile_image=comment.user.img if comment.user else None,
+            user_name=author.name if author else None,
+            user_profile_image=author.img if author else None,
             created_at=comment.created_at,
             updated_at=comment.updated_at
-        )
\ No newline at end of file
+        )
+
+    def etag_key(self) -> tuple:
+        """ETag 계산에 쓰는 값 (updated_at은 초 단위라 같은 초 안의 수정을 구분하도록 본문 포함)"""
+        return (self.id, self.updated_at, self.content, self.user_name, self.user_profile_image)
+
+class CommentListResponse(BaseModel):
+    """댓글 목록 응답 (커서 페이지네이션)"""
+    items: List[CommentResponse]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+    total: Optional[int] = None  # 전체 댓글 수 (첫 페이지에서만, 게시글의 comment_count)
+
+
+# 목록 응답을 JSON 바이트로 바로 직렬화하기 위한 어댑터 (utils.json_response)
+comment_list_adapter = TypeAdapter(List[CommentResponse])
+comment_page_adapter = TypeAdapter(CommentListResponse)
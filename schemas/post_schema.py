@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from typing import List, Literal, Optional
 from datetime import datetime
 
+from schemas.comment_schema import CommentListResponse
+
 class PostBase(BaseModel):
     title: str = Field(..., max_length=26, description="게시글 제목 (최대 26자)")
     content: str = Field(..., min_length=1, description="게시글 본문")
@@ -62,26 +64,139 @@ class PostResponse(BaseModel):
     img: Optional[str] = None
     view_count: int = 0
     comment_count: int = 0
+    like_count: int = 0
     user_name: Optional[str] = None
     created_at: datetime
     updated_at: datetime
+    liked_by_me: Optional[bool] = None  # 로그인한 사용자의 목록/일괄 조회에서만 채워짐
     
     @classmethod
-    def model_validate(cls, post):
-        # 삭제되지 않은 댓글만 카운트
-        comment_count = 0
-        if hasattr(post, 'comments') and post.comments:
-            comment_count = sum(1 for c in post.comments if not c.is_deleted)
-        
-        return cls(
+    def model_validate(cls, post, author=None):
+        # DB에서 읽은 값은 이미 타입이 맞으므로 검증 없이 생성 (목록 응답에서 행마다 검증하는 비용 제거)
+        # author는 utils.author_loader가 조회한 작성자 (id, name, img)
+        return cls.model_construct(
             id=post.id,
             user_id=post.user_id,
             title=post.title,
             content=post.content,
             img=post.img,
             view_count=post.view_count,
-            comment_count=comment_count,
-            user_name=post.user.name if post.user else None,
+            comment_count=post.comment_count,
+            like_count=post.like_count,
+            user_name=author.name if author else None,
             created_at=post.created_at,
             updated_at=post.updated_at
-        )
\ No newline at end of file
+        )
+
+    def etag_key(self) -> tuple:
+        """ETag 계산에 쓰는 값 (조회수는 제외해 조회만으로 검증자가 바뀌지 않도록 함)
+
+        updated_at은 초 단위라 같은 초 안의 수정을 구분하지 못하므로 표시되는 필드를 직접 포함한다.
+        """
+        return (
+            self.id, self.updated_at, self.title, self.content, self.img,
+            self.comment_count, self.like_count, self.user_name, self.liked_by_me,
+        )
+
+# 게시글 목록 카드 (본문 대신 미리보기, 전체 본문은 상세 조회에서만 제공)
+class PostCardResponse(BaseModel):
+    id: int
+    user_id: int
+    title: str
+    excerpt: Optional[str] = None
+    img: Optional[str] = None
+    view_count: int = 0
+    comment_count: int = 0
+    like_count: int = 0
+    user_name: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    liked_by_me: Optional[bool] = None  # 로그인한 사용자의 목록 조회에서만 채워짐
+
+    @classmethod
+    def model_validate(cls, row):
+        # post_model의 카드 컬럼 조회 결과(Row)로 검증 없이 생성
+        return cls.model_construct(
+            id=row.id,
+            user_id=row.user_id,
+            title=row.title,
+            excerpt=row.excerpt,
+            img=row.img,
+            view_count=row.view_count,
+            comment_count=row.comment_count,
+            like_count=row.like_count,
+            user_name=row.user_name,
+            created_at=row.created_at,
+            updated_at=row.updated_at
+        )
+
+    def etag_key(self) -> tuple:
+        """ETag 계산에 쓰는 값 (조회수는 제외, 같은 초 안의 수정도 구분하도록 표시 필드 포함)"""
+        return (
+            self.id, self.updated_at, self.title, self.excerpt, self.img,
+            self.comment_count, self.like_count, self.user_name, self.liked_by_me,
+        )
+
+# 게시글 목록 응답 (커서 페이지네이션)
+class PostListResponse(BaseModel):
+    items: List[PostCardResponse]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+
+# 목록 응답을 JSON 바이트로 바로 직렬화하기 위한 어댑터 (utils.json_response)
+post_list_adapter = TypeAdapter(List[PostCardResponse])
+post_page_adapter = TypeAdapter(PostListResponse)
+
+# 게시글 일괄 조회 응답 (요청한 id 순서대로, id별 상태 포함)
+class PostBatchItem(BaseModel):
+    id: int
+    status: Literal["ok", "not_found", "deleted"]
+    post: Optional[PostResponse] = None  # status가 ok일 때만 존재
+
+class PostBatchResponse(BaseModel):
+    items: List[PostBatchItem]
+
+# 게시글 상세 화면 응답 (게시글 + 첫 댓글 페이지 + 좋아요 상태)
+class PostPageResponse(BaseModel):
+    post: PostResponse
+    comments: CommentListResponse
+    like_count: int
+    liked_by_me: bool = False  # 로그인하지 않았으면 항상 False
+
+# 좋아요 생성 응답
+class LikeResponse(BaseModel):
+    id: int
+    post_id: int
+    user_id: int
+    created_at: datetime
+
+# 좋아요 상태 지정 요청 (PUT /posts/{id}/like)
+class LikeUpdate(BaseModel):
+    liked: bool
+
+# 좋아요 상태 지정 응답
+class LikeStateResponse(BaseModel):
+    post_id: int
+    liked: bool
+    changed: bool  # 이미 요청한 상태였으면 False
+
+# 좋아요 목록 항목 (with_users=true면 사용자 정보 포함)
+class LikerResponse(BaseModel):
+    id: int
+    user_id: int
+    created_at: datetime
+    user_name: Optional[str] = None
+    user_img: Optional[str] = None
+
+    def etag_key(self) -> tuple:
+        """ETag 계산에 쓰는 값"""
+        return (self.id, self.user_name, self.user_img)
+
+# 좋아요 목록 응답 (커서 페이지네이션)
+class LikeListResponse(BaseModel):
+    items: List[LikerResponse]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+
+# 좋아요 수 응답 (count_only=true)
+class LikeCountResponse(BaseModel):
+    post_id: int
+    like_count: int
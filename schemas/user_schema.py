@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
-from typing import Optional
+from typing import List, Optional
 from utils.pwd_validators import validate_password_strength, check_passwords_match
 
 class UserCreateRequest(BaseModel):
@@ -39,6 +39,16 @@ class UserAuthResponse(UserResponse):
     class Config:
         from_attributes = True
 
+class UserSummaryResponse(BaseModel):
+    """사용자 목록용 공개 정보 (이메일 제외)"""
+    id: int
+    name: str
+    profile_image: Optional[str] = None
+
+class UserListResponse(BaseModel):
+    items: List[UserSummaryResponse]
+    next_cursor: Optional[str] = None
+
 class UserUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=10)
     # profile_image는 UploadFile로 라우터에서 별도 처리
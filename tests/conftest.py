@@ -10,11 +10,15 @@ sys.path.insert(0, str(backend_dir))
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from main import app
 from database import Base, get_db
+from utils.availability import availability_filter
+from utils.cache import clear_caches
+from utils.view_counter import view_counter
 
 
 # 테스트용 인메모리 SQLite DB (비동기)
@@ -45,6 +49,24 @@ async def override_get_db():
             await session.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_in_process_state():
+    """테스트마다 DB가 새로 만들어지므로 프로세스 메모리 상태도 함께 초기화."""
+    view_counter.clear()
+    clear_caches()
+    availability_filter.clear()
+    yield
+    view_counter.clear()
+    clear_caches()
+    availability_filter.clear()
+
+
+@pytest.fixture
+def session_factory():
+    """백그라운드 작업(조회수 flush 등)이 사용할 테스트용 세션 팩토리."""
+    return TestingAsyncSessionLocal
+
+
 @pytest_asyncio.fixture(scope="function")
 async def db_session():
     """각 테스트마다 새로운 DB 세션 제공."""
@@ -79,6 +101,19 @@ async def async_client():
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def statements():
+    """실행된 SQL 문을 기록하는 리스트 (쿼리 개수 검증용)."""
+    executed = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
+
 @pytest.fixture
 def test_user_data():
     """테스트용 사용자 데이터."""
@@ -0,0 +1,102 @@
+# tests/test_admin_router.py
+"""관리자 API 테스트."""
+import gzip
+import json
+
+import pytest
+
+from config import settings
+
+
+@pytest.fixture
+def admin_client(authenticated_client, monkeypatch):
+    """로그인한 테스트 사용자(id=1)를 관리자로 등록한 클라이언트."""
+    monkeypatch.setattr(settings, "ADMIN_USER_IDS", {1})
+    return authenticated_client
+
+
+class TestExport:
+    """NDJSON 내보내기 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_export_requires_admin(self, authenticated_client):
+        """관리자가 아니면 403."""
+        response = await authenticated_client.get("/admin/export")
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_export_posts_and_comments(self, admin_client, test_post_data, monkeypatch):
+        """게시물 전체 다음 댓글 전체를 한 줄에 하나씩 내보냄."""
+        monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+        post_ids = [(await admin_client.post("/posts", data=test_post_data)).json()["id"] for _ in range(3)]
+        await admin_client.post(f"/posts/{post_ids[0]}/comments", json={"content": "댓글"})
+
+        response = await admin_client.get("/admin/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [(r["type"], r["id"]) for r in records] == [
+            ("post", post_ids[0]), ("post", post_ids[1]), ("post", post_ids[2]), ("comment", 1),
+        ]
+        assert records[0]["title"] == test_post_data["title"]
+        assert records[-1]["content"] == "댓글"
+
+    @pytest.mark.asyncio
+    async def test_export_resumes_after_last_id(self, admin_client, test_post_data):
+        """after_post_id / after_comment_id 이후부터 이어받기."""
+        post_ids = [(await admin_client.post("/posts", data=test_post_data)).json()["id"] for _ in range(3)]
+        await admin_client.post(f"/posts/{post_ids[0]}/comments", json={"content": "댓글"})
+
+        response = await admin_client.get(
+            "/admin/export", params={"after_post_id": post_ids[1], "after_comment_id": 1}
+        )
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [(r["type"], r["id"]) for r in records] == [("post", post_ids[2])]
+
+    @pytest.mark.asyncio
+    async def test_export_gzip(self, admin_client, test_post_data):
+        """gzip=true면 압축된 스트림을 전송."""
+        await admin_client.post("/posts", data=test_post_data)
+
+        # 자동 해제를 막기 위해 스트림으로 원본 바이트를 받음
+        async with admin_client.stream("GET", "/admin/export", params={"gzip": True}) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+        assert response.headers["content-encoding"] == "gzip"
+        records = [json.loads(line) for line in gzip.decompress(raw).decode("utf-8").splitlines()]
+        assert [r["type"] for r in records] == ["post"]
+
+    @pytest.mark.asyncio
+    async def test_export_opens_streams_one_after_another(self, admin_client, test_post_data, monkeypatch):
+        """댓글 서버 측 커서는 게시물 커서를 끝까지 읽은 뒤에 열림 (한 연결에 커서 하나)."""
+        from models import comment_model, post_model
+
+        post_id = (await admin_client.post("/posts", data=test_post_data)).json()["id"]
+        await admin_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+        events = []
+
+        def tracked(name, stream):
+            async def opener(*args, **kwargs):
+                events.append(f"{name} opened")
+                result = await stream(*args, **kwargs)
+                original = result.partitions
+
+                async def partitions(*p_args, **p_kwargs):
+                    async for rows in original(*p_args, **p_kwargs):
+                        yield rows
+                    events.append(f"{name} exhausted")
+
+                result.partitions = partitions
+                return result
+            return opener
+
+        monkeypatch.setattr(post_model, "stream_posts", tracked("posts", post_model.stream_posts))
+        monkeypatch.setattr(comment_model, "stream_comments", tracked("comments", comment_model.stream_comments))
+
+        response = await admin_client.get("/admin/export")
+
+        assert response.status_code == 200
+        assert events == ["posts opened", "posts exhausted", "comments opened", "comments exhausted"]
@@ -96,18 +96,95 @@ class TestAiGardenerLimit:
             "existing_comments": []
         }
         
-        # AI 정원사를 3번 호출한 것처럼 댓글 생성
-        # (실제 로직에서는 🤖로 시작하는 댓글 개수를 센다)
-        for i in range(3):
-            # 🤖로 시작하는 댓글 직접 생성
-            await authenticated_client.post(f"/posts/{post_id}/comments", json={
-                "content": f"🤖 AI 테스트 댓글 {i+1}"
-            })
+        # 3번까지는 성공
+        for _ in range(3):
+            response = await authenticated_client.post("/ai-posts/gardener-comment", json=request_data)
+            assert response.status_code == 200
         
         # 4번째 호출 시 429 에러
         response = await authenticated_client.post("/ai-posts/gardener-comment", json=request_data)
         
         assert response.status_code == 429
+        assert mock_generate.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch('controllers.genai_controller.generate_gardener_comment')
+    async def test_gardener_failure_releases_quota(self, mock_generate, authenticated_client, test_post_data):
+        """AI 호출이 실패하면 예약한 횟수를 돌려줌."""
+        from fastapi import HTTPException
+
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        request_data = {
+            "post_id": create_response.json()["id"],
+            "post_title": test_post_data["title"],
+            "post_content": test_post_data["content"],
+            "existing_comments": []
+        }
+
+        mock_generate.side_effect = HTTPException(500, "AI 정원사 오류")
+        for _ in range(3):
+            response = await authenticated_client.post("/ai-posts/gardener-comment", json=request_data)
+            assert response.status_code == 500
+
+        mock_generate.side_effect = None
+        mock_generate.return_value = {"success": True, "comment": "테스트 의견 🌱", "type": "gardener"}
+        response = await authenticated_client.post("/ai-posts/gardener-comment", json=request_data)
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    @patch('controllers.genai_controller.generate_gardener_comment')
+    async def test_gardener_cancel_releases_quota(self, mock_generate, authenticated_client, test_post_data, session_factory):
+        """AI 호출 중 요청이 취소되어도 예약한 횟수를 돌려줌."""
+        import asyncio
+        from models.post_model import Post
+        from routers.ai_post_router import get_gardener_comment
+        from schemas.genai_schema import GardenerCommentRequest
+
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        request = GardenerCommentRequest(
+            post_id=post_id,
+            post_title=test_post_data["title"],
+            post_content=test_post_data["content"],
+            existing_comments=[],
+        )
+
+        mock_generate.side_effect = asyncio.CancelledError()
+        async with session_factory() as db:
+            with pytest.raises(asyncio.CancelledError):
+                await get_gardener_comment(request, db, 1)
+
+        async with session_factory() as db:
+            assert (await db.get(Post, post_id)).ai_gardener_count == 0
+
+    @pytest.mark.asyncio
+    @patch('controllers.genai_controller.generate_gardener_comment')
+    async def test_gardener_unknown_post(self, mock_generate, authenticated_client):
+        """없는 게시물에는 AI 정원사를 부를 수 없음."""
+        response = await authenticated_client.post("/ai-posts/gardener-comment", json={
+            "post_id": 99999,
+            "post_title": "제목",
+            "post_content": "내용",
+            "existing_comments": []
+        })
+
+        assert response.status_code == 404
+        mock_generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_backfill_ai_gardener_counts(self, authenticated_client, test_post_data, session_factory):
+        """도입 전 🤖 댓글 수로 호출 횟수를 채우고, 이후 한도는 그 횟수로 판단."""
+        from models import post_model
+        from models.post_model import Post
+
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        for content in ["🤖 AI 의견", "🤖 AI 의견 2", "사람 의견"]:
+            await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": content})
+
+        async with session_factory() as db:
+            await post_model.backfill_ai_gardener_counts(db)
+            await db.commit()
+            assert (await db.get(Post, post_id)).ai_gardener_count == 2
 
 
 class TestSummarize:
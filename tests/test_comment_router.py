@@ -0,0 +1,183 @@
+# tests/test_comment_router.py
+"""댓글 API 테스트."""
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def post_id(authenticated_client, test_post_data):
+    """댓글을 달 게시물 생성."""
+    response = await authenticated_client.post("/posts", data=test_post_data)
+    return response.json()["id"]
+
+
+class TestCommentCreate:
+    """댓글 작성 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_create_comment_success(self, authenticated_client, post_id, test_user_data):
+        """댓글 작성 성공 (작성자 정보 포함)."""
+        response = await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "좋은 씨앗이네요"})
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["content"] == "좋은 씨앗이네요"
+        assert data["user_name"] == test_user_data["name"]
+        assert data["created_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_create_comment_unauthorized(self, async_client):
+        """비로그인 상태에서 댓글 작성 실패."""
+        response = await async_client.post("/posts/1/comments", json={"content": "댓글"})
+
+        assert response.status_code == 401
+
+
+class TestCommentUpdate:
+    """댓글 수정 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_update_comment_success(self, authenticated_client, post_id):
+        """댓글 수정 성공."""
+        create_response = await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "원래 댓글"})
+        comment_id = create_response.json()["id"]
+
+        response = await authenticated_client.patch(
+            f"/posts/{post_id}/comments/{comment_id}", json={"content": "수정된 댓글"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["content"] == "수정된 댓글"
+        assert response.json()["user_name"] is not None
+
+
+class TestCommentList:
+    """댓글 목록 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_get_comments(self, authenticated_client, post_id):
+        """삭제된 댓글을 제외하고 최신순으로 조회."""
+        first = await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "첫 댓글"})
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "둘째 댓글"})
+        await authenticated_client.delete(f"/posts/{post_id}/comments/{first.json()['id']}")
+
+        response = await authenticated_client.get(f"/posts/{post_id}/comments")
+
+        assert response.status_code == 200
+        assert [c["content"] for c in response.json()] == ["둘째 댓글"]
+
+
+class TestCommentWriteQueries:
+    """쓰기 API가 응답을 만들기 위해 재조회하지 않는지 검증."""
+
+    @pytest.mark.asyncio
+    async def test_create_comment_statement_count(self, authenticated_client, post_id, statements):
+        """댓글 작성: 인증 사용자 조회, 게시물 확인, INSERT, 카운터+hot_score UPDATE, 검색 색인(2)."""
+        statements.clear()
+        response = await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+
+        assert response.status_code == 201
+        assert len(statements) <= 6, statements
+
+    @pytest.mark.asyncio
+    async def test_update_comment_statement_count(self, authenticated_client, post_id, statements):
+        """댓글 수정: 인증 사용자 조회, 댓글/작성자 조회, 게시물 확인, UPDATE, 재색인(3)."""
+        create_response = await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+        comment_id = create_response.json()["id"]
+
+        statements.clear()
+        response = await authenticated_client.patch(
+            f"/posts/{post_id}/comments/{comment_id}", json={"content": "수정"}
+        )
+
+        assert response.status_code == 200
+        assert len(statements) <= 8, statements
+
+
+class TestCommentAuthors:
+    """댓글 작성자 정보 로더 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_authors_loaded_in_one_query(self, authenticated_client, post_id, test_user_data, statements):
+        """여러 작성자의 댓글 목록도 작성자 (id, name, img) 조회는 한 번."""
+        from utils.cache import clear_caches
+
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "첫 댓글"})
+        await authenticated_client.post("/users", data={**test_user_data, "email": "other@example.com", "name": "다른유저"})
+        await authenticated_client.post("/users/login", json={"email": "other@example.com", "password": test_user_data["password"]})
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "둘째 댓글"})
+        clear_caches()
+        statements.clear()
+
+        response = await authenticated_client.get(f"/posts/{post_id}/comments")
+
+        assert sorted(c["user_name"] for c in response.json()) == sorted([test_user_data["name"], "다른유저"])
+        author_queries = [s for s in statements if "FROM users" in s]
+        assert len(author_queries) == 1, statements
+        assert "password" not in author_queries[0]
+
+    @pytest.mark.asyncio
+    async def test_rename_invalidates_author(self, authenticated_client, post_id):
+        """닉네임을 바꾸면 댓글 목록에 바로 반영."""
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+        await authenticated_client.get(f"/posts/{post_id}/comments")
+
+        await authenticated_client.patch("/users/me", data={"name": "새닉네임"})
+        response = await authenticated_client.get(f"/posts/{post_id}/comments")
+
+        assert response.json()[0]["user_name"] == "새닉네임"
+
+
+class TestCommentCursorPagination:
+    """댓글 커서 페이지네이션 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages(self, authenticated_client, post_id):
+        """next_cursor로 다음 페이지를 조회하고 전체 개수는 첫 페이지에만 포함."""
+        for i in range(3):
+            await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": f"댓글{i}"})
+
+        first_response = await authenticated_client.get(f"/posts/{post_id}/comments", params={"limit": 2, "cursor": ""})
+        first = first_response.json()
+        second = (await authenticated_client.get(
+            f"/posts/{post_id}/comments", params={"limit": 2, "cursor": first["next_cursor"]}
+        )).json()
+
+        assert [c["content"] for c in first["items"]] == ["댓글2", "댓글1"]
+        assert first["total"] == 3
+        assert [c["content"] for c in second["items"]] == ["댓글0"]
+        assert second["next_cursor"] is None
+        assert second["total"] is None
+        # 전체 개수(total)는 updated_at과 무관하게 바뀌므로 Last-Modified를 보내지 않음
+        assert "last-modified" not in first_response.headers
+
+    @pytest.mark.asyncio
+    async def test_first_page_without_count_query(self, authenticated_client, post_id, statements):
+        """첫 페이지 전체 개수는 COUNT(*) 없이 게시물 카운터에서 가져옴."""
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+        statements.clear()
+
+        response = await authenticated_client.get(f"/posts/{post_id}/comments", params={"limit": 10, "cursor": ""})
+
+        assert response.json()["total"] == 1
+        assert not any("count(" in s.lower() for s in statements), statements
+
+    @pytest.mark.asyncio
+    async def test_limit_only_keeps_list(self, authenticated_client, post_id):
+        """cursor 없이 limit만 주면 기존처럼 목록(list)으로 응답."""
+        for i in range(3):
+            await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": f"댓글{i}"})
+
+        response = await authenticated_client.get(f"/posts/{post_id}/comments", params={"limit": 2})
+
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+        assert len(response.json()) == 2
+        assert "last-modified" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, authenticated_client, post_id):
+        """잘못된 커서는 400."""
+        response = await authenticated_client.get(f"/posts/{post_id}/comments", params={"cursor": "invalid"})
+
+        assert response.status_code == 400
@@ -27,6 +27,91 @@ class TestPostList:
         posts = response.json()
         assert len(posts) >= 1
 
+    @pytest.mark.asyncio
+    async def test_get_posts_cursor_pagination(self, authenticated_client, test_post_data):
+        """커서 페이지네이션으로 전체 게시물을 중복 없이 순회."""
+        for _ in range(5):
+            await authenticated_client.post("/posts", data=test_post_data)
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await authenticated_client.get("/posts", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            seen.extend(p["id"] for p in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        # 최신순(id 내림차순)으로 빠짐없이, 중복 없이 조회되어야 함
+        assert seen == sorted(seen, reverse=True)
+        assert len(seen) == len(set(seen)) == 5
+
+    @pytest.mark.asyncio
+    async def test_get_posts_invalid_cursor(self, async_client):
+        """잘못된 커서로 조회 시 400."""
+        response = await async_client.get("/posts", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+
+class TestPostCards:
+    """목록 카드 (본문 대신 미리보기) 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_list_returns_excerpt_instead_of_content(self, authenticated_client, statements):
+        """목록은 본문 없이 잘린 미리보기만 쿼리 한 번으로 반환하고, 상세는 전체 본문 반환."""
+        long_content = "화원에   심은\n이야기 " * 30
+        post_id = (await authenticated_client.post(
+            "/posts", data={"title": "긴 글", "content": long_content}
+        )).json()["id"]
+        authenticated_client.cookies.clear()
+
+        statements.clear()
+        response = await authenticated_client.get("/posts", params={"limit": 10})
+
+        card = response.json()["items"][0]
+        assert "content" not in card
+        assert card["excerpt"].endswith("…")
+        assert len(card["excerpt"]) == 101
+        assert "  " not in card["excerpt"] and "\n" not in card["excerpt"]
+        assert len(statements) == 1, statements
+
+        detail = await authenticated_client.get(f"/posts/{post_id}")
+        assert detail.json()["content"] == long_content.strip()
+
+    @pytest.mark.asyncio
+    async def test_update_refreshes_excerpt(self, authenticated_client, test_post_data):
+        """본문을 수정하면 미리보기도 갱신."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+
+        await authenticated_client.patch(f"/posts/{post_id}", data={"content": "바뀐 본문"})
+        response = await authenticated_client.get("/posts")
+
+        assert response.json()[0]["excerpt"] == "바뀐 본문"
+
+    @pytest.mark.asyncio
+    async def test_backfill_excerpts(self, authenticated_client, db_session, test_post_data):
+        """excerpt가 비어 있는 기존 게시물 백필."""
+        from models import post_model
+        from models.post_model import Post
+
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        post = await db_session.get(Post, post_id)
+        post.excerpt = None
+        await db_session.commit()
+
+        updated = await post_model.backfill_excerpts(db_session)
+        await db_session.commit()
+        await db_session.refresh(post)
+
+        assert updated == 1
+        assert post.excerpt == test_post_data["content"]
+
 
 class TestPostCreate:
     """게시물 작성 테스트."""
@@ -114,6 +199,60 @@ class TestPostDetail:
         # 조회수가 증가해야 함
         assert view_count_2 >= view_count_1
 
+    @pytest.mark.asyncio
+    async def test_view_count_write_behind(self, authenticated_client, db_session, session_factory, test_post_data):
+        """조회수는 버퍼에 쌓였다가 flush 시 DB에 반영."""
+        from models.post_model import Post
+        from utils.view_counter import view_counter
+
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+
+        await authenticated_client.get(f"/posts/{post_id}")
+        response = await authenticated_client.get(f"/posts/{post_id}")
+        # 응답에는 아직 반영되지 않은 증가분까지 포함
+        assert response.json()["view_count"] == 2
+
+        # 요청 경로에서는 DB를 갱신하지 않음
+        post = await db_session.get(Post, post_id)
+        assert post.view_count == 0
+
+        # 종료 시 flush로 DB에 일괄 반영
+        view_counter.start(session_factory)
+        await view_counter.stop()
+        await db_session.refresh(post)
+        assert post.view_count == 2
+
+        response = await authenticated_client.get(f"/posts/{post_id}", params={"increment_view": False})
+        assert response.json()["view_count"] == 2
+
+
+    @pytest.mark.asyncio
+    async def test_view_flush_race_not_double_counted(self, authenticated_client, session_factory, test_post_data, monkeypatch):
+        """flush 도중 상세 캐시가 채워져도 flush된 조회수를 두 번 더하지 않음."""
+        from controllers import post_controller
+        from models import post_model
+        from utils.post_cache import post_detail_cache
+        from utils.view_counter import view_counter
+
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.get(f"/posts/{post_id}")
+        post_detail_cache.clear()
+
+        original = post_model.add_view_counts
+
+        async def add_then_fill_cache(db, deltas):
+            await original(db, deltas)
+            # 다른 요청이 flush 중에 캐시를 채우는 상황 (DB 값에 이미 증가분이 보임)
+            await post_controller.get_post(post_id, db, increment_view=False)
+
+        monkeypatch.setattr(post_model, "add_view_counts", add_then_fill_cache)
+        view_counter.start(session_factory)
+        await view_counter.stop()
+
+        response = await authenticated_client.get(f"/posts/{post_id}", params={"increment_view": False})
+        assert response.json()["view_count"] == 1
+
 
 class TestPostUpdate:
     """게시물 수정 테스트."""
@@ -204,6 +343,75 @@ class TestPostLike:
         
         assert response.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_like_deleted_post(self, authenticated_client, test_post_data):
+        """삭제된 게시물에 좋아요/댓글 시 410."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+        await authenticated_client.delete(f"/posts/{post_id}")
+
+        like_response = await authenticated_client.post(f"/posts/{post_id}/like")
+        comment_response = await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+
+        assert like_response.status_code == 410
+        assert comment_response.status_code == 410
+
+    @pytest.mark.asyncio
+    async def test_double_like_is_rejected_without_error(self, authenticated_client, test_post_data):
+        """같은 게시물에 두 번 좋아요하면 400이고 like_count는 1."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+
+        first = await authenticated_client.post(f"/posts/{post_id}/like")
+        second = await authenticated_client.post(f"/posts/{post_id}/like")
+        detail = await authenticated_client.get(f"/posts/{post_id}", params={"increment_view": False})
+
+        assert first.status_code == 201
+        assert first.json()["post_id"] == post_id
+        assert second.status_code == 400
+        assert detail.json()["like_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unlike_without_like(self, authenticated_client, test_post_data):
+        """좋아요하지 않은 게시물 취소는 400."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+
+        response = await authenticated_client.delete(f"/posts/{post_id}/like")
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_set_like_is_idempotent(self, authenticated_client, test_post_data):
+        """PUT으로 같은 상태를 반복 지정해도 한 번만 반영."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+
+        first = await authenticated_client.put(f"/posts/{post_id}/like", json={"liked": True})
+        again = await authenticated_client.put(f"/posts/{post_id}/like", json={"liked": True})
+        detail = await authenticated_client.get(f"/posts/{post_id}", params={"increment_view": False})
+
+        assert first.json() == {"post_id": post_id, "liked": True, "changed": True}
+        assert again.json()["changed"] is False
+        assert detail.json()["like_count"] == 1
+
+        off = await authenticated_client.put(f"/posts/{post_id}/like", json={"liked": False})
+        off_again = await authenticated_client.put(f"/posts/{post_id}/like", json={"liked": False})
+        detail = await authenticated_client.get(f"/posts/{post_id}", params={"increment_view": False})
+
+        assert off.json()["changed"] is True
+        assert off_again.json()["changed"] is False
+        assert detail.json()["like_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_like_statement_count(self, authenticated_client, test_post_data, statements):
+        """이미 누른 좋아요: 인증 사용자 조회, 게시물 확인, INSERT(무시)만 실행."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.post(f"/posts/{post_id}/like")
+
+        statements.clear()
+        response = await authenticated_client.post(f"/posts/{post_id}/like")
+
+        assert response.status_code == 400
+        assert len(statements) <= 3, statements
+
     @pytest.mark.asyncio
     async def test_get_post_likes(self, authenticated_client, test_post_data):
         """좋아요 목록 조회."""
@@ -219,3 +427,707 @@ class TestPostLike:
         
         assert response.status_code == 200
         assert len(response.json()) >= 1
+
+    @pytest.mark.asyncio
+    async def test_get_post_likes_count_only(self, authenticated_client, test_post_data, statements):
+        """count_only=true면 좋아요 행을 읽지 않고 카운터로 응답."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.post(f"/posts/{post_id}/like")
+
+        statements.clear()
+        response = await authenticated_client.get(f"/posts/{post_id}/likes", params={"count_only": True})
+
+        assert response.json() == {"post_id": post_id, "like_count": 1}
+        assert len(statements) == 1, statements
+
+    @pytest.mark.asyncio
+    async def test_get_post_likes_page_with_users(self, authenticated_client, test_post_data, test_user_data):
+        """커서 페이지네이션 + 사용자 정보 포함."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.post(f"/posts/{post_id}/like")
+
+        # 두 번째 사용자로 로그인해 좋아요
+        second_user = {**test_user_data, "email": "second@example.com", "name": "둘째"}
+        await authenticated_client.post("/users", data=second_user)
+        await authenticated_client.post(
+            "/users/login", json={"email": second_user["email"], "password": second_user["password"]}
+        )
+        await authenticated_client.post(f"/posts/{post_id}/like")
+
+        first_page = await authenticated_client.get(
+            f"/posts/{post_id}/likes", params={"limit": 1, "with_users": True}
+        )
+        data = first_page.json()
+        assert [like["user_name"] for like in data["items"]] == ["둘째"]
+        assert data["next_cursor"] is not None
+
+        second_page = await authenticated_client.get(
+            f"/posts/{post_id}/likes", params={"limit": 1, "cursor": data["next_cursor"]}
+        )
+        data = second_page.json()
+        assert len(data["items"]) == 1
+        assert data["items"][0]["user_name"] is None
+        assert data["next_cursor"] is None
+
+
+class TestPostCounters:
+    """비정규화 카운터 (comment_count, like_count) 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_comment_count_follows_comment_writes(self, authenticated_client, test_post_data):
+        """댓글 작성/삭제 시 comment_count 반영."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+
+        first = await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "첫 댓글"})
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "둘째 댓글"})
+        await authenticated_client.delete(f"/posts/{post_id}/comments/{first.json()['id']}")
+
+        response = await authenticated_client.get(f"/posts/{post_id}")
+        assert response.json()["comment_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_like_count_follows_like_writes(self, authenticated_client, test_post_data):
+        """좋아요/취소 시 like_count 반영."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+
+        await authenticated_client.post(f"/posts/{post_id}/like")
+        response = await authenticated_client.get(f"/posts/{post_id}")
+        assert response.json()["like_count"] == 1
+
+        await authenticated_client.delete(f"/posts/{post_id}/like")
+        response = await authenticated_client.get(f"/posts/{post_id}")
+        assert response.json()["like_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_recount_counters_repairs_drift(self, authenticated_client, db_session, test_post_data):
+        """recount_counters로 어긋난 카운터 복구."""
+        from datetime import datetime
+
+        from models import post_model
+        from models.post_model import Post
+
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+        await authenticated_client.post(f"/posts/{post_id}/like")
+
+        # 카운터를 일부러 틀어놓은 뒤 복구
+        post = await db_session.get(Post, post_id)
+        post.comment_count = 42
+        post.like_count = 7
+        post.updated_at = updated_at = datetime(2020, 1, 1)
+        await db_session.commit()
+
+        await post_model.recount_counters(db_session)
+        await db_session.commit()
+        await db_session.refresh(post)
+
+        # 카운터 복구는 게시글 수정이 아니므로 updated_at 유지
+        assert post.updated_at == updated_at
+
+        response = await authenticated_client.get(f"/posts/{post_id}", params={"increment_view": False})
+        assert response.json()["comment_count"] == 1
+        assert response.json()["like_count"] == 1
+
+
+class TestLikedByMe:
+    """목록/일괄 조회의 내 좋아요 여부 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_list_marks_liked_posts(self, authenticated_client, test_post_data, statements):
+        """로그인 상태의 목록은 좋아요 여부를 쿼리 한 번으로 표시."""
+        liked_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        other_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.post(f"/posts/{liked_id}/like")
+        await authenticated_client.get("/posts", params={"limit": 10})  # 목록 캐시 채우기
+
+        statements.clear()
+        response = await authenticated_client.get("/posts", params={"limit": 10})
+
+        flags = {p["id"]: p["liked_by_me"] for p in response.json()["items"]}
+        assert flags == {liked_id: True, other_id: False}
+        assert len(statements) == 1, statements
+
+    @pytest.mark.asyncio
+    async def test_liked_post_ids_split_into_batches(self, authenticated_client, test_post_data, db_session, statements):
+        """페이지 없는 전체 목록처럼 id가 많으면 IN 쿼리를 batch_size개씩 나눠 보냄."""
+        from models import post_like
+
+        post_ids = [(await authenticated_client.post("/posts", data=test_post_data)).json()["id"] for _ in range(5)]
+        for post_id in post_ids[::2]:
+            await authenticated_client.post(f"/posts/{post_id}/like")
+
+        statements.clear()
+        liked = await post_like.get_liked_post_ids(db_session, 1, post_ids, batch_size=2)
+
+        assert liked == set(post_ids[::2])
+        assert len(statements) == 3, statements
+
+    @pytest.mark.asyncio
+    async def test_anonymous_list_has_no_like_state(self, authenticated_client, test_post_data):
+        """비로그인 목록은 liked_by_me가 비어 있음."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.post(f"/posts/{post_id}/like")
+        authenticated_client.cookies.clear()
+
+        response = await authenticated_client.get("/posts")
+
+        assert [p["liked_by_me"] for p in response.json()] == [None]
+
+    @pytest.mark.asyncio
+    async def test_batch_marks_liked_posts(self, authenticated_client, test_post_data):
+        """로그인 상태의 일괄 조회도 좋아요 여부 표시."""
+        liked_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        other_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.post(f"/posts/{liked_id}/like")
+
+        response = await authenticated_client.get("/posts/batch", params={"ids": f"{liked_id},{other_id}"})
+
+        assert [i["post"]["liked_by_me"] for i in response.json()["items"]] == [True, False]
+
+
+class TestPostPage:
+    """게시물 상세 화면 (복합 조회) 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_page_returns_post_comments_and_like_state(self, authenticated_client, test_post_data):
+        """게시물, 최신 댓글 첫 페이지, 좋아요 상태를 함께 반환."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        for i in range(3):
+            await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": f"댓글 {i}"})
+        await authenticated_client.post(f"/posts/{post_id}/like")
+
+        response = await authenticated_client.get(f"/posts/{post_id}/page", params={"comment_limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["post"]["id"] == post_id
+        assert [c["content"] for c in data["comments"]["items"]] == ["댓글 2", "댓글 1"]
+        assert data["comments"]["items"][0]["user_name"] is not None
+        assert data["comments"]["next_cursor"] is not None
+        assert data["like_count"] == 1
+        assert data["liked_by_me"] is True
+
+    @pytest.mark.asyncio
+    async def test_page_anonymous(self, authenticated_client, async_client, test_post_data):
+        """로그인하지 않으면 liked_by_me는 False."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.post(f"/posts/{post_id}/like")
+        authenticated_client.cookies.clear()
+
+        response = await authenticated_client.get(f"/posts/{post_id}/page")
+
+        assert response.status_code == 200
+        assert response.json()["liked_by_me"] is False
+
+    @pytest.mark.asyncio
+    async def test_page_statement_count(self, authenticated_client, test_post_data, statements):
+        """캐시가 비어 있어도 게시물, 댓글, 작성자(게시글+댓글 한 번에), 좋아요 여부 쿼리 4개로 응답."""
+        from utils.cache import clear_caches
+        from utils.post_cache import post_detail_cache
+
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+        clear_caches()
+        statements.clear()
+
+        response = await authenticated_client.get(f"/posts/{post_id}/page")
+
+        assert response.status_code == 200
+        assert len(statements) <= 4, statements
+
+        # 작성자 캐시가 채워진 뒤에는 작성자 쿼리 없이 응답
+        post_detail_cache.clear()
+        statements.clear()
+        await authenticated_client.get(f"/posts/{post_id}/page")
+        assert len(statements) <= 3, statements
+
+    @pytest.mark.asyncio
+    async def test_page_deleted_post(self, authenticated_client, test_post_data):
+        """삭제된 게시물은 410."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.delete(f"/posts/{post_id}")
+
+        response = await authenticated_client.get(f"/posts/{post_id}/page")
+
+        assert response.status_code == 410
+
+    @pytest.mark.asyncio
+    async def test_page_missing_post_skips_comments(self, authenticated_client, test_post_data, statements):
+        """없거나 삭제된 게시물은 댓글 테이블을 조회하지 않고 404/410."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.delete(f"/posts/{post_id}")
+
+        for url, status_code in [(f"/posts/{post_id}/page", 410), ("/posts/99999/page", 404)]:
+            statements.clear()
+            response = await authenticated_client.get(url)
+            assert response.status_code == status_code
+            assert not any('from "comments"' in s.lower() for s in statements), statements
+
+
+class TestPostBatch:
+    """게시물 일괄 조회 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_status_per_id(self, authenticated_client, test_post_data):
+        """요청 순서대로 ok / deleted / not_found 상태 반환."""
+        ok_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        deleted_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        await authenticated_client.delete(f"/posts/{deleted_id}")
+
+        response = await authenticated_client.get("/posts/batch", params={"ids": f"99999,{ok_id},{deleted_id}"})
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [(i["id"], i["status"]) for i in items] == [
+            (99999, "not_found"), (ok_id, "ok"), (deleted_id, "deleted"),
+        ]
+        assert items[1]["post"]["title"] == test_post_data["title"]
+        assert items[0]["post"] is None
+
+    @pytest.mark.asyncio
+    async def test_batch_does_not_increment_views(self, authenticated_client, test_post_data):
+        """일괄 조회는 조회수를 올리지 않음."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+
+        await authenticated_client.get("/posts/batch", params={"ids": str(post_id)})
+        response = await authenticated_client.get(f"/posts/{post_id}", params={"increment_view": False})
+
+        assert response.json()["view_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_single_query(self, authenticated_client, test_post_data, statements):
+        """캐시가 비어 있어도 게시물 쿼리 한 번 + 작성자 쿼리 한 번으로 조회 (비로그인)."""
+        from utils.cache import clear_caches
+        from utils.post_cache import post_detail_cache
+
+        ids = [(await authenticated_client.post("/posts", data=test_post_data)).json()["id"] for _ in range(3)]
+        authenticated_client.cookies.clear()
+        clear_caches()
+        statements.clear()
+
+        response = await authenticated_client.get("/posts/batch", params={"ids": ",".join(map(str, ids))})
+
+        assert response.status_code == 200
+        assert len(statements) == 2, statements
+
+        # 작성자 캐시가 채워진 뒤에는 게시물 쿼리 한 번
+        post_detail_cache.clear()
+        statements.clear()
+        await authenticated_client.get("/posts/batch", params={"ids": ",".join(map(str, ids))})
+        assert len(statements) == 1, statements
+
+    @pytest.mark.asyncio
+    async def test_batch_invalid_ids(self, async_client):
+        """숫자가 아닌 id는 400."""
+        response = await async_client.get("/posts/batch", params={"ids": "1,abc"})
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_batch_too_many_ids(self, async_client):
+        """최대 개수를 넘으면 400."""
+        from config import settings
+
+        ids = ",".join(str(i) for i in range(1, settings.MAX_BATCH_IDS + 2))
+        response = await async_client.get("/posts/batch", params={"ids": ids})
+
+        assert response.status_code == 400
+
+
+class TestHotFeed:
+    """인기순(hot) 피드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_hot_feed_ranks_engaged_post_first(self, authenticated_client, test_post_data):
+        """좋아요/댓글이 달린 게시물이 더 최근 게시물보다 앞에 온다."""
+        older = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        newer = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+
+        await authenticated_client.post(f"/posts/{older}/like")
+        await authenticated_client.post(f"/posts/{older}/comments", json={"content": "댓글"})
+
+        response = await authenticated_client.get("/posts", params={"sort": "hot"})
+
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()["items"]] == [older, newer]
+
+    @pytest.mark.asyncio
+    async def test_hot_feed_cursor_pagination(self, authenticated_client, test_post_data):
+        """인기순 커서 페이지네이션으로 전체 게시물을 중복 없이 순회."""
+        post_ids = [(await authenticated_client.post("/posts", data=test_post_data)).json()["id"] for _ in range(5)]
+        await authenticated_client.post(f"/posts/{post_ids[2]}/like")
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"sort": "hot", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            page = (await authenticated_client.get("/posts", params=params)).json()
+            seen.extend(p["id"] for p in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen[0] == post_ids[2]
+        assert sorted(seen) == sorted(post_ids)
+
+    @pytest.mark.asyncio
+    async def test_invalid_sort(self, async_client):
+        """지원하지 않는 정렬 값은 422."""
+        response = await async_client.get("/posts", params={"sort": "random"})
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_decay_pass_zeroes_posts_outside_window(self, authenticated_client, db_session, test_post_data):
+        """감쇠 패스: 기간이 지난 게시물은 점수 0, 최근 게시물은 재계산."""
+        from datetime import timedelta
+
+        from models import post_model
+        from models.post_model import Post
+
+        old_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        new_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+
+        old_post = await db_session.get(Post, old_id)
+        old_post.created_at = old_post.created_at - timedelta(days=30)
+        new_post = await db_session.get(Post, new_id)
+        new_post.hot_score = 0
+        await db_session.commit()
+
+        refreshed = await post_model.decay_hot_scores(db_session, window_hours=24)
+        await db_session.commit()
+        await db_session.refresh(old_post)
+        await db_session.refresh(new_post)
+
+        assert refreshed == 1
+        assert old_post.hot_score == 0
+        assert new_post.hot_score > 0
+
+
+    @pytest.mark.asyncio
+    async def test_counter_write_updates_score_in_same_statement(
+        self, authenticated_client, db_session, test_post_data, statements
+    ):
+        """좋아요는 카운터와 hot_score를 UPDATE 한 번으로 갱신하고, 기간이 지나 0이 된 점수는 되살리지 않음."""
+        from datetime import timedelta
+
+        from models import post_model
+        from models.post_model import Post
+
+        old_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        new_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        old_post = await db_session.get(Post, old_id)
+        old_post.created_at = old_post.created_at - timedelta(days=30)
+        await db_session.commit()
+        await post_model.decay_hot_scores(db_session, window_hours=24)
+        await db_session.commit()
+
+        statements.clear()
+        await authenticated_client.post(f"/posts/{new_id}/like")
+        assert sum(s.lstrip().upper().startswith("UPDATE \"POSTS\"") for s in statements) == 1, statements
+        assert not any("now()" in s.lower() or "current_timestamp" in s.lower() for s in statements), statements
+
+        await authenticated_client.post(f"/posts/{old_id}/like")
+        await db_session.refresh(old_post)
+        new_post = await db_session.get(Post, new_id)
+        await db_session.refresh(new_post)
+
+        assert old_post.hot_score == 0
+        assert new_post.hot_score > 0
+
+
+class TestPostWriteQueries:
+    """쓰기 API가 응답을 만들기 위해 재조회하지 않는지 검증."""
+
+    @pytest.mark.asyncio
+    async def test_create_post_statement_count(self, authenticated_client, test_post_data, statements):
+        """게시물 작성: 인증 사용자 조회, INSERT ... RETURNING, 검색 색인(문서, posting)."""
+        statements.clear()
+        response = await authenticated_client.post("/posts", data=test_post_data)
+
+        assert response.status_code == 201
+        assert response.json()["user_name"] is not None
+        assert len(statements) <= 4, statements
+
+    @pytest.mark.asyncio
+    async def test_update_post_statement_count(self, authenticated_client, test_post_data, statements):
+        """게시물 수정: 인증 사용자 조회, 게시물/작성자 조회, UPDATE ... RETURNING, 재색인(3)."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+
+        statements.clear()
+        response = await authenticated_client.patch(f"/posts/{post_id}", data={"title": "수정된 제목"})
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "수정된 제목"
+        assert len(statements) <= 7, statements
+
+    @pytest.mark.asyncio
+    async def test_get_post_statement_count(self, authenticated_client, test_post_data, statements):
+        """게시물 조회: 게시물/작성자 조회만 하고 조회수 UPDATE나 재조회는 없음."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+
+        statements.clear()
+        response = await authenticated_client.get(f"/posts/{post_id}")
+
+        assert response.status_code == 200
+        assert len(statements) <= 2, statements
+        assert not any(s.lstrip().upper().startswith("UPDATE") for s in statements)
+
+
+class TestPostCache:
+    """게시물 응답 캐시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_detail_served_from_cache(self, authenticated_client, test_post_data, statements):
+        """두 번째 상세 조회는 DB를 거치지 않음."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+        await authenticated_client.get(f"/posts/{post_id}")
+
+        statements.clear()
+        response = await authenticated_client.get(f"/posts/{post_id}")
+
+        assert response.status_code == 200
+        assert statements == []
+        # 조회수는 캐시를 버리지 않고 반영됨
+        assert response.json()["view_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cache(self, authenticated_client, test_post_data):
+        """수정/댓글 작성 후에는 갱신된 내용이 조회됨."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+        await authenticated_client.get(f"/posts/{post_id}")
+        await authenticated_client.get("/posts")
+
+        await authenticated_client.patch(f"/posts/{post_id}", data={"title": "수정된 제목"})
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+
+        detail = (await authenticated_client.get(f"/posts/{post_id}")).json()
+        listed = (await authenticated_client.get("/posts")).json()
+        assert detail["title"] == "수정된 제목"
+        assert detail["comment_count"] == 1
+        assert listed[0]["title"] == "수정된 제목"
+        assert listed[0]["comment_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deleted_post_not_served_from_cache(self, authenticated_client, test_post_data):
+        """삭제 후에는 캐시된 응답 대신 410."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+        await authenticated_client.get(f"/posts/{post_id}")
+
+        await authenticated_client.delete(f"/posts/{post_id}")
+        response = await authenticated_client.get(f"/posts/{post_id}")
+
+        assert response.status_code == 410
+
+    @pytest.mark.asyncio
+    async def test_cache_stats(self, authenticated_client, test_post_data):
+        """캐시 통계 노출."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+        await authenticated_client.get(f"/posts/{post_id}")
+        await authenticated_client.get(f"/posts/{post_id}")
+
+        response = await authenticated_client.get("/metrics/cache")
+
+        assert response.status_code == 200
+        stats = response.json()["post_detail"]
+        assert stats["hits"] >= 1
+        assert stats["misses"] >= 1
+        assert "evictions" in stats
+
+
+class TestConditionalGet:
+    """ETag / 304 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_detail_not_modified(self, authenticated_client, test_post_data):
+        """같은 ETag로 다시 요청하면 304, 내용이 바뀌면 200."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+
+        first = await authenticated_client.get(f"/posts/{post_id}")
+        etag = first.headers["etag"]
+        # 조회수는 ETag에 넣지 않으므로 약한 ETag, 카운터 변경을 반영하지 못하는 Last-Modified는 보내지 않음
+        assert etag.startswith('W/"')
+        assert "last-modified" not in first.headers
+
+        cached = await authenticated_client.get(f"/posts/{post_id}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+        changed = await authenticated_client.get(f"/posts/{post_id}", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_edit_within_same_second_changes_etag(self, authenticated_client, test_post_data, session_factory):
+        """updated_at이 같은 초에 머물러도 제목/댓글 수정은 ETag를 바꿈."""
+        from sqlalchemy import update
+        from models.comment_model import Comment
+        from models.post_model import Post
+
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        comment_id = (await authenticated_client.post(
+            f"/posts/{post_id}/comments", json={"content": "댓글"}
+        )).json()["id"]
+        urls = [f"/posts/{post_id}", "/posts", f"/posts/{post_id}/comments"]
+        etags = {url: (await authenticated_client.get(url)).headers["etag"] for url in urls}
+        async with session_factory() as db:
+            post_updated_at = (await db.get(Post, post_id)).updated_at
+            comment_updated_at = (await db.get(Comment, comment_id)).updated_at
+
+        await authenticated_client.patch(f"/posts/{post_id}", data={"title": "새 제목"})
+        await authenticated_client.patch(f"/posts/{post_id}/comments/{comment_id}", json={"content": "새 댓글"})
+        # 같은 초 안의 수정을 재현: updated_at을 수정 전 값으로 되돌림
+        async with session_factory() as db:
+            await db.execute(update(Post).where(Post.id == post_id).values(updated_at=post_updated_at))
+            await db.execute(update(Comment).where(Comment.id == comment_id).values(updated_at=comment_updated_at))
+            await db.commit()
+
+        for url in urls:
+            response = await authenticated_client.get(url, headers={"If-None-Match": etags[url]})
+            assert response.status_code == 200, url
+
+    @pytest.mark.asyncio
+    async def test_list_endpoints_send_validators(self, authenticated_client, test_post_data):
+        """목록/댓글/좋아요 목록도 ETag로 304 응답."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+
+        for url in ["/posts", f"/posts/{post_id}/comments", f"/posts/{post_id}/likes"]:
+            first = await authenticated_client.get(url)
+            second = await authenticated_client.get(url, headers={"If-None-Match": first.headers["etag"]})
+            assert second.status_code == 304, url
+
+    @pytest.mark.asyncio
+    async def test_anonymous_cache_control(self, async_client):
+        """비로그인 응답은 공유 캐시 가능한 Cache-Control."""
+        from config import settings
+
+        response = await async_client.get("/posts")
+
+        assert response.headers["cache-control"] == settings.ANON_CACHE_CONTROL
+
+    @pytest.mark.asyncio
+    async def test_if_modified_since_not_stale_after_comment(self, authenticated_client, test_post_data):
+        """댓글로 카운터만 바뀌어도 If-Modified-Since로 304가 나오지 않음."""
+        post_id = (await authenticated_client.post("/posts", data=test_post_data)).json()["id"]
+        since = "Fri, 01 Jan 2100 00:00:00 GMT"
+
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "댓글"})
+
+        for url in [f"/posts/{post_id}", "/posts", f"/posts/{post_id}/comments"]:
+            response = await authenticated_client.get(url, headers={"If-Modified-Since": since})
+            assert response.status_code == 200, url
+
+
+class TestPostSearch:
+    """게시물 검색 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_search_posts_by_content(self, authenticated_client):
+        """제목/본문의 부분 문자열로 검색하고 관련도순으로 정렬."""
+        await authenticated_client.post("/posts", data={"title": "정원 가꾸기", "content": "봄에는 꽃밭을 정리해요"})
+        await authenticated_client.post("/posts", data={"title": "꽃밭 이야기", "content": "꽃밭에 물을 주는 꽃밭 일기"})
+        await authenticated_client.post("/posts", data={"title": "코딩", "content": "파이썬 공부"})
+
+        response = await authenticated_client.get("/posts/search", params={"q": "꽃밭"})
+
+        assert response.status_code == 200
+        titles = [p["title"] for p in response.json()["items"]]
+        assert titles == ["꽃밭 이야기", "정원 가꾸기"]
+
+    @pytest.mark.asyncio
+    async def test_search_single_char_matches_word_end(self, authenticated_client):
+        """한 글자 검색어는 단어의 첫 글자뿐 아니라 마지막 글자와도 일치."""
+        await authenticated_client.post("/posts", data={"title": "산책", "content": "길가에 핀 들꽃"})
+        await authenticated_client.post("/posts", data={"title": "정원", "content": "꽃밭 가꾸기"})
+        await authenticated_client.post("/posts", data={"title": "코딩", "content": "파이썬 공부"})
+
+        response = await authenticated_client.get("/posts/search", params={"q": "꽃"})
+
+        assert sorted(p["title"] for p in response.json()["items"]) == ["산책", "정원"]
+
+    @pytest.mark.asyncio
+    async def test_search_matches_comments(self, authenticated_client, test_post_data):
+        """댓글 내용으로도 게시물이 검색됨."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+        await authenticated_client.post(f"/posts/{post_id}/comments", json={"content": "해바라기 씨앗을 심어보세요"})
+
+        response = await authenticated_client.get("/posts/search", params={"q": "해바라기"})
+
+        assert [p["id"] for p in response.json()["items"]] == [post_id]
+
+    @pytest.mark.asyncio
+    async def test_search_index_follows_writes(self, authenticated_client, test_post_data):
+        """수정/삭제가 색인에 반영됨."""
+        create_response = await authenticated_client.post("/posts", data=test_post_data)
+        post_id = create_response.json()["id"]
+
+        await authenticated_client.patch(f"/posts/{post_id}", data={"content": "민들레 홀씨"})
+        assert (await authenticated_client.get("/posts/search", params={"q": "민들레"})).json()["items"]
+        assert not (await authenticated_client.get("/posts/search", params={"q": "게시물"})).json()["items"]
+
+        await authenticated_client.delete(f"/posts/{post_id}")
+        assert not (await authenticated_client.get("/posts/search", params={"q": "민들레"})).json()["items"]
+
+    @pytest.mark.asyncio
+    async def test_search_cursor_pagination(self, authenticated_client):
+        """검색 결과도 커서로 중복 없이 이어서 조회."""
+        for i in range(5):
+            await authenticated_client.post("/posts", data={"title": f"씨앗 {i}", "content": "새싹" * (i + 1)})
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"q": "새싹", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            page = (await authenticated_client.get("/posts/search", params=params)).json()
+            seen.extend(p["id"] for p in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == 5
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_and_limits_in_sql(self, authenticated_client, statements):
+        """점수 합산/정렬/LIMIT은 DB에서 처리해 페이지 크기만큼만 가져옴 (많이 일치할수록 앞)."""
+        ids = [
+            (await authenticated_client.post("/posts", data={"title": f"씨앗 {i}", "content": "새싹" * (i + 1)})).json()["id"]
+            for i in range(3)
+        ]
+        statements.clear()
+
+        page = (await authenticated_client.get("/posts/search", params={"q": "새싹", "limit": 1})).json()
+
+        assert [p["id"] for p in page["items"]] == [ids[-1]]
+        scoring = [s for s in statements if "GROUP BY" in s and "LIMIT" in s and "ORDER BY" in s]
+        assert len(scoring) == 1, statements
+
+    @pytest.mark.asyncio
+    async def test_rebuild_index(self, authenticated_client, db_session, test_post_data):
+        """색인 재구축 후에도 동일하게 검색됨."""
+        from models import search_model
+
+        await authenticated_client.post("/posts", data={"title": "튤립", "content": "튤립 구근"})
+        await search_model.clear_index(db_session)
+        await db_session.commit()
+        assert not (await authenticated_client.get("/posts/search", params={"q": "튤립"})).json()["items"]
+
+        await search_model.rebuild_index(db_session)
+        await db_session.commit()
+        assert (await authenticated_client.get("/posts/search", params={"q": "튤립"})).json()["items"]
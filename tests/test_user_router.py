@@ -2,6 +2,8 @@
 """사용자 API 테스트."""
 import pytest
 
+from utils.availability import availability_filter
+
 
 class TestUserRegistration:
     """회원가입 테스트."""
@@ -126,6 +128,130 @@ class TestCheckDuplicate:
         assert response.json()["exists"] == False
 
 
+class TestUserList:
+    """사용자 목록 테스트."""
+
+    async def _signup(self, client, test_user_data, names):
+        for i, name in enumerate(names):
+            await client.post("/users", data={**test_user_data, "email": f"user{i}@example.com", "name": name})
+
+    @pytest.mark.asyncio
+    async def test_list_users_paginated_by_name(self, async_client, test_user_data):
+        """이름순 커서 페이지네이션, 이메일은 응답에 포함하지 않음."""
+        await self._signup(async_client, test_user_data, ["다람쥐", "가람", "나무"])
+
+        first = (await async_client.get("/users", params={"limit": 2})).json()
+        second = (await async_client.get("/users", params={"limit": 2, "cursor": first["next_cursor"]})).json()
+
+        assert [u["name"] for u in first["items"]] == ["가람", "나무"]
+        assert [u["name"] for u in second["items"]] == ["다람쥐"]
+        assert second["next_cursor"] is None
+        assert "email" not in first["items"][0]
+
+    @pytest.mark.asyncio
+    async def test_list_users_name_prefix(self, async_client, test_user_data):
+        """이름 접두어 검색 (LIKE 와일드카드는 문자 그대로 비교)."""
+        await self._signup(async_client, test_user_data, ["정원사", "정원%", "화원"])
+
+        response = await async_client.get("/users", params={"name_prefix": "정원"})
+        wildcard = await async_client.get("/users", params={"name_prefix": "정원%"})
+
+        assert sorted(u["name"] for u in response.json()["items"]) == ["정원%", "정원사"]
+        assert [u["name"] for u in wildcard.json()["items"]] == ["정원%"]
+
+    @pytest.mark.asyncio
+    async def test_first_page_cached_until_signup(self, async_client, test_user_data, statements):
+        """첫 페이지는 캐시하고 가입 시 무효화."""
+        await self._signup(async_client, test_user_data, ["가람"])
+        await async_client.get("/users")
+        statements.clear()
+
+        cached = await async_client.get("/users")
+        assert statements == []
+        assert len(cached.json()["items"]) == 1
+
+        await async_client.post("/users", data={**test_user_data, "email": "new@example.com", "name": "나무"})
+        response = await async_client.get("/users")
+        assert len(response.json()["items"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_list_users_invalid_cursor(self, async_client):
+        """잘못된 커서는 400."""
+        response = await async_client.get("/users", params={"cursor": "invalid"})
+
+        assert response.status_code == 400
+
+
+class TestAvailabilityFilter:
+    """중복 확인 블룸 필터 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_available_values_skip_db(self, async_client, test_user_data, session_factory, statements):
+        """필터에 없는 이메일/이름은 DB 조회 없이 사용 가능으로 응답."""
+        await async_client.post("/users", data=test_user_data)
+        await availability_filter.rebuild(session_factory)
+        statements.clear()
+
+        email_response = await async_client.get("/users/check-email", params={"email": "new@example.com"})
+        name_response = await async_client.get("/users/check-name", params={"name": "새이름"})
+
+        assert email_response.json()["exists"] == False
+        assert name_response.json()["exists"] == False
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_taken_values_confirmed_by_one_query(self, async_client, test_user_data, session_factory, statements):
+        """필터에 있는 값은 인덱스 조회 한 번으로 확인 (이름은 대소문자/전각 무시)."""
+        await availability_filter.rebuild(session_factory)
+        await async_client.post("/users", data={**test_user_data, "name": "Gardener"})
+        statements.clear()
+
+        response = await async_client.get("/users/check-name", params={"name": "ｇａｒｄｅｎｅｒ"})
+
+        assert response.json()["exists"] == True
+        assert len(statements) == 1
+
+        statements.clear()
+        response = await async_client.get("/users/check-email", params={"email": test_user_data["email"]})
+
+        assert response.json()["exists"] == True
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_rename_and_delete_update_filter(self, authenticated_client, test_user_data, session_factory, statements):
+        """닉네임 변경/탈퇴 후 이전 값은 다시 사용 가능."""
+        await availability_filter.rebuild(session_factory)
+
+        await authenticated_client.patch("/users/me", data={"name": "새닉네임"})
+        statements.clear()
+        old_name = await authenticated_client.get("/users/check-name", params={"name": test_user_data["name"]})
+        new_name = await authenticated_client.get("/users/check-name", params={"name": "새닉네임"})
+
+        assert old_name.json()["exists"] == False
+        assert new_name.json()["exists"] == True
+
+        await authenticated_client.delete("/users/me")
+        email = await authenticated_client.get("/users/check-email", params={"email": test_user_data["email"]})
+        name = await authenticated_client.get("/users/check-name", params={"name": "새닉네임"})
+
+        assert email.json()["exists"] == False
+        assert name.json()["exists"] == False
+
+    @pytest.mark.asyncio
+    async def test_rename_conflict_ignores_case(self, async_client, test_user_data):
+        """정규화했을 때 같은 닉네임으로는 변경할 수 없음."""
+        await async_client.post("/users", data={**test_user_data, "email": "other@example.com", "name": "Gardener"})
+        await async_client.post("/users", data=test_user_data)
+        await async_client.post("/users/login", json={
+            "email": test_user_data["email"],
+            "password": test_user_data["password"]
+        })
+
+        response = await async_client.patch("/users/me", data={"name": "GARDENER"})
+
+        assert response.status_code == 409
+
+
 class TestUserProfile:
     """프로필 관련 테스트."""
 
@@ -156,3 +282,163 @@ class TestUserLogout:
         response = await authenticated_client.post("/users/logout")
         
         assert response.status_code == 200
+
+
+class TestRefreshToken:
+    """리프레시 토큰 세션 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_login_sets_refresh_cookie(self, authenticated_client):
+        """로그인하면 리프레시 토큰 쿠키가 발급됨."""
+        assert authenticated_client.cookies.get("refresh_token")
+
+    @pytest.mark.asyncio
+    async def test_refresh_rotates_tokens_without_bcrypt(self, authenticated_client, monkeypatch, statements):
+        """갱신 시 새 액세스/리프레시 토큰 발급, 세션 조회는 1회이고 bcrypt는 쓰지 않음."""
+        from utils import auth
+
+        def fail(*args, **kwargs):
+            raise AssertionError("갱신에 bcrypt를 사용하면 안 됨")
+        monkeypatch.setattr(auth, "_checkpw", fail)
+
+        old_refresh = authenticated_client.cookies.get("refresh_token")
+        statements.clear()
+        response = await authenticated_client.post("/users/refresh")
+
+        assert response.status_code == 200
+        assert authenticated_client.cookies.get("refresh_token") != old_refresh
+        assert sum(s.lstrip().startswith("SELECT") for s in statements) == 1, statements
+        assert (await authenticated_client.get("/users/me")).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_reused_refresh_token_revokes_sessions(self, authenticated_client):
+        """교체된 리프레시 토큰을 다시 쓰면 401이고, 그 사용자의 세션이 모두 폐기됨."""
+        old_refresh = authenticated_client.cookies.get("refresh_token")
+        await authenticated_client.post("/users/refresh")
+        new_refresh = authenticated_client.cookies.get("refresh_token")
+
+        authenticated_client.cookies.set("refresh_token", old_refresh, path="/users")
+        reused = await authenticated_client.post("/users/refresh")
+        authenticated_client.cookies.set("refresh_token", new_refresh, path="/users")
+        after = await authenticated_client.post("/users/refresh")
+
+        assert reused.status_code == 401
+        assert after.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_refresh_without_cookie(self, async_client):
+        """리프레시 토큰이 없으면 401."""
+        response = await async_client.post("/users/refresh")
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_logout_revokes_refresh_token(self, authenticated_client):
+        """로그아웃하면 리프레시 토큰이 폐기되고 쿠키가 삭제됨."""
+        refresh_token = authenticated_client.cookies.get("refresh_token")
+
+        response = await authenticated_client.post("/users/logout")
+        assert response.status_code == 200
+        assert authenticated_client.cookies.get("refresh_token") is None
+
+        authenticated_client.cookies.set("refresh_token", refresh_token, path="/users")
+        response = await authenticated_client.post("/users/refresh")
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_logout_with_only_refresh_cookie(self, authenticated_client):
+        """액세스 토큰이 만료된 뒤에도 리프레시 토큰 쿠키만으로 로그아웃(폐기) 가능."""
+        refresh_token = authenticated_client.cookies.get("refresh_token")
+        authenticated_client.cookies.clear()
+        authenticated_client.cookies.set("refresh_token", refresh_token, path="/users")
+
+        response = await authenticated_client.post("/users/logout")
+        assert response.status_code == 200
+
+        authenticated_client.cookies.set("refresh_token", refresh_token, path="/users")
+        response = await authenticated_client.post("/users/refresh")
+        assert response.status_code == 401
+
+
+class TestAuthCache:
+    """인증 캐시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_auth_needs_no_query(self, authenticated_client, statements):
+        """활성 상태를 확인한 사용자는 다음 요청부터 인증에 DB 조회가 없음 (내 정보 조회 1건만)."""
+        await authenticated_client.get("/users/me")
+
+        statements.clear()
+        response = await authenticated_client.get("/users/me")
+
+        assert response.status_code == 200
+        assert len(statements) == 1, statements
+
+    @pytest.mark.asyncio
+    async def test_delete_user_invalidates_cache(self, authenticated_client):
+        """탈퇴하면 같은 토큰으로 더 이상 인증되지 않음."""
+        await authenticated_client.get("/users/me")  # 활성 상태 캐시 채우기
+        await authenticated_client.delete("/users/me")
+
+        response = await authenticated_client.get("/users/me")
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_cache_stats_exposed(self, authenticated_client):
+        """인증 캐시 적중률이 /metrics/cache에 노출됨."""
+        await authenticated_client.get("/users/me")
+        await authenticated_client.get("/users/me")
+
+        stats = (await authenticated_client.get("/metrics/cache")).json()
+
+        assert stats["auth_token"]["hits"] >= 1
+        assert stats["active_user"]["hits"] >= 1
+
+
+class TestBcryptOffload:
+    """bcrypt 스레드 풀 실행 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_returns_503(self):
+        """자리가 나지 않으면 대기 시간 초과 후 503."""
+        import asyncio
+        import time
+
+        from fastapi import HTTPException
+
+        from utils.auth import BcryptRunner
+
+        runner = BcryptRunner(max_workers=1, queue_timeout=0.05)
+        busy = asyncio.create_task(runner.run(time.sleep, 0.3))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await runner.run(time.sleep, 0)
+        await busy
+        runner.shutdown()
+
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_login_when_bcrypt_pool_is_saturated(self, async_client, test_user_data, monkeypatch):
+        """로그인 시 bcrypt 대기열이 가득 차 있으면 503."""
+        import asyncio
+        import time
+
+        from utils import auth
+
+        await async_client.post("/users", data=test_user_data)
+        runner = auth.BcryptRunner(max_workers=1, queue_timeout=0.05)
+        monkeypatch.setattr(auth, "bcrypt_runner", runner)
+        busy = asyncio.create_task(runner.run(time.sleep, 0.3))
+        await asyncio.sleep(0.01)
+
+        response = await async_client.post("/users/login", json={
+            "email": test_user_data["email"],
+            "password": test_user_data["password"],
+        })
+        await busy
+        runner.shutdown()
+
+        assert response.status_code == 503
@@ -1,11 +1,18 @@
 """인증/인가 관련 유틸리티 (JWT, 비밀번호 해시 등)."""
+import asyncio
+import hashlib
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import bcrypt
 from fastapi import Depends, HTTPException, status, Cookie
 from jose import JWTError, jwt
 
 from config import settings
+from utils.auth_cache import token_cache
 
 ALGORITHM = "HS256"
 SECRET_KEY = settings.SECRET_KEY
@@ -19,38 +26,115 @@ def get_current_user_id(access_token: str = Cookie(None)) -> int:
     if access_token is None:
         raise credentials_exception
 
+    user_id = decode_user_id(access_token)
+    if user_id is None:
+        raise credentials_exception
+    return user_id
+
+
+def get_optional_user_id(access_token: str = Cookie(None)) -> Optional[int]:
+    """로그인하지 않았거나 토큰이 유효하지 않으면 None (인증이 선택인 조회 API용)"""
+    if access_token is None:
+        return None
+    return decode_user_id(access_token)
+
+
+def decode_user_id(access_token: str) -> Optional[int]:
+    """토큰에서 user_id 추출 (유효하지 않으면 None). 디코딩 결과는 토큰 만료 전까지 캐시"""
+    cached = token_cache.get(access_token)
+    if cached is not None:
+        return cached
+
     try:
-        # 토큰 디코딩
         payload = jwt.decode(access_token, SECRET_KEY, algorithms=[ALGORITHM])
-        
-        # user_id 추출
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            # logger.warning("토큰에 user_id가 없음")
-            raise credentials_exception     
-        return int(user_id)
-        
-    except JWTError as e:
-        # logger.warning(f"JWT 검증 실패: {str(e)}")
-        raise credentials_exception
+        user_id = int(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        # logger.warning("JWT 검증 실패")
+        return None
+
+    ttl = settings.AUTH_CACHE_TTL
+    if "exp" in payload:
+        ttl = min(ttl, payload["exp"] - time.time())
+    if ttl > 0:
+        token_cache.set(access_token, user_id, ttl=ttl)
+    return user_id
+
+
+class BcryptRunner:
+    """bcrypt 작업을 전용 스레드 풀에서 실행 (bcrypt는 GIL을 풀고 계산하므로 스레드로 충분).
+
+    동시에 max_workers개까지만 실행하고, 자리가 나기를 queue_timeout초 넘게 기다리면 503을 반환해
+    로그인 폭주 시 대기열이 끝없이 쌓이지 않도록 한다.
+    """
+
+    def __init__(self, max_workers: int, queue_timeout: float):
+        self.max_workers = max_workers
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+    async def run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 세마포어는 처음 사용한 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
 
-def hash_password(pwd: str, rounds:int = 10) -> str:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._slots.release()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+
+bcrypt_runner = BcryptRunner(settings.BCRYPT_MAX_WORKERS, settings.BCRYPT_QUEUE_TIMEOUT)
+
+
+def _hashpw(pwd: str, rounds: int) -> str:
     salt = bcrypt.gensalt(rounds=rounds)
-    hashed_password = bcrypt.hashpw(pwd.encode("utf-8"), salt).decode("utf-8")
-    return hashed_password
+    return bcrypt.hashpw(pwd.encode("utf-8"), salt).decode("utf-8")
+
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode('utf-8'), 
         hashed_password.encode('utf-8')
     )
 
+
+async def hash_password(pwd: str, rounds:int = 10) -> str:
+    """비밀번호 해싱 (bcrypt 스레드 풀에서 실행)"""
+    return await bcrypt_runner.run(_hashpw, pwd, rounds)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (bcrypt 스레드 풀에서 실행)"""
+    return await bcrypt_runner.run(_checkpw, plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     """JWT 토큰 생성"""
     to_encode = data.copy()   
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=15))
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
\ No newline at end of file
+    return encoded_jwt
+
+def create_refresh_token() -> str:
+    """리프레시 토큰 원문 (쿠키로만 전달하고 DB에는 hash_refresh_token 값만 저장)"""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    # 충분히 긴 무작위 토큰이므로 bcrypt 없이 sha256으로 충분
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
@@ -0,0 +1,18 @@
+"""인증 캐시 (JWT 디코딩 결과, 사용자 활성 상태)."""
+from config import settings
+from utils.cache import TTLCache
+
+
+# access_token -> user_id (토큰 만료 시각을 넘겨 보관하지 않음)
+token_cache = TTLCache(
+    "auth_token", maxsize=settings.AUTH_CACHE_MAXSIZE, ttl=settings.AUTH_CACHE_TTL
+)
+# user_id -> True (활성 사용자만 보관, 탈퇴 시 무효화)
+active_user_cache = TTLCache(
+    "active_user", maxsize=settings.AUTH_CACHE_MAXSIZE, ttl=settings.AUTH_CACHE_TTL
+)
+
+
+def invalidate_user(user_id: int):
+    """사용자 상태가 바뀌면 활성 상태 캐시를 버림 (commit 이후에 호출)"""
+    active_user_cache.pop(user_id)
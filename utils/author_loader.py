@@ -0,0 +1,87 @@
+"""게시글/댓글 작성자 정보 로더.
+
+응답을 만들 때 필요한 작성자 정보는 (id, name, img)뿐이므로 User 행 전체를 읽지 않고,
+요청 하나에서 필요한 작성자 id를 모아 쿼리 한 번으로 가져온다.
+가져온 값은 프로세스 공용 LRU에 보관하고 회원정보 수정/탈퇴 시 무효화한다.
+"""
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from models import user_model
+from utils.cache import TTLCache
+
+
+class Author(NamedTuple):
+    id: int
+    name: str
+    img: Optional[str]
+
+
+# user_id -> Author (다른 워커 프로세스의 수정은 최대 AUTHOR_CACHE_TTL초 늦게 반영됨)
+author_cache = TTLCache(
+    "author", maxsize=settings.AUTHOR_CACHE_MAXSIZE, ttl=settings.AUTHOR_CACHE_TTL
+)
+
+
+def invalidate_author(user_id: int):
+    """작성자 이름/프로필 이미지가 바뀌면 캐시를 버림 (commit 이후에 호출)"""
+    author_cache.pop(user_id)
+
+
+class AuthorLoader:
+    """요청(세션) 하나 동안 작성자 id를 모아 한 번에 조회하는 DataLoader.
+
+    prime()으로 필요한 id를 미리 등록해 두면 다음 load_many()에서 함께 조회한다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+        self._queue: set = set()
+        self._loaded: Dict[int, Optional[Author]] = {}
+
+    def prime(self, user_ids: Iterable[int]):
+        self._queue.update(i for i in user_ids if i not in self._loaded)
+
+    async def load(self, user_id: int) -> Optional[Author]:
+        return (await self.load_many([user_id])).get(user_id)
+
+    async def load_many(self, user_ids: Iterable[int]) -> Dict[int, Author]:
+        """작성자 id -> Author (없는 사용자는 빠짐)"""
+        user_ids = list(user_ids)
+        self.prime(user_ids)
+        await self._dispatch()
+        return {i: self._loaded[i] for i in user_ids if self._loaded[i] is not None}
+
+    async def _dispatch(self):
+        if not self._queue:
+            return
+        queue, self._queue = self._queue, set()
+
+        # 같은 요청에서 인증하며 이미 읽은 사용자(get_active_user가 세션에 고정)는 그대로 사용
+        active_users = self._db.info.get("active_users", {})
+        misses = []
+        for user_id in queue:
+            user = active_users.get(user_id)
+            author = Author(user.id, user.name, user.img) if user is not None else author_cache.get(user_id)
+            if author is None:
+                misses.append(user_id)
+            else:
+                self._loaded[user_id] = author
+
+        if misses:
+            for row in await user_model.get_authors(self._db, misses):
+                author = Author(row.id, row.name, row.img)
+                self._loaded[row.id] = author
+                author_cache.set(row.id, author)
+        for user_id in misses:
+            self._loaded.setdefault(user_id, None)
+
+
+def get_author_loader(db: AsyncSession) -> AuthorLoader:
+    """세션(요청)마다 하나의 로더를 사용"""
+    loader = db.info.get("author_loader")
+    if loader is None:
+        loader = db.info["author_loader"] = AuthorLoader(db)
+    return loader
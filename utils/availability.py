@@ -0,0 +1,107 @@
+"""회원가입 이메일/닉네임 사용 가능 여부 사전 확인 (블룸 필터).
+
+가입 폼은 입력할 때마다 중복 확인 API를 부르므로, 사용 중인 이메일/닉네임을
+프로세스 메모리의 블룸 필터에 올려 두고 '확실히 사용 가능'한 경우는 DB를 조회하지 않는다.
+필터가 '있을 수도 있음'이라고 답한 경우에만 인덱스 조회로 확인한다.
+
+다른 워커 프로세스에서 가입/변경된 값은 다음 재구축(AVAILABILITY_REBUILD_INTERVAL초) 전까지
+반영되지 않으므로 중복 확인 결과는 안내용이다. 가입/닉네임 변경 시의 중복 검사는 DB로 한다.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import settings
+from models import user_model
+from utils.bloom_filter import CountingBloomFilter
+from utils.text_utils import normalize_name
+
+
+logger = logging.getLogger(__name__)
+
+
+def _email_key(email: str) -> str:
+    return email.strip().lower()
+
+
+class AvailabilityFilter:
+    """사용 중인 이메일/닉네임(탈퇴 계정 포함)의 블룸 필터"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.warmed = False  # 첫 적재가 끝나기 전에는 항상 DB로 확인
+        self._emails = self._new_filter()
+        self._names = self._new_filter()
+        # 재구축 중에 생긴 가입/변경을 새 필터에도 반영하기 위한 (emails, names)
+        self._building: Optional[tuple] = None
+
+    def _new_filter(self) -> CountingBloomFilter:
+        return CountingBloomFilter(self.capacity, self.error_rate)
+
+    def might_have_email(self, email: str) -> bool:
+        """False면 확실히 사용 가능한 이메일"""
+        return not self.warmed or _email_key(email) in self._emails
+
+    def might_have_name(self, name: str) -> bool:
+        """False면 확실히 사용 가능한 닉네임"""
+        return not self.warmed or normalize_name(name) in self._names
+
+    def add(self, email: Optional[str] = None, name: Optional[str] = None):
+        """가입/변경으로 사용 중이 된 값 추가 (commit 이후에 호출)"""
+        targets = [(self._emails, self._names)]
+        if self._building is not None:
+            targets.append(self._building)
+        for emails, names in targets:
+            if email is not None:
+                emails.add(_email_key(email))
+            if name is not None:
+                names.add(normalize_name(name))
+
+    def remove(self, email: Optional[str] = None, name: Optional[str] = None):
+        """변경/탈퇴로 더 이상 사용하지 않는 값 제거 (commit 이후에 호출)"""
+        # 재구축 중인 필터는 이 값을 이미 읽었는지 알 수 없으므로 건드리지 않는다.
+        # 남아 있어도 '있을 수도 있음'이 될 뿐이라 DB 확인으로 바로잡힌다
+        if email is not None:
+            self._emails.remove(_email_key(email))
+        if name is not None:
+            self._names.remove(normalize_name(name))
+
+    async def rebuild(self, session_factory: async_sessionmaker):
+        """DB의 모든 사용자로 필터를 새로 만들어 교체"""
+        emails, names = self._new_filter(), self._new_filter()
+        self._building = (emails, names)
+        try:
+            async with session_factory() as db:
+                async for batch in user_model.stream_user_keys(db):
+                    for email, name in batch:
+                        emails.add(_email_key(email))
+                        names.add(normalize_name(name))
+            self._emails, self._names = emails, names
+            self.warmed = True
+        finally:
+            self._building = None
+
+    def clear(self):
+        """필터 비우기 (테스트용). 다시 적재하기 전까지는 DB로 확인"""
+        self.warmed = False
+        self._emails = self._new_filter()
+        self._names = self._new_filter()
+
+
+availability_filter = AvailabilityFilter(
+    capacity=settings.AVAILABILITY_BLOOM_CAPACITY,
+    error_rate=settings.AVAILABILITY_BLOOM_ERROR_RATE,
+)
+
+
+async def run_availability_rebuild(session_factory: async_sessionmaker, interval: float):
+    """시작 시 필터를 적재하고 interval초마다 재구축 (앱 lifespan에서 실행)"""
+    while True:
+        try:
+            await availability_filter.rebuild(session_factory)
+        except Exception:
+            logger.exception("중복 확인 필터 재구축 실패")
+        await asyncio.sleep(interval)
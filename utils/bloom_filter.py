@@ -0,0 +1,40 @@
+"""삭제를 지원하는 카운팅 블룸 필터."""
+import hashlib
+import math
+
+
+class CountingBloomFilter:
+    """칸마다 비트 대신 8비트 카운터를 두어 remove가 가능한 블룸 필터.
+
+    `key in filter`가 False면 확실히 없는 키, True면 있을 수도 있는 키(오탐 가능).
+    카운터가 255에 닿으면 더 이상 올리거나 내리지 않는다(그 칸은 항상 '있음').
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._counters = bytearray(self.size)
+
+    def _positions(self, key: str):
+        # 128비트 해시 하나를 둘로 나눠 double hashing으로 hash_count개의 위치를 만든다
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            if self._counters[pos] < 255:
+                self._counters[pos] += 1
+
+    def remove(self, key: str):
+        """add했던 키만 remove할 것 (없는 키를 빼면 다른 키가 '없음'으로 보일 수 있음)"""
+        positions = self._positions(key)
+        if not all(self._counters[pos] for pos in positions):
+            return
+        for pos in positions:
+            if self._counters[pos] < 255:
+                self._counters[pos] -= 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._counters[pos] for pos in self._positions(key))
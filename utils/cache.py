@@ -0,0 +1,99 @@
+"""프로세스 내 TTL + LRU 캐시."""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+# 이름으로 등록된 모든 캐시 (통계 노출 및 일괄 초기화용)
+caches: Dict[str, "TTLCache"] = {}
+
+_MISSING = object()
+
+
+class TTLCache:
+    """크기 제한과 만료 시간을 가진 LRU 캐시.
+
+    이벤트 루프 한 곳에서만 접근하므로 별도의 락은 두지 않는다.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # 용량 초과로 밀려난 항목 수
+        self.expirations = 0  # TTL이 지나 버려진 항목 수
+        caches[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """통계와 LRU 순서에 영향을 주지 않고 조회"""
+        entry = self._data.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return default
+        return entry[0]
+
+    def replace(self, key: Hashable, value: Any):
+        """만료 시각과 LRU 순서는 유지한 채 값만 교체 (없는 키는 무시)"""
+        entry = self._data.get(key)
+        if entry is not None:
+            self._data[key] = (value, entry[1])
+
+    def pop(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def cache_stats() -> dict:
+    """등록된 모든 캐시의 통계"""
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+def clear_caches():
+    """등록된 모든 캐시 비우기 (테스트용)"""
+    for cache in caches.values():
+        cache.clear()
@@ -0,0 +1,23 @@
+"""인기 게시글 점수 주기적 감쇠 작업."""
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import settings
+from models import post_model
+
+
+logger = logging.getLogger(__name__)
+
+
+async def run_hot_score_decay(session_factory: async_sessionmaker, interval: float):
+    """interval초마다 최근 게시글의 hot_score를 경과 시간 기준으로 다시 계산 (앱 lifespan에서 실행)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_factory() as db:
+                await post_model.decay_hot_scores(db, settings.HOT_WINDOW_HOURS)
+                await db.commit()
+        except Exception:
+            logger.exception("hot_score 감쇠 작업 실패")
@@ -0,0 +1,20 @@
+"""인기 게시글(hot) 점수 계산."""
+from config import settings
+
+
+def engagement(view_count=0, like_count=0, comment_count=0):
+    """1 + 가중 참여도. 숫자뿐 아니라 SQL 컬럼 식에도 쓸 수 있음 (post_model의 UPDATE 안 갱신)"""
+    return (
+        1
+        + view_count * settings.HOT_VIEW_WEIGHT
+        + like_count * settings.HOT_LIKE_WEIGHT
+        + comment_count * settings.HOT_COMMENT_WEIGHT
+    )
+
+
+def compute_hot_score(view_count: int, like_count: int, comment_count: int, age_hours: float) -> float:
+    """가중 참여도를 게시 후 경과 시간으로 감쇠시킨 점수 (Hacker News 방식).
+
+    score = (1 + 가중 참여도) / (경과 시간 + 2) ^ gravity
+    """
+    return engagement(view_count, like_count, comment_count) / (max(age_hours, 0.0) + 2) ** settings.HOT_GRAVITY
@@ -0,0 +1,84 @@
+"""조건부 GET (ETag / Last-Modified / 304) 유틸리티."""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from config import settings
+from utils.json_response import json_response
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    """응답을 결정하는 값들로 ETag 생성.
+
+    parts가 본문 전체를 결정하지 않으면(예: 조회수 제외) 바이트가 달라도 같은 값이 나오므로 weak=True로
+    약한(W/) ETag를 만든다. 강한 ETag는 본문 바이트가 바뀔 때마다 반드시 달라져야 한다.
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    body: Any,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    adapter: Optional[TypeAdapter] = None,
+):
+    """검증자 헤더를 붙이고, 클라이언트 캐시가 최신이면 본문 없이 304를 반환.
+
+    last_modified는 본문이 바뀔 때마다 함께 바뀌는 값일 때만 넘긴다. 카운터 갱신은 updated_at을
+    유지하고 목록에서 항목이 빠져도 최댓값은 그대로이므로 updated_at은 쓸 수 없다.
+
+    본문 직렬화 전에 호출되므로 304인 경우 JSON 인코딩 비용이 들지 않는다.
+    adapter가 주어지면 본문을 바로 JSON 바이트로 직렬화한 응답을 반환한다.
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": _cache_control(request),
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+
+    if _is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if adapter is not None:
+        return json_response(adapter, body, headers=headers)
+    response.headers.update(headers)
+    return body
+
+
+def _cache_control(request: Request) -> str:
+    # 로그인 사용자의 응답은 공유 캐시(프록시)에 저장되지 않도록 private
+    if "access_token" in request.cookies:
+        return settings.AUTH_CACHE_CONTROL
+    return settings.ANON_CACHE_CONTROL
+
+
+def _is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match가 있으면 If-Modified-Since는 무시하고, 약한 비교(W/ 무시)로 확인 (RFC 9110)
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = _as_utc(parsedate_to_datetime(if_modified_since))
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DB의 naive datetime은 UTC로 간주
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
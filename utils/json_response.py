@@ -0,0 +1,24 @@
+"""목록 응답용 빠른 JSON 직렬화."""
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response(
+    adapter: TypeAdapter,
+    body: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """TypeAdapter로 본문을 바로 JSON 바이트로 직렬화한 응답.
+
+    FastAPI 기본 경로(jsonable_encoder로 dict 변환 후 json.dumps)를 거치지 않으므로
+    행이 많은 목록 응답의 직렬화 비용이 크게 줄어든다.
+    """
+    return Response(
+        content=adapter.dump_json(body),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -0,0 +1,44 @@
+"""커서(키셋) 기반 페이지네이션 유틸리티."""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sort_key: Any, row_id: int) -> str:
+    """(정렬 키, id) 쌍을 클라이언트에 내려줄 불투명한 커서 문자열로 인코딩"""
+    if isinstance(sort_key, datetime):
+        sort_key = sort_key.isoformat()
+    raw = json.dumps([sort_key, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, key_type: type = datetime) -> Tuple[Any, int]:
+    """커서 문자열을 (정렬 키, id) 쌍으로 복원 (형식이 잘못되면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_key, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if key_type is datetime:
+            sort_key = datetime.fromisoformat(sort_key)
+        else:
+            sort_key = key_type(sort_key)
+        return sort_key, int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다"
+        )
+
+
+def split_page(rows: Sequence, limit: int, sort_key: str = "created_at") -> Tuple[Sequence, Optional[str]]:
+    """limit + 1개까지 조회한 결과를 (한 페이지, 다음 페이지 커서)로 나눔 (마지막 페이지면 커서는 None)
+
+    커서는 페이지 마지막 행의 (sort_key 속성, id)로 만든다.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_key), last.id)
@@ -0,0 +1,36 @@
+"""게시글 응답 캐시와 무효화 규칙."""
+from typing import Dict, Optional
+
+from config import settings
+from utils.cache import TTLCache
+from utils.view_counter import view_counter
+
+
+# 게시글 상세 응답 (post_id -> PostResponse)
+post_detail_cache = TTLCache(
+    "post_detail", maxsize=settings.POST_CACHE_MAXSIZE, ttl=settings.POST_CACHE_TTL
+)
+# 게시글 목록 응답 (조회 조건 -> 응답)
+post_list_cache = TTLCache(
+    "post_list", maxsize=settings.POST_LIST_CACHE_MAXSIZE, ttl=settings.POST_CACHE_TTL
+)
+
+
+def invalidate_post(post_id: Optional[int] = None):
+    """게시글이 바뀌면 해당 상세 응답과 모든 목록 응답을 버림 (commit 이후에 호출)"""
+    if post_id is not None:
+        post_detail_cache.pop(post_id)
+    post_list_cache.clear()
+
+
+def apply_view_deltas(deltas: Dict[int, int]):
+    """조회수 flush 결과를 캐시된 상세 응답에 더함 (조회수 때문에 캐시를 버리지 않도록)"""
+    for post_id, delta in deltas.items():
+        cached = post_detail_cache.peek(post_id)
+        if cached is not None:
+            post_detail_cache.replace(
+                post_id, cached.model_copy(update={"view_count": cached.view_count + delta})
+            )
+
+
+view_counter.add_flush_listener(apply_view_deltas)
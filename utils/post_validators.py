@@ -2,16 +2,32 @@ from fastapi import Depends, HTTPException, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
-from models.post_model import get_post_by_id
+from models.post_model import get_post_by_id, get_post_ref
 
 
 async def get_valid_post(
     post_id: int = Path(..., ge=1, description="게시물 ID"),
     db: AsyncSession = Depends(get_db)
 ):
-    """게시물 존재 및 삭제 여부 확인 (Dependency)"""
+    """게시물 존재 및 삭제 여부 확인 (Dependency)
+
+    작성자까지 eager load 하므로 PostResponse를 만드는 라우트에서만 사용한다.
+    """
     post = await get_post_by_id(db, post_id)
-    
+    return ensure_post_available(post)
+
+
+async def get_valid_post_ref(
+    post_id: int = Path(..., ge=1, description="게시물 ID"),
+    db: AsyncSession = Depends(get_db)
+):
+    """게시물 존재 및 삭제 여부 확인 (Dependency, id/user_id/is_deleted만 조회)"""
+    post = await get_post_ref(db, post_id)
+    return ensure_post_available(post)
+
+
+def ensure_post_available(post):
+    """게시물이 없으면 404, 삭제되었으면 410"""
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
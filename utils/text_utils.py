@@ -0,0 +1,41 @@
+"""텍스트 처리 유틸리티 (검색 색인 등)."""
+import re
+import unicodedata
+from collections import Counter
+
+_WORD_RE = re.compile(r"\w+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """전각/반각, 대소문자 차이를 없앤 비교용 문자열"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def normalize_name(name: str) -> str:
+    """닉네임 중복 비교용 키 (앞뒤 공백 제거 + normalize_text)"""
+    return normalize_text(name.strip())
+
+
+def tokenize_bigrams(text: str) -> Counter:
+    """문자 바이그램 단위로 토큰화 (형태소 분석 없이 한국어 부분 일치 검색용).
+
+    한 글자 단어는 그대로 한 글자 토큰으로 둔다.
+    예) "잡담의 화원" -> {"잡담", "담의", "화원"}
+    """
+    grams: Counter = Counter()
+    for word in _WORD_RE.findall(normalize_text(text)):
+        if len(word) == 1:
+            grams[word] += 1
+            continue
+        for i in range(len(word) - 1):
+            grams[word[i:i + 2]] += 1
+    return grams
+
+
+def make_excerpt(text: str, length: int = 100) -> str:
+    """목록 카드용 미리보기. 공백을 한 칸으로 줄이고 length자를 넘으면 잘라서 "…"을 붙임"""
+    flat = _SPACE_RE.sub(" ", text).strip()
+    if len(flat) <= length:
+        return flat
+    return flat[:length].rstrip() + "…"
@@ -0,0 +1,14 @@
+"""사용자 응답 캐시와 무효화 규칙."""
+from config import settings
+from utils.cache import TTLCache
+
+
+# 사용자 목록 첫 페이지 응답 ((이름 접두어, limit) -> UserListResponse)
+user_list_cache = TTLCache(
+    "user_list", maxsize=settings.USER_LIST_CACHE_MAXSIZE, ttl=settings.USER_LIST_CACHE_TTL
+)
+
+
+def invalidate_user_list():
+    """가입/정보 수정/탈퇴로 목록이 바뀌면 캐시된 목록을 버림 (commit 이후에 호출)"""
+    user_list_cache.clear()
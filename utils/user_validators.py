@@ -1,16 +1,24 @@
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import settings
 from database import get_db
 from models.user_model import get_user_by_id
 from utils.auth import get_current_user_id
+from utils.auth_cache import active_user_cache
 
 
 async def get_active_user(
     db: AsyncSession = Depends(get_db),
     user_id: int = Depends(get_current_user_id)
 ):
-    """활성화된 사용자 확인 (JWT 검증 + 계정 상태 확인)"""
+    """활성화된 사용자 확인 (JWT 검증 + 계정 상태 확인)
+
+    최근에 활성 상태를 확인한 사용자는 DB 조회 없이 통과시킨다 (탈퇴 시 무효화).
+    """
+    if active_user_cache.get(user_id):
+        return user_id
+
     user = await get_user_by_id(db, user_id)
     
     if not user:
@@ -25,4 +33,17 @@ async def get_active_user(
             detail="탈퇴한 계정입니다"
         )
     
-    return user.id
\ No newline at end of file
+    # identity map은 약한 참조이므로, 같은 요청에서 작성자 정보로 재사용할 수 있게 세션에 고정
+    db.info.setdefault("active_users", {})[user.id] = user
+    active_user_cache.set(user.id, True)
+    return user.id
+
+
+async def get_admin_user(user_id: int = Depends(get_active_user)):
+    """관리자 확인 (ADMIN_USER_IDS에 등록된 사용자만 허용)"""
+    if user_id not in settings.ADMIN_USER_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다"
+        )
+    return user_id
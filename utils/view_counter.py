@@ -0,0 +1,144 @@
+"""게시글 조회수 write-behind 버퍼.
+
+조회 요청마다 Posts 행을 UPDATE 하면 인기 게시글에 row lock이 몰리므로,
+증가분을 프로세스 메모리에 모았다가 주기적으로 한 번에 반영한다.
+"""
+import asyncio
+import logging
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import settings
+from models import post_model
+
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """게시글별 조회수 증가분을 모아 `view_count = view_count + n`으로 일괄 반영"""
+
+    def __init__(self, flush_interval: float, max_pending: int):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending  # 이만큼 쌓이면 주기를 기다리지 않고 바로 flush
+        self._pending: Counter = Counter()
+        self._pending_total = 0
+        self._in_flight: Counter = Counter()  # flush 중이라 아직 commit 되지 않은 증가분
+        # flush 시작/종료마다 1씩 증가 (홀수면 flush 중). DB에서 읽은 조회수를 캐시해도 되는지 판단용
+        self._generation = 0
+        self._listeners: List[Callable[[Dict[int, int]], None]] = []
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def record(self, post_id: int, count: int = 1):
+        """조회 1회 기록 (DB 접근 없음)"""
+        self._pending[post_id] += count
+        self._pending_total += count
+        if self._wakeup is not None and self._pending_total >= self.max_pending:
+            self._wakeup.set()
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수 증가분"""
+        return self._pending[post_id] + self._in_flight[post_id]
+
+    def add_flush_listener(self, listener: Callable[[Dict[int, int]], None]):
+        """flush가 commit된 뒤 {post_id: 증가분}을 받아 호출될 콜백 등록"""
+        self._listeners.append(listener)
+
+    def clear(self):
+        """버퍼 비우기 (테스트용)"""
+        self._pending.clear()
+        self._pending_total = 0
+        self._in_flight.clear()
+
+    async def flush(self) -> int:
+        """쌓인 증가분을 DB에 반영하고 반영한 게시글 수를 반환"""
+        if not self._pending or self._session_factory is None:
+            return 0
+
+        deltas = dict(self._pending)
+        self._pending.clear()
+        self._pending_total = 0
+        self._in_flight.update(deltas)
+        self._generation += 1
+        committed = False
+        try:
+            async with self._session_factory() as db:
+                await post_model.add_view_counts(db, deltas)
+                await db.commit()
+                committed = True
+                # commit 직후 await 없이 in-flight 정리와 리스너 반영을 한 번에 처리해
+                # 그 사이에 읽힌 값이 증가분을 두 번 세지 않도록 함
+                self._finish_flush(deltas, notify=True)
+        except Exception:
+            if committed:
+                logger.exception("조회수 flush 후 세션 정리 실패")
+                return len(deltas)
+            logger.exception("조회수 flush 실패, 다음 주기에 재시도")
+            self._finish_flush(deltas, notify=False)
+            # 실패한 증가분은 버퍼로 되돌려 다음 주기에 다시 반영
+            self._pending.update(deltas)
+            self._pending_total += sum(deltas.values())
+            return 0
+        return len(deltas)
+
+    def _finish_flush(self, deltas: Dict[int, int], notify: bool):
+        self._in_flight.subtract(deltas)
+        self._in_flight += Counter()  # 0 이하 항목 정리
+        self._generation += 1
+        if not notify:
+            return
+        for listener in self._listeners:
+            try:
+                listener(deltas)
+            except Exception:
+                logger.exception("조회수 flush 리스너 실행 실패")
+
+    def read_token(self) -> int:
+        """DB에서 조회수를 읽기 직전에 받아 두는 값 (is_consistent와 함께 사용)"""
+        return self._generation
+
+    def is_consistent(self, token: int) -> bool:
+        """token을 받은 뒤 flush가 진행되지 않았으면 True.
+
+        flush 도중이나 전후에 걸쳐 읽은 조회수는 commit된 증가분 포함 여부를 알 수 없으므로,
+        False면 그 값을 캐시하지 말아야 한다 (리스너가 같은 증가분을 다시 더할 수 있음).
+        """
+        return token % 2 == 0 and token == self._generation
+
+    def start(self, session_factory: async_sessionmaker):
+        """주기적 flush 태스크 시작 (앱 lifespan 시작 시 호출)"""
+        self._session_factory = session_factory
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """주기적 flush 태스크를 멈추고 남은 증가분을 모두 반영 (앱 종료 시 호출)"""
+        if self._task is not None:
+            # flush 도중 취소되어 증가분을 잃지 않도록, 취소 대신 종료 신호를 보내고 기다림
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        self._wakeup = None
+        await self.flush()
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+
+view_counter = ViewCountBuffer(
+    flush_interval=settings.VIEW_COUNT_FLUSH_INTERVAL,
+    max_pending=settings.VIEW_COUNT_MAX_PENDING,
+)